@@ -45,14 +45,17 @@ _SPECIAL_ATTRS = {
     "_agg",
     "_ss",
     "agg",
+    "algorithms",
     "base",
     "binary",
+    "dask",
     "descriptor",
     "dtypes",
     "exceptions",
     "expr",
     "ffi",
     "formatting",
+    "hooks",
     "infix",
     "io",
     "lib",
@@ -87,23 +90,34 @@ def __dir__():
     return list(globals().keys() | _SPECIAL_ATTRS)
 
 
-def init(backend="suitesparse", blocking=False):
+def init(backend="suitesparse", blocking=False, *, memory_manager="c"):
     """Initialize the chosen backend.
 
     Parameters
     ----------
-    backend : str, one of {"suitesparse"}
+    backend : str, one of {"suitesparse", "python"}
+        "suitesparse" uses SuiteSparse:GraphBLAS.  "python" uses the pure-Python
+        backend in ``grblas.backends.python`` (built on numba and scipy), which is
+        useful for comparing against SuiteSparse or where it isn't available.  The
+        python backend doesn't support the SuiteSparse extensions in ``.ss``.
     blocking : bool
         Whether to call GrB_init with GrB_BLOCKING or GrB_NONBLOCKING
+    memory_manager : {"c", "numpy"} or grblas.memory.MemoryManager, default "c"
+        How GraphBLAS allocates memory.  "c" uses malloc and free from the C library,
+        and "numpy" uses the numpy allocator so memory can be shared with numpy arrays.
+        A ``MemoryManager`` tracks allocation statistics and can cap the total memory
+        used by GraphBLAS.
 
     """
-    _init(backend, blocking)
+    _init(backend, blocking, memory_manager=memory_manager)
 
 
-def _init(backend_arg, blocking, automatic=False):
+def _init(backend_arg, blocking, automatic=False, *, memory_manager="c"):
     global _init_params, backend, lib, ffi
 
-    passed_params = dict(backend=backend_arg, blocking=blocking, automatic=automatic)
+    passed_params = dict(
+        backend=backend_arg, blocking=blocking, automatic=automatic, memory_manager=memory_manager
+    )
     if _init_params is not None:
         if blocking is None:
             passed_params["blocking"] = _init_params["blocking"]
@@ -124,6 +138,10 @@ def _init(backend_arg, blocking, automatic=False):
         from suitesparse_graphblas import ffi, initialize, is_initialized, lib
 
         if is_initialized():
+            if memory_manager not in {"c", "numpy"}:
+                raise RuntimeError(
+                    "GraphBLAS has already been initialized, so memory_manager can't be used"
+                )
             mode = ffi.new("GrB_Mode*")
             assert lib.GxB_Global_Option_get(lib.GxB_MODE, mode) == 0
             is_blocking = mode[0] == lib.GrB_BLOCKING
@@ -137,13 +155,46 @@ def _init(backend_arg, blocking, automatic=False):
             if blocking is None:
                 blocking = False
                 passed_params["blocking"] = blocking
-            initialize(blocking=blocking, memory_manager="c")
+            if memory_manager in {"c", "numpy"}:
+                initialize(blocking=blocking, memory_manager=memory_manager)
+            else:
+                from .memory import MemoryManager
+
+                if not isinstance(memory_manager, MemoryManager):
+                    raise TypeError(
+                        'memory_manager must be "c", "numpy", or a grblas.memory.MemoryManager; '
+                        f"got {memory_manager!r}"
+                    )
+                memory_manager._initialize(ffi, lib, blocking)
+    elif backend == "python":
+        from .backends.python import ffi, initialize, is_initialized, lib
+
+        if memory_manager != "c":
+            raise ValueError('The python backend only supports memory_manager="c"')
+        if blocking is None:
+            blocking = False
+            passed_params["blocking"] = blocking
+        if not is_initialized():
+            initialize(blocking=blocking)
     else:
-        raise ValueError(f'Bad backend name.  Must be "suitesparse".  Got: {backend}')
+        raise ValueError(f'Bad backend name.  Must be "suitesparse" or "python".  Got: {backend}')
     _init_params = passed_params
 
 
-_NEEDS_OPERATOR = {"_agg", "agg", "base", "io", "matrix", "scalar", "vector", "recorder", "ss"}
+_NEEDS_OPERATOR = {
+    "_agg",
+    "agg",
+    "algorithms",
+    "base",
+    "dask",
+    "hooks",
+    "io",
+    "matrix",
+    "scalar",
+    "vector",
+    "recorder",
+    "ss",
+}
 
 
 def _load(name):
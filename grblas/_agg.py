@@ -5,8 +5,7 @@ import numpy as np
 from . import agg, binary, monoid, semiring, unary
 from .dtypes import lookup_dtype, unify
 from .matrix import Matrix
-from .monoid import any as _any
-from .operator import _normalize_type
+from .operator import _normalize_type, op_from_string, semiring_from_string
 from .scalar import Scalar
 from .ss import diag
 from .vector import Vector
@@ -30,6 +29,10 @@ def _get_types(ops, initdtype):
     return prev
 
 
+def _any():
+    return monoid.any
+
+
 class Aggregator:
     opclass = "Aggregator"
 
@@ -58,16 +61,8 @@ class Aggregator:
         self._finalize = finalize
         self._composite = composite
         self._custom = custom
-        if types is None:
-            if monoid is not None:
-                types = [monoid]
-            elif semiring is not None:
-                types = [semiring, semiring2]
-                if finalize is not None:
-                    types.append(finalize)
-                initval = self._initval
-            else:  # pragma: no cover
-                raise TypeError("types must be provided for composite and custom aggregators")
+        if types is None and monoid is None and semiring is None:  # pragma: no cover
+            raise TypeError("types must be provided for composite and custom aggregators")
         self._types_orig = types
         self._types = None
         self._typed_ops = {}
@@ -75,13 +70,33 @@ class Aggregator:
     @property
     def types(self):
         if self._types is None:
-            if type(self._semiring) is str:
-                self._semiring = semiring.from_string(self._semiring)
-                if type(self._types_orig[0]) is str:  # pragma: no branch
-                    self._types_orig[0] = semiring.from_string(self._types_orig[0])
-            self._types = _get_types(
-                self._types_orig, None if self._initval_orig is None else self._initdtype
-            )
+            # Ops may be given by name, so SuiteSparse extensions are only looked up when used
+            try:
+                if type(self._monoid) is str:
+                    self._monoid = monoid.from_string(self._monoid)
+                if type(self._semiring) is str:
+                    self._semiring = semiring.from_string(self._semiring)
+                if type(self._semiring2) is str:
+                    self._semiring2 = semiring.from_string(self._semiring2)
+                if type(self._finalize) is str:
+                    self._finalize = unary.from_string(self._finalize)
+                if self._types_orig is not None:
+                    types = [op_from_string(x) if type(x) is str else x for x in self._types_orig]
+            except ValueError as exc:
+                from . import backend
+
+                raise NotImplementedError(
+                    f"agg.{self.name} uses an operator that the {backend!r} backend doesn't have"
+                ) from exc
+            if self._types_orig is not None:
+                pass
+            elif self._monoid is not None:
+                types = [self._monoid]
+            else:
+                types = [self._semiring, self._semiring2]
+                if self._finalize is not None:
+                    types.append(self._finalize)
+            self._types = _get_types(types, None if self._initval_orig is None else self._initdtype)
         return self._types
 
     def __getitem__(self, dtype):
@@ -149,7 +164,7 @@ class TypedAggregator:
                 "GrB_Matrix_reduce"
             ):
                 final = final_expr.new()
-                expr = final.reduce(_any)
+                expr = final.reduce(_any())
                 if final._nvals == 0:
                     expr = Scalar.new(expr.dtype)
                 updater << expr
@@ -208,7 +223,7 @@ class TypedAggregator:
                     step1 = finalize(step1).new(finalize.return_type)
             if in_composite:
                 return step1
-            expr = step1.reduce(_any)
+            expr = step1.reduce(_any())
             if step1._nvals == 0:
                 expr = Scalar.new(expr.dtype)
             updater << expr
@@ -238,7 +253,7 @@ class TypedAggregator:
                     step2 = finalize(step2).new(finalize.return_type)
             if in_composite:
                 return step2
-            expr = step2.reduce(_any)
+            expr = step2.reduce(_any())
             if step2._nvals == 0:
                 expr = Scalar.new(expr.dtype)
             updater << expr
@@ -253,53 +268,49 @@ agg.all = Aggregator("all", monoid=monoid.land)
 agg.any = Aggregator("any", monoid=monoid.lor)
 agg.min = Aggregator("min", monoid=monoid.min)
 agg.max = Aggregator("max", monoid=monoid.max)
-agg.any_value = Aggregator("any_value", monoid=monoid.any)
-agg.bitwise_all = Aggregator("bitwise_all", monoid=monoid.band)
-agg.bitwise_any = Aggregator("bitwise_any", monoid=monoid.bor)
+agg.any_value = Aggregator("any_value", monoid="any")
+agg.bitwise_all = Aggregator("bitwise_all", monoid="band")
+agg.bitwise_any = Aggregator("bitwise_any", monoid="bor")
 # Other monoids: bxnor bxor eq lxnor lxor
 
 # Semiring-only
-agg.count = Aggregator("count", semiring=semiring.plus_pair, semiring2=semiring.plus_first)
-agg.count_nonzero = Aggregator(
-    "count_nonzero", semiring=semiring.plus_isne, semiring2=semiring.plus_first
-)
-agg.count_zero = Aggregator(
-    "count_zero", semiring=semiring.plus_iseq, semiring2=semiring.plus_first
-)
+agg.count = Aggregator("count", semiring="plus_pair", semiring2=semiring.plus_first)
+agg.count_nonzero = Aggregator("count_nonzero", semiring="plus_isne", semiring2=semiring.plus_first)
+agg.count_zero = Aggregator("count_zero", semiring="plus_iseq", semiring2=semiring.plus_first)
 agg.sum_of_squares = Aggregator(
-    "sum_of_squares", initval=2, semiring=semiring.plus_pow, semiring2=semiring.plus_first
+    "sum_of_squares", initval=2, semiring="plus_pow", semiring2=semiring.plus_first
 )
 agg.sum_of_inverses = Aggregator(
     "sum_of_inverses",
     initval=-1.0,
-    semiring=semiring.plus_pow,
+    semiring="plus_pow",
     semiring2=semiring.plus_first,
 )
-agg.exists = Aggregator("exists", semiring=semiring.any_pair, semiring2=semiring.any_pair)
+agg.exists = Aggregator("exists", semiring="any_pair", semiring2="any_pair")
 
 # Semiring and finalize
 agg.hypot = Aggregator(
     "hypot",
     initval=2,
-    semiring=semiring.plus_pow,
+    semiring="plus_pow",
     semiring2=semiring.plus_first,
-    finalize=unary.sqrt,
+    finalize="sqrt",
 )
 agg.logaddexp = Aggregator(
     "logaddexp",
     initval=np.e,
-    semiring=semiring.plus_pow,
+    semiring="plus_pow",
     switch=True,
     semiring2=semiring.plus_first,
-    finalize=unary.log,
+    finalize="log",
 )
 agg.logaddexp2 = Aggregator(
     "logaddexp2",
     initval=2,
-    semiring=semiring.plus_pow,
+    semiring="plus_pow",
     switch=True,
     semiring2=semiring.plus_first,
-    finalize=unary.log2,
+    finalize="log2",
 )
 # Alternatives
 # logaddexp = Aggregator('logaddexp', monoid=semiring.numpy.logaddexp)
@@ -392,13 +403,13 @@ agg.stdp = Aggregator(
     "stdp",
     composite=[agg.count, agg.sum, agg.sum_of_squares],
     finalize=_stdp_finalize,
-    types=[binary.truediv, unary.sqrt],
+    types=[binary.truediv, "sqrt"],
 )
 agg.stds = Aggregator(
     "stds",
     composite=[agg.count, agg.sum, agg.sum_of_squares],
     finalize=_stds_finalize,
-    types=[binary.truediv, unary.sqrt],
+    types=[binary.truediv, "sqrt"],
 )
 agg.geometric_mean = Aggregator(
     "geometric_mean",
@@ -416,7 +427,7 @@ agg.root_mean_square = Aggregator(
     "root_mean_square",
     composite=[agg.count, agg.sum_of_squares],
     finalize=_root_mean_square_finalize,
-    types=[binary.truediv, unary.sqrt],
+    types=[binary.truediv, "sqrt"],
 )
 
 
@@ -471,7 +482,7 @@ def _argminmaxij(
         step2 = col_semiring(masked @ init).new()
         if in_composite:
             return step2
-        expr = step2.reduce(_any)
+        expr = step2.reduce(_any())
         if step2._nvals == 0:
             expr = Scalar.new(expr.dtype)
         updater << expr
@@ -520,16 +531,17 @@ def _argminmax(agg, updater, expr, *, in_composite, monoid):
 agg.argmin = Aggregator(
     "argmin",
     custom=partial(_argminmax, monoid=monoid.min),
-    types=[semiring.min_firsti],
+    types=["min_firsti"],
 )
 agg.argmax = Aggregator(
     "argmax",
     custom=partial(_argminmax, monoid=monoid.max),
-    types=[semiring.min_firsti],
+    types=["min_firsti"],
 )
 
 
 def _first_last(agg, updater, expr, *, in_composite, semiring):
+    semiring = semiring_from_string(semiring)
     if expr.cfunc_name == "GrB_Matrix_reduce_Aggregator":
         A = expr.args[0]
         if expr.method_name == "reduce_columnwise":
@@ -582,17 +594,18 @@ def _first_last(agg, updater, expr, *, in_composite, semiring):
 
 agg.first = Aggregator(
     "first",
-    custom=partial(_first_last, semiring=semiring.min_secondi),
+    custom=partial(_first_last, semiring="min_secondi"),
     types=[binary.first],
 )
 agg.last = Aggregator(
     "last",
-    custom=partial(_first_last, semiring=semiring.max_secondi),
+    custom=partial(_first_last, semiring="max_secondi"),
     types=[binary.second],
 )
 
 
 def _first_last_index(agg, updater, expr, *, in_composite, semiring):
+    semiring = semiring_from_string(semiring)
     if expr.cfunc_name == "GrB_Matrix_reduce_Aggregator":
         A = expr.args[0]
         if expr.method_name == "reduce_columnwise":
@@ -619,11 +632,11 @@ def _first_last_index(agg, updater, expr, *, in_composite, semiring):
 
 agg.first_index = Aggregator(
     "first_index",
-    custom=partial(_first_last_index, semiring=semiring.min_secondi),
-    types=[semiring.min_secondi],
+    custom=partial(_first_last_index, semiring="min_secondi"),
+    types=["min_secondi"],
 )
 agg.last_index = Aggregator(
     "last_index",
-    custom=partial(_first_last_index, semiring=semiring.max_secondi),
-    types=[semiring.min_secondi],
+    custom=partial(_first_last_index, semiring="max_secondi"),
+    types=["min_secondi"],
 )
@@ -53,6 +53,7 @@ vector = {
     "inner",
     "outer",
     "reduce",
+    "to_pandas",
     "vxm",
 }
 matrix = {
@@ -361,6 +362,10 @@ def ss(self):
     return self._get_value("ss")
 
 
+def to_pandas(self):
+    return self._get_value("to_pandas")
+
+
 def to_pygraphblas(self):
     return self._get_value("to_pygraphblas")
 
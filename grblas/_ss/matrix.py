@@ -4,14 +4,14 @@ from numbers import Integral, Number
 import numba
 import numpy as np
 from numba import njit
-from suitesparse_graphblas.utils import claim_buffer, claim_buffer_2d, unclaim_buffer
 
 import grblas as gb
 
-from .. import ffi, lib, monoid
-from ..base import call, record_raw
+from .. import binary, ffi, lib, monoid
+from ..base import _expect_op, call, record_raw
 from ..dtypes import _INDEX, INT64, lookup_dtype
 from ..exceptions import check_status, check_status_carg
+from ..operator import get_typed_op
 from ..scalar import Scalar, _CScalar
 from ..utils import (
     _CArray,
@@ -24,7 +24,7 @@ from ..utils import (
 )
 from .prefix_scan import prefix_scan
 from .scalar import gxb_scalar
-from .utils import get_order
+from .utils import claim_buffer, claim_buffer_2d, get_order, unclaim_buffer
 
 ffi_new = ffi.new
 
@@ -261,6 +261,31 @@ def normalize_chunks(chunks, shape):
     return chunksizes
 
 
+def get_reduce_monoid(obj, op, within):
+    """Get the typed Monoid used to reduce the tiles of a tiled or chunked object"""
+    op = get_typed_op(op, obj.dtype, kind="binary")
+    if op.opclass == "BinaryOp" and op.monoid is not None:
+        op = op.monoid
+    else:
+        _expect_op(obj, op, "Monoid", within=within, argname="op")
+    return op
+
+
+def reduce_tiles_scalar(tiles, op, *, name=None):
+    """Reduce Matrix tiles or Vector chunks to a Scalar with Monoid `op`, one at a time"""
+    values = []
+    for tile in tiles:
+        if tile._nvals > 0:
+            if type(tile) is gb.Vector:
+                values.append(tile.reduce(op).new().value)
+            else:
+                values.append(tile.reduce_scalar(op).new().value)
+    if not values:
+        return Scalar.new(op.return_type, name=name)
+    partials = gb.Vector.from_values(np.arange(len(values)), values, op.return_type)
+    return partials.reduce(op).new(name=name)
+
+
 def _concat_mn(tiles):
     """Argument checking for `Matrix.ss.concat` and returns number of tiles in each dimension"""
     from ..matrix import Matrix, TransposedMatrix
@@ -3417,6 +3442,339 @@ class ss:
     def head(self, n=10, dtype=None, *, sort=False):
         return head(self._parent, n, dtype, sort=sort)
 
+    def get_many(self, rows, cols, default=None):
+        """Get the values at many (row, col) coordinates at once.
+
+        This is much faster than getting elements one at a time with ``A[i, j]``.
+        The Matrix is unpacked in its current format, the coordinates are looked up
+        directly in the sorted buffers (using binary search for sparse formats), and
+        the Matrix is packed back.  No data is copied.
+
+        Parameters
+        ----------
+        rows : list or np.ndarray of ints
+            Row indices.  Negative indices count from the end.
+        cols : list or np.ndarray of ints
+            Column indices, the same length as `rows`.
+        default : scalar, optional
+            Value to use for coordinates with no element.  The default is 0.
+
+        Returns
+        -------
+        values : np.ndarray
+            Values with the same dtype as the Matrix.
+        found : np.ndarray of bool
+            True where an element is present.
+
+        This changes ``matrix.gb_obj``, so care should be taken when using multiple threads.
+        """
+        parent = self._parent
+        rows = _normalize_indices(rows, parent._nrows, "rows")
+        cols = _normalize_indices(cols, parent._ncols, "cols")
+        if rows.size != cols.size:
+            raise ValueError(
+                f"rows and cols must be the same size; got {rows.size} and {cols.size}"
+            )
+        np_type = parent.dtype.np_type
+        if default is None:
+            values = np.zeros(rows.size, dtype=np_type)
+        else:
+            values = np.full(rows.size, default, dtype=np_type)
+        if rows.size == 0 or parent._nvals == 0:
+            return values, np.zeros(rows.size, dtype=bool)
+        is_iso = self.is_iso
+        d = self.unpack(raw=True, sort=True)
+        try:
+            fmt = d["format"]
+            if fmt.endswith("r"):
+                major, minor, nminor = rows, cols, parent._ncols
+            else:
+                major, minor, nminor = cols, rows, parent._nrows
+            if fmt in {"csr", "csc"}:
+                indices = d["col_indices"] if fmt == "csr" else d["row_indices"]
+                positions = _get_many_sparse(d["indptr"], indices, major, minor)
+            elif fmt in {"hypercsr", "hypercsc"}:
+                if fmt == "hypercsr":
+                    hyperlist, indices = d["rows"], d["col_indices"]
+                else:
+                    hyperlist, indices = d["cols"], d["row_indices"]
+                positions = _get_many_hypersparse(
+                    d["indptr"], hyperlist, indices, d["nvec"], major, minor
+                )
+            else:
+                positions = (major * np.uint64(nminor) + minor).astype(np.int64)
+                if fmt.startswith("bitmap"):
+                    positions[~d["bitmap"][positions]] = -1
+            found = positions >= 0
+            if is_iso:
+                values[found] = d["values"][0]
+            else:
+                values[found] = d["values"][positions[found]]
+        finally:
+            self.pack_any(take_ownership=True, **d)
+        return values, found
+
+    def scatter(self, rows, cols, values, accum=None):
+        """Update many elements in-place as if by ``A[i, j] = v`` for each (i, j, v).
+
+        The new values are built into a temporary Matrix, which is then assigned
+        using its own structure as the mask (a ``GrB_Matrix_subassign``).  Only the
+        given elements are touched, so this is fast even if the batch is much smaller
+        than the Matrix.  In non-blocking mode, new elements are kept as pending tuples
+        until they are needed.
+
+        Parameters
+        ----------
+        rows : list or np.ndarray of ints
+            Row indices.
+        cols : list or np.ndarray of ints
+            Column indices, the same length as `rows`.
+        values : list or np.ndarray or scalar
+            New values, the same length as `rows`, or a scalar to use for all elements.
+        accum : BinaryOp or Monoid, optional
+            Combine the new values with existing values using `accum`, like
+            ``A[i, j] += v``.  If not given, existing values are replaced.
+            Duplicate indices in the batch are also combined with `accum`, or the
+            last value is used if `accum` is not given.
+        """
+        parent = self._parent
+        values, _ = values_to_numpy_buffer(values, parent.dtype)
+        if values.ndim == 0 and accum is not None:
+            # Apply accum once for each duplicate, so the scalar must be repeated
+            values = np.full(len(rows), values, dtype=values.dtype)
+        temp = gb.Matrix.new(parent.dtype, parent._nrows, parent._ncols, name="M_scatter")
+        if values.ndim == 0:
+            temp.ss.build_scalar(rows, cols, values.tolist())
+        else:
+            temp.build(rows, cols, values, dup_op=binary.second if accum is None else accum)
+        if temp._nvals == 0:
+            return
+        parent[:, :](temp.S, accum=accum) << temp
+
+    def row(self, index, *, name=None):
+        """Extract a row as a new Vector; like ``A[index, :].new()``, but faster.
+
+        If the Matrix is stored by row, the row is copied directly from the unpacked
+        internal buffers.  Otherwise, this falls back to ``A[index, :].new()``.
+
+        This changes ``matrix.gb_obj``, so care should be taken when using multiple threads.
+
+        See Also
+        --------
+        Matrix.ss.rows
+        Matrix.ss.col
+        """
+        return self._extract_vector(index, "r", name)
+
+    def rows(self, indices, *, name=None):
+        """Extract rows as a new Matrix; like ``A[indices, :].new()``, but faster.
+
+        If the Matrix is stored by row, the rows are copied directly from the unpacked
+        internal buffers.  Otherwise, this falls back to ``A[indices, :].new()``.
+
+        This changes ``matrix.gb_obj``, so care should be taken when using multiple threads.
+
+        See Also
+        --------
+        Matrix.ss.row
+        Matrix.ss.cols
+        """
+        return self._extract_matrix(indices, "r", name)
+
+    def col(self, index, *, name=None):
+        """Extract a column as a new Vector; like ``A[:, index].new()``, but faster.
+
+        If the Matrix is stored by column, the column is copied directly from the
+        unpacked internal buffers.  Otherwise, this falls back to ``A[:, index].new()``.
+
+        This changes ``matrix.gb_obj``, so care should be taken when using multiple threads.
+
+        See Also
+        --------
+        Matrix.ss.cols
+        Matrix.ss.row
+        """
+        return self._extract_vector(index, "c", name)
+
+    def cols(self, indices, *, name=None):
+        """Extract columns as a new Matrix; like ``A[:, indices].new()``, but faster.
+
+        If the Matrix is stored by column, the columns are copied directly from the
+        unpacked internal buffers.  Otherwise, this falls back to ``A[:, indices].new()``.
+
+        This changes ``matrix.gb_obj``, so care should be taken when using multiple threads.
+
+        See Also
+        --------
+        Matrix.ss.col
+        Matrix.ss.rows
+        """
+        return self._extract_matrix(indices, "c", name)
+
+    def _extract_vector(self, index, orientation, name):
+        parent = self._parent
+        if not isinstance(index, Integral):
+            raise TypeError(f"index must be an integer; got {type(index)}")
+        size = parent._nrows if orientation == "r" else parent._ncols
+        major = _normalize_indices([index], size, "index")
+        info = self._extract_majors(major, orientation)
+        if info is None:
+            if orientation == "r":
+                return parent[int(major[0]), :].new(name=name)
+            return parent[:, int(major[0])].new(name=name)
+        kind = info["kind"]
+        if kind == "sparse":
+            return gb.Vector.ss.import_sparse(
+                size=info["nminor"],
+                indices=info["indices"],
+                values=info["values"],
+                is_iso=info["is_iso"],
+                sorted_index=info["sorted"],
+                take_ownership=True,
+                dtype=parent.dtype,
+                name=name,
+            )
+        elif kind == "bitmap":
+            return gb.Vector.ss.import_bitmap(
+                bitmap=info["bitmap"][0],
+                values=info["values"] if info["is_iso"] else info["values"][0],
+                size=info["nminor"],
+                is_iso=info["is_iso"],
+                take_ownership=True,
+                dtype=parent.dtype,
+                name=name,
+            )
+        else:
+            return gb.Vector.ss.import_full(
+                values=info["values"] if info["is_iso"] else info["values"][0],
+                size=info["nminor"],
+                is_iso=info["is_iso"],
+                take_ownership=True,
+                dtype=parent.dtype,
+                name=name,
+            )
+
+    def _extract_matrix(self, indices, orientation, name):
+        parent = self._parent
+        size = parent._nrows if orientation == "r" else parent._ncols
+        major = _normalize_indices(indices, size, "indices")
+        info = self._extract_majors(major, orientation)
+        if info is None:
+            if orientation == "r":
+                return parent[major, :].new(name=name)
+            return parent[:, major].new(name=name)
+        kind = info["kind"]
+        nmajor = major.size
+        nminor = info["nminor"]
+        if orientation == "r":
+            nrows, ncols = nmajor, nminor
+        else:
+            nrows, ncols = nminor, nmajor
+        if kind == "sparse":
+            if orientation == "r":
+                return gb.Matrix.ss.import_csr(
+                    nrows=nrows,
+                    ncols=ncols,
+                    indptr=info["indptr"],
+                    col_indices=info["indices"],
+                    values=info["values"],
+                    is_iso=info["is_iso"],
+                    sorted_cols=info["sorted"],
+                    take_ownership=True,
+                    dtype=parent.dtype,
+                    name=name,
+                )
+            return gb.Matrix.ss.import_csc(
+                nrows=nrows,
+                ncols=ncols,
+                indptr=info["indptr"],
+                row_indices=info["indices"],
+                values=info["values"],
+                is_iso=info["is_iso"],
+                sorted_rows=info["sorted"],
+                take_ownership=True,
+                dtype=parent.dtype,
+                name=name,
+            )
+        values = info["values"]
+        if orientation == "c" and not info["is_iso"]:
+            # Stored by column, so the transpose is F-contiguous with shape (nrows, ncols)
+            values = values.T
+        if kind == "bitmap":
+            bitmap = info["bitmap"] if orientation == "r" else info["bitmap"].T
+            method = "import_bitmapr" if orientation == "r" else "import_bitmapc"
+            return getattr(gb.Matrix.ss, method)(
+                bitmap=bitmap,
+                values=values,
+                nrows=nrows,
+                ncols=ncols,
+                is_iso=info["is_iso"],
+                take_ownership=True,
+                dtype=parent.dtype,
+                name=name,
+            )
+        method = "import_fullr" if orientation == "r" else "import_fullc"
+        return getattr(gb.Matrix.ss, method)(
+            values=values,
+            nrows=nrows,
+            ncols=ncols,
+            is_iso=info["is_iso"],
+            take_ownership=True,
+            dtype=parent.dtype,
+            name=name,
+        )
+
+    def _extract_majors(self, major, orientation):
+        """Copy the rows (orientation "r") or columns ("c") given by `major`.
+
+        This unpacks the Matrix in its current format and packs it back afterwards.
+        Returns None if the Matrix isn't stored with the given orientation.
+        """
+        parent = self._parent
+        if self.format[-1] != orientation:
+            return None
+        if orientation == "r":
+            nmajor, nminor = parent._nrows, parent._ncols
+            indices_key, sorted_key, hyperlist_key = "col_indices", "sorted_cols", "rows"
+        else:
+            nmajor, nminor = parent._ncols, parent._nrows
+            indices_key, sorted_key, hyperlist_key = "row_indices", "sorted_rows", "cols"
+        is_iso = self.is_iso
+        rv = {"nminor": nminor, "is_iso": is_iso}
+        d = self.unpack(raw=True)
+        try:
+            fmt = d["format"]
+            if fmt.startswith("bitmap") or fmt.startswith("full"):
+                n = nmajor * nminor
+                if fmt.startswith("bitmap"):
+                    rv["kind"] = "bitmap"
+                    rv["bitmap"] = d["bitmap"][:n].reshape(nmajor, nminor)[major]
+                else:
+                    rv["kind"] = "full"
+                if is_iso:
+                    rv["values"] = d["values"][:1].copy()
+                else:
+                    rv["values"] = d["values"][:n].reshape(nmajor, nminor)[major]
+            else:
+                indptr = d["indptr"]
+                if fmt.startswith("hyper"):
+                    starts, ends = _hypersparse_ranges(indptr, d[hyperlist_key], d["nvec"], major)
+                else:
+                    starts = indptr[major].astype(np.int64)
+                    ends = indptr[major + np.uint64(1)].astype(np.int64)
+                new_indptr, positions = _concat_ranges(starts, ends)
+                rv["kind"] = "sparse"
+                rv["indptr"] = new_indptr
+                rv["indices"] = d[indices_key][positions]
+                rv["sorted"] = d[sorted_key]
+                if is_iso:
+                    rv["values"] = d["values"][:1].copy()
+                else:
+                    rv["values"] = d["values"][positions]
+        finally:
+            self.pack_any(take_ownership=True, **d)
+        return rv
+
     def scan_columnwise(self, op=monoid.plus, *, name=None):
         """Perform a prefix scan across columns with the given monoid.
 
@@ -3694,6 +4052,92 @@ class ss:
         )
 
 
+def _normalize_indices(indices, size, name):
+    indices = ints_to_numpy_buffer(indices, np.int64, name=name)
+    if indices.ndim != 1:
+        raise ValueError(f"{name} must be 1-dimensional; got ndim={indices.ndim}")
+    if indices.size > 0:
+        imin = indices.min()
+        imax = indices.max()
+        if imin < -size or imax >= size:
+            index = imin if imin < -size else imax
+            raise IndexError(f"Index out of range: index={index}, size={size}")
+        if imin < 0:
+            indices = np.where(indices < 0, indices + size, indices)
+    return indices.astype(np.uint64)
+
+
+@njit
+def _binary_search(array, start, stop, value):  # pragma: no cover
+    """Return the position of value in sorted array[start:stop], or -1 if not found"""
+    lo = start
+    hi = stop
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if array[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo < stop and array[lo] == value:
+        return lo
+    return -1
+
+
+@njit
+def _get_many_sparse(indptr, indices, major, minor):  # pragma: no cover
+    positions = np.empty(major.size, dtype=np.int64)
+    for k in range(major.size):
+        i = np.int64(major[k])
+        positions[k] = _binary_search(
+            indices, np.int64(indptr[i]), np.int64(indptr[i + 1]), minor[k]
+        )
+    return positions
+
+
+@njit
+def _get_many_hypersparse(indptr, hyperlist, indices, nvec, major, minor):  # pragma: no cover
+    positions = np.empty(major.size, dtype=np.int64)
+    for k in range(major.size):
+        ptr = _binary_search(hyperlist, np.int64(0), np.int64(nvec), major[k])
+        if ptr < 0:
+            positions[k] = -1
+        else:
+            positions[k] = _binary_search(
+                indices, np.int64(indptr[ptr]), np.int64(indptr[ptr + 1]), minor[k]
+            )
+    return positions
+
+
+@njit
+def _hypersparse_ranges(indptr, hyperlist, nvec, major):  # pragma: no cover
+    starts = np.zeros(major.size, dtype=np.int64)
+    ends = np.zeros(major.size, dtype=np.int64)
+    for k in range(major.size):
+        ptr = _binary_search(hyperlist, np.int64(0), np.int64(nvec), major[k])
+        if ptr >= 0:
+            starts[k] = indptr[ptr]
+            ends[k] = indptr[ptr + 1]
+    return starts, ends
+
+
+@njit
+def _concat_ranges(starts, ends):  # pragma: no cover
+    """Compute the indptr and positions of the concatenation of ranges in a sparse array"""
+    indptr = np.empty(starts.size + 1, dtype=np.uint64)
+    indptr[0] = 0
+    total = 0
+    for k in range(starts.size):
+        total += ends[k] - starts[k]
+        indptr[k + 1] = total
+    positions = np.empty(total, dtype=np.int64)
+    index = 0
+    for k in range(starts.size):
+        for pos in range(starts[k], ends[k]):
+            positions[index] = pos
+            index += 1
+    return indptr, positions
+
+
 @njit(parallel=True)
 def choose_random1(indptr):  # pragma: no cover
     choices = np.empty(indptr.size - 1, dtype=indptr.dtype)
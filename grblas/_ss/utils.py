@@ -1,3 +1,6 @@
+from ..memory import _release
+
+
 def get_order(order):
     val = order.lower()
     if val in {"c", "row", "rows", "rowwise"}:
@@ -9,3 +12,27 @@ def get_order(order):
             f"Bad value for order: {order!r}.  "
             'Expected "rowwise", "columnwise", "rows", "columns", "C", or "F"'
         )
+
+
+# suitesparse_graphblas is imported when needed so the python backend works without it
+def claim_buffer(ffi, cdata, *args):
+    """Give a buffer allocated by GraphBLAS to a new numpy array, which then owns it"""
+    from suitesparse_graphblas.utils import claim_buffer
+
+    _release(cdata)
+    return claim_buffer(ffi, cdata, *args)
+
+
+def claim_buffer_2d(ffi, cdata, *args):
+    """Give a buffer allocated by GraphBLAS to a new 2d numpy array, which then owns it"""
+    from suitesparse_graphblas.utils import claim_buffer_2d
+
+    _release(cdata)
+    return claim_buffer_2d(ffi, cdata, *args)
+
+
+def unclaim_buffer(array):
+    """Stop numpy from freeing the buffer of `array` so GraphBLAS may own it"""
+    from suitesparse_graphblas.utils import unclaim_buffer
+
+    return unclaim_buffer(array)
@@ -1,6 +1,5 @@
 import numpy as np
 from numba import njit
-from suitesparse_graphblas.utils import claim_buffer, unclaim_buffer
 
 import grblas as gb
 
@@ -18,7 +17,7 @@ from ..utils import (
 )
 from .prefix_scan import prefix_scan
 from .scalar import gxb_scalar
-from .utils import get_order
+from .utils import claim_buffer, get_order, unclaim_buffer
 
 ffi_new = ffi.new
 
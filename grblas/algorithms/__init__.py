@@ -0,0 +1,5 @@
+from ._bfs import bfs_levels, bfs_parents  # noqa
+from ._components import connected_components  # noqa
+from ._pagerank import pagerank  # noqa
+from ._sssp import sssp  # noqa
+from ._triangles import local_clustering, triangles  # noqa
@@ -0,0 +1,169 @@
+import numpy as np
+
+from .. import agg, semiring
+from ..dtypes import BOOL, INT64
+from ..exceptions import DimensionMismatch
+from ..matrix import Matrix
+from ..vector import Vector
+
+# Heuristics to choose between push and pull, as in LAGraph's breadth-first search.
+# Switch to pull when the edges leaving the frontier exceed 1/ALPHA of the unexplored
+# edges, and switch back to push when the frontier shrinks below 1/BETA2 of the vertices.
+# After the first pull, the size of the frontier (compared to 1/BETA1 of the vertices)
+# decides when to pull again, so edges don't need to be counted.
+ALPHA = 8
+BETA1 = 8
+BETA2 = 512
+
+
+def bfs_levels(A, sources, *, direction="auto", name=None):
+    """Breadth-first search that computes the level of each vertex.
+
+    Parameters
+    ----------
+    A : Matrix
+        Square adjacency matrix; ``A[i, j]`` is the edge from i to j.  Only the structure
+        of A is used, never its values.
+    sources : int or list of int
+        Vertex to start from.  If a list is given, the searches from every source run
+        together with a Matrix frontier that has one row per source.
+    direction : {"auto", "push", "pull"}, default "auto"
+        "push" expands the frontier with ``vxm`` (or ``mxm``), and "pull" checks the
+        unvisited vertices with dot products: a masked ``mxv`` on ``A.T`` (or ``mxm``
+        with the transpose of ``A.T``).  "auto" switches between them based on the size of the
+        frontier and the number of unexplored edges.
+    name : str, optional
+        Name of the result.
+
+    Returns
+    -------
+    Vector or Matrix
+        Level of each reachable vertex, which is 0 for the source.  If `sources` is a
+        list, a Matrix is returned with one row per source.
+    """
+    q, levels = _start(A, sources, parents=False, name=name)
+    search = _Search(A, q, direction)
+    depth = 0
+    while search.advance(q, levels, semiring.any_pair):
+        depth += 1
+        levels(q.S) << depth
+    return levels
+
+
+def bfs_parents(A, sources, *, direction="auto", name=None):
+    """Breadth-first search that computes the parent of each vertex.
+
+    Parameters
+    ----------
+    A : Matrix
+        Square adjacency matrix; ``A[i, j]`` is the edge from i to j.  Only the structure
+        of A is used, never its values.
+    sources : int or list of int
+        Vertex to start from.  If a list is given, the searches from every source run
+        together with a Matrix frontier that has one row per source.
+    direction : {"auto", "push", "pull"}, default "auto"
+        "push" expands the frontier with ``vxm`` (or ``mxm``), and "pull" checks the
+        unvisited vertices with dot products: a masked ``mxv`` on ``A.T`` (or ``mxm``
+        with the transpose of ``A.T``).  "auto" switches between them based on the size of the
+        frontier and the number of unexplored edges.
+    name : str, optional
+        Name of the result.
+
+    Returns
+    -------
+    Vector or Matrix
+        Parent of each reachable vertex in the BFS tree.  A source is its own parent,
+        and the parent with the smallest index is used when there is a choice.
+        If `sources` is a list, a Matrix is returned with one row per source.
+    """
+    q, parents = _start(A, sources, parents=True, name=name)
+    search = _Search(A, q, direction)
+    # secondi is the index of the frontier vertex when pushing with A and pulling with A.T
+    while search.advance(q, parents, semiring.min_secondi):
+        parents(q.S) << q
+    return parents
+
+
+def _start(A, sources, *, parents, name):
+    """Create the frontier and the result for the first level of a BFS"""
+    if A.nrows != A.ncols:
+        raise DimensionMismatch(f"A must be square; got shape {A.shape}")
+    n = A.nrows
+    if isinstance(sources, (int, np.integer)):
+        source = int(sources)
+        if parents:
+            q = Vector.from_values([source], [source], INT64, size=n)
+            result = Vector.from_values([source], [source], INT64, size=n, name=name)
+        else:
+            q = Vector.from_values([source], [True], BOOL, size=n)
+            result = Vector.from_values([source], [0], INT64, size=n, name=name)
+        return q, result
+    sources = np.asarray(sources, dtype=np.uint64)
+    rows = np.arange(sources.size, dtype=np.uint64)
+    shape = dict(nrows=sources.size, ncols=n)
+    if parents:
+        q = Matrix.from_values(rows, sources, sources, INT64, **shape)
+        result = Matrix.from_values(rows, sources, sources, INT64, name=name, **shape)
+    else:
+        q = Matrix.from_values(rows, sources, True, BOOL, **shape)
+        result = Matrix.from_values(rows, sources, 0, INT64, name=name, **shape)
+    return q, result
+
+
+class _Search:
+    """Advance the frontier of a BFS, choosing between push and pull at each level"""
+
+    def __init__(self, A, q, direction):
+        if direction not in {"auto", "push", "pull"}:
+            raise ValueError(f'direction must be "auto", "push", or "pull"; got {direction!r}')
+        nsources = 1 if type(q) is Vector else q.nrows
+        self.A = A
+        self.AT = None
+        self.auto = direction == "auto"
+        self.push = direction != "pull"
+        self.any_pull = False
+        self.nvertices = A.nrows * nsources
+        self.nq = q.nvals
+        self.growing = True
+        if self.auto:
+            self.degrees = A.reduce_rowwise(agg.count).new(name="degrees")
+            self.edges_unexplored = A.nvals * nsources
+
+    def advance(self, q, visited, op):
+        """Replace q with the unvisited neighbors of q; return whether any were found"""
+        if self.auto:
+            self._choose(q)
+        if self.push:
+            expr = q.vxm(self.A, op) if type(q) is Vector else q.mxm(self.A, op)
+            q(~visited.S, replace=True) << expr
+        else:
+            if self.AT is None:
+                self.AT = self.A.T.new(name="AT")
+            # The complemented mask limits the dot products to unvisited vertices
+            if type(q) is Vector:
+                expr = self.AT.mxv(q, op)
+            else:
+                # Multiplying by the transpose of A.T gives dot products of the rows
+                # of q with the rows of A.T, without transposing q or visited
+                expr = q.mxm(self.AT.T, op)
+            q(~visited.S, replace=True) << expr
+        nq = q.nvals
+        self.growing = nq > self.nq
+        self.nq = nq
+        return nq > 0
+
+    def _choose(self, q):
+        if not self.push:
+            self.push = not self.growing and self.nq < self.nvertices / BETA2
+        elif self.any_pull:
+            self.push = not (self.growing and self.nq > self.nvertices / BETA1)
+        else:
+            # Number of edges leaving the frontier
+            if type(q) is Vector:
+                mq = q.inner(self.degrees, semiring.plus_second).new().value
+            else:
+                mq = q.mxv(self.degrees, semiring.plus_second).new().reduce().new().value
+            mq = mq or 0
+            self.edges_unexplored -= mq
+            self.push = not (self.growing and mq > self.edges_unexplored / ALPHA)
+        self.any_pull = self.any_pull or not self.push
@@ -0,0 +1,57 @@
+import numpy as np
+
+from .. import binary, monoid, semiring
+from ..dtypes import INT64
+from ..exceptions import DimensionMismatch
+from ..vector import Vector
+
+
+def connected_components(A, *, symmetric=False, name=None):
+    """Connected components of a graph with the FastSV algorithm.
+
+    Parameters
+    ----------
+    A : Matrix
+        Square adjacency matrix.  Only the structure of A is used.
+    symmetric : bool, default False
+        Whether A is known to be symmetric.  If False, ``A | A.T`` is used, so the
+        weakly connected components of a directed graph are found.
+    name : str, optional
+        Name of the result.
+
+    Each step hooks trees together with the minimum grandparent of the neighbors
+    of each vertex (a ``min_second`` product), and then shortcuts by taking
+    grandparents of the parent vector with extract.  This repeats until the
+    grandparents stop changing.  Hooking and shortcutting use assign and extract
+    with the parent vector as the index list, so its values are copied out once
+    per step.
+
+    Returns
+    -------
+    Vector
+        Label of the component of every vertex, which is the smallest vertex index in it.
+    """
+    if A.nrows != A.ncols:
+        raise DimensionMismatch(f"A must be square; got shape {A.shape}")
+    if not symmetric:
+        A = A.ewise_add(A.T, monoid.any).new(name="A_sym")
+    n = A.nrows
+    index = np.arange(n, dtype=np.int64)
+    parents = Vector.from_values(index, index, INT64, size=n, name=name)
+    gp = parents.dup(name="gp")  # Grandparents
+    mngp = Vector.new(INT64, n, name="mngp")  # Minimum grandparent of the neighbors
+    parent_values = index
+    while True:
+        mngp << A.mxv(gp, semiring.min_second[INT64])
+        # Stochastic hooking: parents[parents[i]] = min(parents[parents[i]], mngp[i]).
+        # Several i may share a parent; any of their values is a valid (smaller) label.
+        parents(binary.min)[parent_values] << mngp
+        # Aggressive hooking and shortcutting
+        parents(binary.min) << mngp
+        parents(binary.min) << gp
+        # Recompute grandparents: gp = parents[parents]
+        _, parent_values = parents.to_values()
+        new_gp = parents[parent_values].new(name="gp")
+        if new_gp.isequal(gp):
+            return parents
+        gp = new_gp
@@ -0,0 +1,108 @@
+from .. import agg, binary, monoid, semiring, unary
+from ..dtypes import FP64
+from ..exceptions import DimensionMismatch
+from ..matrix import Matrix
+from ..ss import diag
+from ..vector import Vector
+
+
+def pagerank(A, damping=0.85, tol=1e-4, max_iter=100, personalization=None, *, name=None):
+    """PageRank of the vertices of a directed graph by power iteration.
+
+    Parameters
+    ----------
+    A : Matrix
+        Square adjacency matrix; ``A[i, j]`` is the edge from i to j.  Only the structure
+        of A is used, never its values.
+    damping : float, default 0.85
+        Probability of following an edge instead of jumping to a random vertex.
+    tol : float, default 1e-4
+        Iteration stops when the sum of the absolute changes of the ranks is at most `tol`.
+    max_iter : int, default 100
+        Maximum number of iterations.  The current ranks are returned if they haven't
+        converged by then.
+    personalization : Vector or Matrix, optional
+        Weights of the vertices that random jumps go to, which are normalized to sum to 1.
+        All vertices are equally likely by default.  If a Matrix is given, each row is a
+        separate distribution, and the PageRanks for all rows are computed together with
+        ``mxm`` (every row is iterated until all rows converge).
+    name : str, optional
+        Name of the result.
+
+    Vertices without out-edges ("dangling" vertices) pass their rank to the vertices
+    of the personalization, as if they had edges to every such vertex.
+
+    Returns
+    -------
+    Vector or Matrix
+        Ranks that sum to 1 (for each row if `personalization` is a Matrix).
+    """
+    if A.nrows != A.ncols:
+        raise DimensionMismatch(f"A must be square; got shape {A.shape}")
+    if not 0 <= damping <= 1:
+        raise ValueError(f"damping must be between 0 and 1; got {damping}")
+    n = A.nrows
+    p = _normalize(personalization, n)
+    is_batch = type(p) is Matrix
+
+    # Scale the edges leaving each vertex by damping / out_degree, so the rows of S
+    # sum to `damping` (or 0 for dangling vertices).  Values of A aren't used.
+    degrees = A.reduce_rowwise(agg.count).new(name="degrees")
+    scale = degrees.apply(binary.truediv, left=damping).new(FP64, name="scale")
+    S = diag(scale).mxm(A, semiring.any_first[FP64]).new(name="S")
+
+    r = p.dup(name="r")
+    t = p.dup(name="t")
+    if is_batch:
+        teleport = Vector.new(FP64, p.nrows, name="teleport")
+    for _ in range(max_iter):
+        # t is the previous ranks
+        r, t = t, r
+        r << (t.mxm(S, semiring.plus_times) if is_batch else t.vxm(S, semiring.plus_times))
+        # The rank that doesn't follow edges--from random jumps and dangling vertices--
+        # goes to the personalization, so the ranks still sum to 1.
+        if is_batch:
+            teleport[:] << 1
+            teleport(binary.minus) << r.reduce_rowwise(monoid.plus)
+            r(binary.plus) << diag(teleport).mxm(p, semiring.plus_times)
+        else:
+            teleport = 1 - (r.reduce(monoid.plus).new().value or 0)
+            r(binary.plus) << p.apply(binary.times, right=teleport)
+        # Sum of absolute changes
+        t(binary.minus) << r
+        t << t.apply(unary.abs)
+        if is_batch:
+            diff = t.reduce_rowwise(monoid.plus).new().reduce(monoid.max).new().value
+        else:
+            diff = t.reduce(monoid.plus).new().value
+        if diff is None or diff <= tol:
+            break
+    if name is not None:
+        r.name = name
+    return r
+
+
+def _normalize(personalization, n):
+    """Return the personalization as FP64 with each distribution summing to 1"""
+    if personalization is None:
+        p = Vector.new(FP64, n, name="p")
+        p[:] << 1 / n
+        return p
+    if type(personalization) is Vector:
+        if personalization.size != n:
+            raise DimensionMismatch(f"personalization must have size {n}")
+        total = personalization.reduce(monoid.plus).new(FP64).value
+        if not total or total <= 0:
+            raise ValueError("personalization must have a positive sum")
+        return personalization.apply(binary.truediv, right=total).new(FP64, name="p")
+    if type(personalization) is Matrix:
+        if personalization.ncols != n:
+            raise DimensionMismatch(f"personalization must have {n} columns")
+        totals = personalization.reduce_rowwise(monoid.plus).new(FP64)
+        if totals.nvals != personalization.nrows or totals.reduce(monoid.min).new().value <= 0:
+            raise ValueError("each row of personalization must have a positive sum")
+        inverse = totals.apply(binary.truediv, left=1).new(name="inverse")
+        return diag(inverse).mxm(personalization, semiring.plus_times).new(FP64, name="P")
+    raise TypeError(
+        f"personalization must be a Vector or Matrix; got {type(personalization).__name__}"
+    )
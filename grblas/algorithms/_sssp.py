@@ -0,0 +1,166 @@
+from math import floor
+
+import numpy as np
+
+from .. import binary, monoid, semiring
+from ..dtypes import BOOL, INT64
+from ..exceptions import DimensionMismatch
+from ..matrix import Matrix
+from ..ss import diag
+from ..vector import Vector
+
+
+def sssp(A, sources, method="bellman_ford", *, delta=None, parents=False, name=None):
+    """Single-source shortest paths.
+
+    Parameters
+    ----------
+    A : Matrix
+        Square adjacency matrix; ``A[i, j]`` is the weight of the edge from i to j.
+    sources : int or list of int
+        Vertex to start from.  If a list is given, the searches from every source run
+        together with a Matrix frontier that has one row per source.
+    method : {"bellman_ford", "delta_stepping"}, default "bellman_ford"
+        "bellman_ford" allows negative weights and raises ValueError for a reachable
+        negative-weight cycle.  Each step only relaxes the edges of vertices whose
+        distance changed in the previous step.  "delta_stepping" requires
+        non-negative weights, and settles vertices in buckets of width `delta`.
+        Light edges (weight <= delta) are relaxed until the bucket settles, and then
+        heavy edges are relaxed once.
+    delta : number, optional
+        Bucket width for "delta_stepping".  The mean edge weight is used by default.
+    parents : bool, default False
+        Whether to also compute the parent of each reachable vertex in a shortest-path
+        tree.  The parent with the smallest index is used when there is a choice.
+        Zero-weight cycles may make the parents of some vertices form a cycle.
+    name : str, optional
+        Name of the distances.
+
+    Returns
+    -------
+    Vector or Matrix, or a tuple of (distances, parents) if `parents` is True
+        Distance to each reachable vertex.  If `sources` is a list, a Matrix is
+        returned with one row per source.
+    """
+    if A.nrows != A.ncols:
+        raise DimensionMismatch(f"A must be square; got shape {A.shape}")
+    if method not in {"bellman_ford", "delta_stepping"}:
+        raise ValueError(f'method must be "bellman_ford" or "delta_stepping"; got {method!r}')
+    n = A.nrows
+    if isinstance(sources, (int, np.integer)):
+        source_list = [int(sources)]
+        distances = Vector.from_values(source_list, 0, A.dtype, size=n, name=name)
+    else:
+        source_list = np.asarray(sources, dtype=np.uint64)
+        rows = np.arange(source_list.size, dtype=np.uint64)
+        distances = Matrix.from_values(
+            rows, source_list, 0, A.dtype, nrows=source_list.size, ncols=n, name=name
+        )
+    if method == "bellman_ford":
+        _bellman_ford(A, distances)
+    else:
+        if A.nvals > 0 and A.reduce_scalar(monoid.min).new().value < 0:
+            raise ValueError("delta_stepping requires non-negative edge weights")
+        if delta is None:
+            delta = A.reduce_scalar(monoid.plus).new(float).value / A.nvals if A.nvals else 1
+        if not delta > 0:
+            raise ValueError(f"delta must be positive; got {delta}")
+        _delta_stepping(A, distances, delta)
+    if not parents:
+        return distances
+    if type(distances) is Vector:
+        return distances, _parents(A, distances, source_list[0])
+    P = Matrix.new(INT64, distances.nrows, n)
+    for r, source in enumerate(source_list):
+        P[r, :] << _parents(A, distances[r, :].new(), int(source))
+    return distances, P
+
+
+def _like(x, dtype):
+    if type(x) is Vector:
+        return Vector.new(dtype, x.size)
+    return Matrix.new(dtype, x.nrows, x.ncols)
+
+
+def _relax(f, A):
+    """Distances through the edges leaving the frontier"""
+    if type(f) is Vector:
+        return f.vxm(A, semiring.min_plus)
+    return f.mxm(A, semiring.min_plus)
+
+
+def _improvements(t, d, f, better):
+    """Set f to the values of t that are less than d or where d has no value"""
+    f(~d.S, replace=True) << t
+    better << t.ewise_mult(d, binary.lt)
+    f(better.V) << t
+
+
+def _bellman_ford(A, d):
+    f = d.dup()  # Vertices whose distance changed
+    t = _like(d, d.dtype)
+    better = _like(d, BOOL)
+    for _ in range(A.nrows):
+        t << _relax(f, A)
+        _improvements(t, d, f, better)
+        if f.nvals == 0:
+            return
+        d(binary.min) << f
+    raise ValueError("A has a negative-weight cycle reachable from the source")
+
+
+def _delta_stepping(A, d, delta):
+    # Light and heavy edges
+    light = Matrix.new(A.dtype, A.nrows, A.ncols)
+    light(A.apply(binary.le, right=delta).new().V) << A
+    heavy = Matrix.new(A.dtype, A.nrows, A.ncols)
+    heavy(A.apply(binary.gt, right=delta).new().V) << A
+
+    bucket = _like(d, d.dtype)  # Vertices of the current bucket to relax
+    settled = _like(d, d.dtype)  # Vertices of the current bucket
+    t = _like(d, d.dtype)
+    f = _like(d, d.dtype)
+    better = _like(d, BOOL)
+    in_range = _like(d, BOOL)
+    lo = 0
+    while True:
+        hi = lo + delta
+        in_range << d.apply(binary.ge, right=lo)
+        in_range(binary.land) << d.apply(binary.lt, right=hi)
+        bucket(in_range.V, replace=True) << d
+        settled.clear()
+        while bucket.nvals > 0:
+            settled(bucket.S) << bucket
+            t << _relax(bucket, light)
+            _improvements(t, d, f, better)
+            d(binary.min) << f
+            # Only vertices that stay in this bucket are relaxed again
+            in_range << f.apply(binary.lt, right=hi)
+            bucket(in_range.V, replace=True) << f
+        d(binary.min) << _relax(settled, heavy)
+
+        # Skip to the next bucket that isn't empty
+        in_range << d.apply(binary.ge, right=hi)
+        t(in_range.V, replace=True) << d
+        if type(t) is Vector:
+            lowest = t.reduce(monoid.min).new().value
+        else:
+            lowest = t.reduce_scalar(monoid.min).new().value
+        if lowest is None:
+            return
+        lo = floor(lowest / delta) * delta
+
+
+def _parents(A, d, source):
+    """Parents of a shortest-path tree for the distances d from source"""
+    n = A.nrows
+    D = diag(d)
+    # Edges on shortest paths, where d[i] + A[i, j] == d[j]
+    tight = D.mxm(A, semiring.min_plus).new().mxm(D, semiring.any_eq).new()
+    edges = Matrix.new(BOOL, n, n)
+    edges(tight.V) << tight
+    reached = Vector.new(BOOL, n)
+    reached(d.S) << True
+    parents = reached.vxm(edges, semiring.min_secondi).new(INT64)
+    parents[source] << source
+    return parents
@@ -0,0 +1,118 @@
+import numpy as np
+
+from .. import agg, binary, monoid, semiring, unary
+from ..dtypes import BOOL, FP64, INT64
+from ..exceptions import DimensionMismatch
+from ..matrix import Matrix
+from ..vector import Vector
+
+
+def triangles(A, method="sandia", *, sort=False):
+    """Count the triangles of an undirected graph.
+
+    Parameters
+    ----------
+    A : Matrix
+        Symmetric adjacency matrix.  Only the structure of A is used, and the
+        diagonal (self-edges) is ignored.
+    method : {"sandia", "burkhardt", "cohen"}, default "sandia"
+        With ``L = tril(A)`` and ``U = triu(A)`` (excluding the diagonal):
+
+        - "sandia" computes ``plus_pair(L @ L.T)`` with ``mask=L.S`` and counts each
+          triangle once.  This is usually the fastest.
+        - "burkhardt" computes ``plus_pair(A @ A)`` with ``mask=A.S`` and counts each
+          triangle six times.
+        - "cohen" computes ``plus_pair(L @ U)`` with ``mask=A.S`` and counts each
+          triangle twice.
+    sort : bool, default False
+        Whether to relabel the vertices in increasing order of degree first.  This makes
+        the rows of L for high-degree vertices long and their columns short, which
+        often reduces the work of "sandia" on graphs with skewed degrees.
+
+    Returns
+    -------
+    int
+    """
+    if method not in {"sandia", "burkhardt", "cohen"}:
+        raise ValueError(f'method must be "sandia", "burkhardt", or "cohen"; got {method!r}')
+    A = _offdiag(A)
+    if sort:
+        A = _sort_by_degree(A)
+    n = A.nrows
+    C = Matrix.new(INT64, n, n, name="C")
+    if method == "sandia":
+        L = _select(A, binary.gt)  # tril
+        C(L.S) << L.mxm(L.T, semiring.plus_pair[INT64])
+        factor = 1
+    elif method == "burkhardt":
+        C(A.S) << A.mxm(A, semiring.plus_pair[INT64])
+        factor = 6
+    else:
+        L = _select(A, binary.gt)
+        U = _select(A, binary.lt)
+        C(A.S) << L.mxm(U, semiring.plus_pair[INT64])
+        factor = 2
+    total = C.reduce_scalar(monoid.plus).new().value or 0
+    return total // factor
+
+
+def local_clustering(A, *, name=None):
+    """Local clustering coefficient of each vertex of an undirected graph.
+
+    This is the number of triangles through a vertex divided by the number of pairs of
+    its neighbors, ``2 * T[i] / (d[i] * (d[i] - 1))``, and is 0 for vertices with fewer
+    than two neighbors.
+
+    Parameters
+    ----------
+    A : Matrix
+        Symmetric adjacency matrix.  Only the structure of A is used, and the
+        diagonal (self-edges) is ignored.
+    name : str, optional
+        Name of the result.
+
+    Returns
+    -------
+    Vector
+        FP64 coefficient for every vertex.
+    """
+    A = _offdiag(A)
+    n = A.nrows
+    degrees = A.reduce_rowwise(agg.count).new(name="degrees")
+    # C[i, j] is the number of triangles through edge (i, j)
+    C = Matrix.new(INT64, n, n, name="C")
+    C(A.S) << A.mxm(A.T, semiring.plus_pair[INT64])
+    # Twice the number of triangles through each vertex
+    tri = C.reduce_rowwise(monoid.plus).new(name="tri")
+    pairs = degrees.apply(binary.minus, right=1).new(name="pairs")
+    pairs << pairs.ewise_mult(degrees, binary.times)
+    result = Vector.new(FP64, n, name=name)
+    result[:] << 0
+    result(tri.S) << tri.ewise_mult(pairs, binary.truediv)
+    return result
+
+
+def _offdiag(A):
+    """A without its diagonal"""
+    if A.nrows != A.ncols:
+        raise DimensionMismatch(f"A must be square; got shape {A.shape}")
+    return _select(A, binary.ne)
+
+
+def _select(A, op):
+    """Entries of A where ``op(row, col)`` is True"""
+    rows = A.apply(unary.positioni).new()
+    cols = A.apply(unary.positionj).new()
+    keep = rows.ewise_mult(cols, op).new(BOOL)
+    B = Matrix.new(A.dtype, A.nrows, A.ncols)
+    B(keep.V) << A
+    return B
+
+
+def _sort_by_degree(A):
+    """Permute the rows and columns of A in increasing order of degree"""
+    indices, values = A.reduce_rowwise(agg.count).new().to_values()
+    degrees = np.zeros(A.nrows, dtype=np.int64)
+    degrees[indices] = values
+    perm = np.argsort(degrees, kind="stable")
+    return A[perm, perm].new()
@@ -1,4 +1,8 @@
+from . import constants as lib  # noqa
 from .constants import *  # noqa
+from .context import initialize, is_initialized  # noqa
+from .ffi import ffi  # noqa
 
 # NOTE: This backend is meant to be used for prototyping, not for production use
 #       It is still in early-alpha stage with most methods not yet implemented.
+#       Use it from grblas with `grblas.init("python")`.
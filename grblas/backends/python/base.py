@@ -4,9 +4,43 @@ from .exceptions import GraphBlasException
 
 GrB_ALL = object()
 GrB_NULL = object()
+# Special values of `ni` for index arguments, as in SuiteSparse:GraphBLAS
+GxB_RANGE = np.iinfo(np.int64).max
+GxB_STRIDE = GxB_RANGE - 1
+GxB_BACKWARDS = GxB_RANGE - 2
+# Fields and values for GxB_Matrix_Option_get and GxB_Vector_Option_get.
+# Matrices are always stored by row in sparse (CSR) format.
+GxB_FORMAT = 0
+GxB_SPARSITY_STATUS = 1
+GxB_BY_ROW = 0
+GxB_BY_COL = 1
+GxB_HYPERSPARSE = 1
+GxB_SPARSE = 2
+GxB_BITMAP = 4
+GxB_FULL = 8
 
 
 class GraphBlasContainer:
+    # Subclasses store their csr_matrix in `_data`.  In non-blocking mode, `_pending`
+    # may hold an operation that hasn't been computed yet (see lazy.py).
+    _data = None
+    _pending = None
+
+    def _get_data(self):
+        pending = self._pending
+        if pending is not None:
+            self._pending = None
+            self._data = pending.evaluate(self._data)
+        return self._data
+
+    def _set_data(self, data):
+        self._pending = None
+        self._data = data
+
+    def wait(self):
+        """Finish any pending operations"""
+        self._get_data()
+
     @classmethod
     def get_pointer(cls):
         raise NotImplementedError()
@@ -22,6 +56,11 @@ class BasePointer:
             raise KeyError("Only [0] is available for pointers")
         return self.instance
 
+    def __setitem__(self, key, value):
+        if key != 0:
+            raise KeyError("Only [0] is available for pointers")
+        self.instance = value
+
     @property
     def is_initialized(self):
         return self.instance is not None
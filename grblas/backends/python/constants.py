@@ -3,25 +3,133 @@ from . import base, context, descriptors, exceptions, matrix, operators, types,
 # Standalone constants
 GrB_ALL = base.GrB_ALL
 GrB_NULL = base.GrB_NULL
+GxB_RANGE = base.GxB_RANGE
+GxB_STRIDE = base.GxB_STRIDE
+GxB_BACKWARDS = base.GxB_BACKWARDS
+for _name in [
+    "GxB_FORMAT",
+    "GxB_SPARSITY_STATUS",
+    "GxB_BY_ROW",
+    "GxB_BY_COL",
+    "GxB_HYPERSPARSE",
+    "GxB_SPARSE",
+    "GxB_BITMAP",
+    "GxB_FULL",
+]:
+    globals()[_name] = getattr(base, _name)
 # Enums
 GrB_Mode = context.GrB_Mode
 GrB_Info = exceptions.GrB_Info
+GrB_BLOCKING = GrB_Mode.GrB_BLOCKING
+GrB_NONBLOCKING = GrB_Mode.GrB_NONBLOCKING
+for _name in dir(GrB_Info):
+    if _name.startswith("GrB_"):
+        globals()[_name] = getattr(GrB_Info, _name)
+for _name in ["GrB_OUTP", "GrB_INP0", "GrB_INP1", "GrB_MASK"]:
+    globals()[_name] = getattr(descriptors.GrB_Desc_Field, _name)
+for _name in ["GrB_STRUCTURE", "GrB_COMP", "GrB_TRAN", "GrB_REPLACE"]:
+    globals()[_name] = getattr(descriptors.GrB_Desc_Value, _name)
+globals().update(descriptors.predefined)
+# Types, operators, monoids, and semirings such as GrB_INT64 and GrB_PLUS_MONOID_INT64
+for _container in [
+    types.GrB_Type,
+    operators.GrB_UnaryOp,
+    operators.GrB_BinaryOp,
+    operators.GrB_Monoid,
+    operators.GrB_Semiring,
+]:
+    for _name in dir(_container):
+        if _name.startswith(("GrB_", "GxB_")):
+            globals()[_name] = getattr(_container, _name)
 # Opaque Objects
 GrB_Type = types.GrB_Type
 GrB_Vector = vector.Vector
 GrB_Matrix = matrix.Matrix
 # Algebra Methods
+GrB_Monoid_new = operators.Monoid_new
+GrB_Semiring_new = operators.Semiring_new
 # Vector Methods
 GrB_Vector_new = vector.Vector_new
 GrB_Vector_dup = vector.Vector_dup
 GrB_Vector_resize = vector.Vector_resize
+GrB_Vector_free = vector.Vector_free
+GrB_Vector_wait = vector.Vector_wait
+GrB_Vector_error = vector.Vector_error
+GrB_Vector_size = vector.Vector_size
+GrB_Vector_nvals = vector.Vector_nvals
+GrB_Vector_clear = vector.Vector_clear
+GrB_Vector_removeElement = vector.Vector_removeElement
+GxB_Vector_Option_get = vector.Vector_Option_get
+GxB_Vector_iso = vector.Vector_iso
 # Matrix Methods
 GrB_Matrix_new = matrix.Matrix_new
 GrB_Matrix_dup = matrix.Matrix_dup
 GrB_Matrix_resize = matrix.Matrix_resize
+GrB_Matrix_free = matrix.Matrix_free
+GrB_Matrix_wait = matrix.Matrix_wait
+GrB_Matrix_error = matrix.Matrix_error
+GrB_Matrix_nrows = matrix.Matrix_nrows
+GrB_Matrix_ncols = matrix.Matrix_ncols
+GrB_Matrix_nvals = matrix.Matrix_nvals
+GrB_Matrix_clear = matrix.Matrix_clear
+GrB_Matrix_removeElement = matrix.Matrix_removeElement
+GxB_Matrix_Option_get = matrix.Matrix_Option_get
+GxB_Matrix_iso = matrix.Matrix_iso
 # Descriptor Methods
 GrB_Descriptor_new = descriptors.Descriptor_new
 GrB_Descriptor_set = descriptors.Descriptor_set
 # Operations
 GrB_UnaryOp = operators.GrB_UnaryOp
 GrB_BinaryOp = operators.GrB_BinaryOp
+GrB_mxm = matrix.mxm
+GrB_mxv = vector.mxv
+GrB_vxm = vector.vxm
+GrB_Matrix_eWiseAdd_BinaryOp = matrix.Matrix_eWiseAdd_BinaryOp
+GrB_Matrix_eWiseAdd_Monoid = matrix.Matrix_eWiseAdd_Monoid
+GrB_Matrix_eWiseMult_BinaryOp = matrix.Matrix_eWiseMult_BinaryOp
+GrB_Matrix_eWiseMult_Monoid = matrix.Matrix_eWiseMult_Monoid
+GrB_Vector_eWiseAdd_BinaryOp = vector.Vector_eWiseAdd_BinaryOp
+GrB_Vector_eWiseAdd_Monoid = vector.Vector_eWiseAdd_Monoid
+GrB_Vector_eWiseMult_BinaryOp = vector.Vector_eWiseMult_BinaryOp
+GrB_Vector_eWiseMult_Monoid = vector.Vector_eWiseMult_Monoid
+GrB_Matrix_apply = matrix.Matrix_apply
+GrB_Vector_apply = vector.Vector_apply
+GrB_Matrix_reduce_Monoid = matrix.Matrix_reduce_Monoid
+GrB_transpose = matrix.Matrix_transpose
+GrB_Matrix_extract = matrix.Matrix_extract
+GrB_Col_extract = vector.Col_extract
+GrB_Vector_extract = vector.Vector_extract
+GrB_Matrix_assign = matrix.Matrix_assign
+GrB_Vector_assign = vector.Vector_assign
+GrB_Row_assign = matrix.Row_assign
+GrB_Col_assign = matrix.Col_assign
+GxB_Matrix_subassign = matrix.Matrix_subassign
+GxB_Vector_subassign = vector.Vector_subassign
+GxB_Row_subassign = matrix.Row_subassign
+GxB_Col_subassign = matrix.Col_subassign
+# Typed methods; the python backend handles every type with the same function
+for _name in types.GrB_Type.types:
+    globals()[f"GrB_Monoid_new_{_name}"] = operators.Monoid_new
+    globals()[f"GrB_Matrix_build_{_name}"] = matrix.Matrix_build
+    globals()[f"GrB_Matrix_extractTuples_{_name}"] = matrix.Matrix_extractTuples
+    globals()[f"GrB_Matrix_setElement_{_name}"] = matrix.Matrix_setElement
+    globals()[f"GrB_Matrix_extractElement_{_name}"] = matrix.Matrix_extractElement
+    globals()[f"GrB_Vector_build_{_name}"] = vector.Vector_build
+    globals()[f"GrB_Vector_extractTuples_{_name}"] = vector.Vector_extractTuples
+    globals()[f"GrB_Vector_setElement_{_name}"] = vector.Vector_setElement
+    globals()[f"GrB_Vector_extractElement_{_name}"] = vector.Vector_extractElement
+    globals()[f"GrB_Matrix_apply_BinaryOp1st_{_name}"] = matrix.Matrix_apply_BinaryOp1st
+    globals()[f"GrB_Matrix_apply_BinaryOp2nd_{_name}"] = matrix.Matrix_apply_BinaryOp2nd
+    globals()[f"GrB_Vector_apply_BinaryOp1st_{_name}"] = vector.Vector_apply_BinaryOp1st
+    globals()[f"GrB_Vector_apply_BinaryOp2nd_{_name}"] = vector.Vector_apply_BinaryOp2nd
+    globals()[f"GrB_Matrix_reduce_{_name}"] = matrix.Matrix_reduce_Scalar
+    globals()[f"GrB_Vector_reduce_{_name}"] = vector.Vector_reduce_Scalar
+    globals()[f"GrB_Matrix_assign_{_name}"] = matrix.Matrix_assign_Scalar
+    globals()[f"GrB_Vector_assign_{_name}"] = vector.Vector_assign_Scalar
+    globals()[f"GxB_Matrix_subassign_{_name}"] = matrix.Matrix_subassign_Scalar
+    globals()[f"GxB_Vector_subassign_{_name}"] = vector.Vector_subassign_Scalar
+del _name, _container
+
+
+def __getattr__(name):
+    raise AttributeError(f"{name} is not supported by the python backend")
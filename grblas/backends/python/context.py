@@ -1,6 +1,13 @@
+import weakref
 from functools import wraps
 
-from .exceptions import GraphBlasException, GrB_Info, return_error
+from .exceptions import (
+    GraphBlasException,
+    GrB_error,
+    GrB_Info,
+    IndexOutOfBounds,
+    return_error,
+)
 
 
 class GrB_Mode:
@@ -9,7 +16,7 @@ class GrB_Mode:
 
 
 # Decorator to automatically catch exceptions and return GrB_PANIC
-# Also ensures context is set
+# (or GrB_INDEX_OUT_OF_BOUNDS for bad indices).  Also ensures context is set
 def handle_panic(func):
     @wraps(func)
     def new_func(*args, **kwargs):
@@ -17,13 +24,17 @@ def handle_panic(func):
             if global_context is None:
                 raise GraphBlasException("Context has not be initialized")
             return func(*args, **kwargs)
+        except IndexOutOfBounds as e:
+            return return_error(GrB_Info.GrB_INDEX_OUT_OF_BOUNDS, str(e))
         except Exception as e:
-            return_error(GrB_Info.GrB_PANIC, str(e))
+            return return_error(GrB_Info.GrB_PANIC, str(e))
 
     return new_func
 
 
 global_context = None
+# Objects with operations deferred in non-blocking mode
+pending_objects = weakref.WeakSet()
 
 
 class Context:
@@ -35,18 +46,22 @@ class Context:
         return self._mode
 
 
+def is_blocking():
+    return global_context.mode is GrB_Mode.GrB_BLOCKING
+
+
 def GrB_init(mode):
     try:
         global global_context
         if mode is not GrB_Mode.GrB_BLOCKING and mode is not GrB_Mode.GrB_NONBLOCKING:
-            return_error(GrB_Info.GrB_INVALID_VALUE)
+            return return_error(GrB_Info.GrB_INVALID_VALUE, "Invalid mode")
         if global_context is not None:
-            return_error(GrB_Info.GrB_INVALID_VALUE, "Context has already been initialized")
-        elif global_context.mode is None:
-            return_error(
-                GrB_Info.GrB_INVALID_VALUE,
-                "Context has been finalized and cannot be reused",
-            )
+            if global_context.mode is None:
+                return return_error(
+                    GrB_Info.GrB_INVALID_VALUE,
+                    "Context has been finalized and cannot be reused",
+                )
+            return return_error(GrB_Info.GrB_INVALID_VALUE, "Context has already been initialized")
         global_context = Context(mode)
         return GrB_Info.GrB_SUCCESS
     except Exception as e:
@@ -55,7 +70,6 @@ def GrB_init(mode):
 
 def GrB_finalize():
     try:
-        global global_context
         if global_context is None:
             raise GraphBlasException("Context is not initialized")
         global_context._mode = None
@@ -65,8 +79,17 @@ def GrB_finalize():
 
 
 def GrB_wait(obj=None):
-    # We don't currently implement non-blocking mode, so always return success
-    return GrB_Info.GrB_SUCCESS
+    try:
+        if obj is None:
+            for pending in list(pending_objects):
+                pending.wait()
+            pending_objects.clear()
+        else:
+            obj.wait()
+            pending_objects.discard(obj)
+        return GrB_Info.GrB_SUCCESS
+    except Exception as e:
+        return return_error(GrB_Info.GrB_PANIC, str(e))
 
 
 def GrB_getVersion(version_ptr, subversion_ptr):
@@ -75,3 +98,16 @@ def GrB_getVersion(version_ptr, subversion_ptr):
         subversion_ptr[0] = 1
     except Exception as e:
         return_error(GrB_Info.GrB_PANIC, str(e))
+
+
+def is_initialized():
+    """Whether GrB_init has been called"""
+    return global_context is not None
+
+
+def initialize(*, blocking=False):
+    """Initialize the python backend, like ``suitesparse_graphblas.initialize``"""
+    mode = GrB_Mode.GrB_BLOCKING if blocking else GrB_Mode.GrB_NONBLOCKING
+    info = GrB_init(mode)
+    if info is not GrB_Info.GrB_SUCCESS:
+        raise GraphBlasException(f"GrB_init failed: {GrB_error()}")
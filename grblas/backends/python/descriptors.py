@@ -1,3 +1,5 @@
+import itertools
+
 from .base import BasePointer
 from .context import handle_panic
 from .exceptions import GrB_Info, return_error
@@ -43,23 +45,40 @@ def Descriptor_set(desc: Descriptor, field, value):
         if value is GrB_Desc_Value.GrB_REPLACE:
             desc.clear_output = True
         else:
-            return_error(GrB_Info.GrB_INVALID_VALUE, "Invalid value for GrB_OUTP")
+            return return_error(GrB_Info.GrB_INVALID_VALUE, "Invalid value for GrB_OUTP")
     elif field is GrB_Desc_Field.GrB_INP0:
         if value is GrB_Desc_Value.GrB_TRAN:
             desc.trans0 = True
         else:
-            return_error(GrB_Info.GrB_INVALID_VALUE, "Invalid value for GrB_INP0")
+            return return_error(GrB_Info.GrB_INVALID_VALUE, "Invalid value for GrB_INP0")
     elif field is GrB_Desc_Field.GrB_INP1:
         if value is GrB_Desc_Value.GrB_TRAN:
             desc.trans1 = True
         else:
-            return_error(GrB_Info.GrB_INVALID_VALUE, "Invalid value for GrB_INP1")
+            return return_error(GrB_Info.GrB_INVALID_VALUE, "Invalid value for GrB_INP1")
     elif field is GrB_Desc_Field.GrB_MASK:
         if value is GrB_Desc_Value.GrB_COMP:
             desc.mask_comp = True
         elif value is GrB_Desc_Value.GrB_STRUCTURE:
             desc.mask_struct = True
         else:
-            return_error(GrB_Info.GrB_INVALID_VALUE, "Invalid value for GrB_MASK")
+            return return_error(GrB_Info.GrB_INVALID_VALUE, "Invalid value for GrB_MASK")
     else:
-        return_error(GrB_Info.GrB_INVALID_VALUE, "Invalid field")
+        return return_error(GrB_Info.GrB_INVALID_VALUE, "Invalid field")
+    return GrB_Info.GrB_SUCCESS
+
+
+# Predefined descriptors such as GrB_DESC_RSC (replace, structure, complement) and GrB_DESC_T0
+predefined = {}
+for _replace, _struct, _comp, _trans0, _trans1 in itertools.product([False, True], repeat=5):
+    _name = "R" * _replace + "S" * _struct + "C" * _comp + "T0" * _trans0 + "T1" * _trans1
+    if not _name:
+        continue
+    _desc = Descriptor()
+    _desc.clear_output = _replace
+    _desc.mask_struct = _struct
+    _desc.mask_comp = _comp
+    _desc.trans0 = _trans0
+    _desc.trans1 = _trans1
+    predefined[f"GrB_DESC_{_name}"] = _desc
+del _replace, _struct, _comp, _trans0, _trans1, _name, _desc
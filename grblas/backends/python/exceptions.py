@@ -21,6 +21,10 @@ class GraphBlasException(Exception):
     pass
 
 
+class IndexOutOfBounds(GraphBlasException):
+    pass
+
+
 last_error_message = None
 
 
@@ -0,0 +1,81 @@
+"""A stand-in for the cffi ``ffi`` object so grblas can run on the python backend.
+
+Pointers to GraphBLAS objects are ``BasePointer`` objects, pointers to C scalars are
+numpy arrays of length one, and C arrays are numpy arrays.
+"""
+import numpy as np
+
+from .base import BasePointer
+from .descriptors import DescriptorPtr
+from .matrix import Matrix, MatrixPtr
+from .vector import Vector, VectorPtr
+
+_np_types = {
+    "_Bool": np.bool_,
+    "bool": np.bool_,
+    "int8_t": np.int8,
+    "uint8_t": np.uint8,
+    "int16_t": np.int16,
+    "uint16_t": np.uint16,
+    "int32_t": np.int32,
+    "uint32_t": np.uint32,
+    "int64_t": np.int64,
+    "uint64_t": np.uint64,
+    "GrB_Index": np.uint64,
+    "float": np.float32,
+    "double": np.float64,
+}
+_pointer_types = {
+    "GrB_Matrix": Matrix.get_pointer,
+    "GrB_Vector": Vector.get_pointer,
+    "GrB_Descriptor": DescriptorPtr,
+}
+
+
+class FFI:
+    NULL = None
+    CData = (BasePointer, np.ndarray)
+
+    def new(self, ctype, init=None):
+        """Create a pointer such as ``new("GrB_Matrix*")`` or ``new("int64_t*", 1)``"""
+        ctype = ctype.replace(" ", "")
+        if not ctype.endswith("*"):
+            raise TypeError(f"Expected a pointer type; got {ctype!r}")
+        name = ctype[:-1]
+        if name in _np_types:
+            rv = np.zeros(1, dtype=_np_types[name])
+        else:
+            rv = _pointer_types.get(name, BasePointer)()
+        if init is not None:
+            rv[0] = init
+        return rv
+
+    def cast(self, ctype, value):
+        ctype = ctype.replace(" ", "")
+        if ctype in _np_types:
+            return _np_types[ctype](value)
+        if ctype == "GrB_Matrix*" and isinstance(value, VectorPtr):
+            # A Vector of size n may be used as an n x 1 Matrix, such as for inner products
+            rv = MatrixPtr()
+            rv[0] = Matrix(value[0].vector.T.tocsr())
+            return rv
+        # Pointers and arrays are passed as is
+        return value
+
+    def from_buffer(self, *args, **kwargs):
+        # Arguments are ``([cdecl,] python_buffer)``
+        return np.asarray(args[-1])
+
+    def string(self, cdata):
+        if cdata is None:
+            return b""
+        if isinstance(cdata, str):
+            return cdata.encode()
+        return bytes(cdata)
+
+    def gc(self, cdata, destructor, size=0):
+        # Python objects are garbage collected, so there's nothing to free
+        return cdata
+
+
+ffi = FFI()
@@ -0,0 +1,349 @@
+"""Extract and assign for the python backend.
+
+Index arguments follow SuiteSparse:GraphBLAS: ``GrB_ALL``, an array of indices, or
+a two or three element array with ``ni`` set to ``GxB_RANGE`` (``[begin, end]``),
+``GxB_STRIDE`` (``[begin, end, inc]``), or ``GxB_BACKWARDS`` (``[begin, end, dec]``).
+Ranges include ``end``.
+
+Extract uses binary search within each row for ranges and strides and for arbitrary
+column indices, and allocates its output with a counting pass and a prefix sum.
+Assign splits the output into the entries inside and outside the assigned region,
+computes the new region, and merges the two back together.
+"""
+import numba
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from .base import GrB_ALL, GxB_BACKWARDS, GxB_RANGE, GxB_STRIDE
+from .exceptions import IndexOutOfBounds
+from .kernels import csr_parts, ewise, typed_binaryop, update
+
+ALL = 0
+STRIDE = 1
+LIST = 2
+
+
+class Index:
+    """An index for one axis after resolving GrB_ALL, ranges, and strides"""
+
+    __slots__ = "kind", "size", "begin", "end", "inc", "indices"
+
+    def __init__(self, kind, size, begin=0, end=-1, inc=1, indices=None):
+        self.kind = kind
+        self.size = size
+        self.begin = begin
+        self.end = end
+        self.inc = inc
+        self.indices = indices
+
+    def array(self):
+        """All selected indices as an int64 array"""
+        if self.kind == LIST:
+            return self.indices
+        return np.arange(self.begin, self.end + 1, self.inc, dtype=np.int64)
+
+    def selected(self, axis_size):
+        """A boolean array of length `axis_size` that is True for selected indices"""
+        rv = np.zeros(axis_size, dtype=bool)
+        rv[self.array()] = True
+        return rv
+
+
+def resolve_index(indices, ni, axis_size):
+    """Resolve an index argument for an axis of length `axis_size`"""
+    if indices is GrB_ALL:
+        return Index(ALL, axis_size, 0, axis_size - 1)
+    indices = np.asarray(indices, dtype=np.int64).ravel()
+    if ni == GxB_RANGE or ni == GxB_STRIDE:
+        begin = int(indices[0])
+        end = int(indices[1])
+        inc = int(indices[2]) if ni == GxB_STRIDE else 1
+        if inc <= 0:
+            raise IndexOutOfBounds(f"Stride must be positive; got {inc}")
+        size = 0 if end < begin else (end - begin) // inc + 1
+        if size > 0 and (begin < 0 or end >= axis_size):
+            raise IndexOutOfBounds(f"Range [{begin}, {end}] out of bounds for size {axis_size}")
+        # Make `end` the last selected index
+        return Index(STRIDE, size, begin, begin + (size - 1) * inc, inc)
+    if ni == GxB_BACKWARDS:
+        begin, end, dec = (int(x) for x in indices[:3])
+        indices = np.arange(begin, end - 1, -dec, dtype=np.int64)
+    else:
+        indices = indices[:ni]
+    if indices.size > 0 and (indices.min() < 0 or indices.max() >= axis_size):
+        raise IndexOutOfBounds(f"Index out of bounds for size {axis_size}")
+    return Index(LIST, indices.size, indices=indices)
+
+
+def single_index(i, axis_size):
+    """Resolve a single index, such as the row for GrB_Row_assign"""
+    return resolve_index([i], 1, axis_size)
+
+
+def extract(a, rows, cols):
+    """Return the csr_matrix ``a(rows, cols)`` for resolved indices `rows` and `cols`"""
+    a_indptr, a_indices, a_data = csr_parts(a)
+    row_array = rows.array()
+    if cols.kind == LIST:
+        order = np.argsort(cols.indices, kind="stable")
+        sorted_cols = cols.indices[order]
+    else:
+        order = sorted_cols = np.empty(0, dtype=np.int64)
+    args = (
+        a_indptr,
+        a_indices,
+        row_array,
+        cols.kind,
+        cols.begin,
+        cols.end,
+        cols.inc,
+        sorted_cols,
+        order,
+    )
+    counts = _extract_count(*args)
+    indptr = np.zeros(row_array.size + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    indices = np.empty(indptr[-1], dtype=np.int64)
+    positions = np.empty(indptr[-1], dtype=np.int64)
+    _extract_fill(*args, indptr, indices, positions)
+    return csr_matrix((a_data[positions], indices, indptr), shape=(rows.size, cols.size))
+
+
+@numba.njit
+def _lower_bound(array, lo, hi, value):  # pragma: no cover
+    """The first position in sorted array[lo:hi] with a value >= `value`"""
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if array[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+@numba.njit
+def _extract_row(
+    a_indptr,
+    a_indices,
+    row,
+    kind,
+    begin,
+    end,
+    inc,
+    sorted_cols,
+    order,
+    out_indices,
+    positions,
+    offset,
+    fill,
+):  # pragma: no cover
+    start = a_indptr[row]
+    stop = a_indptr[row + 1]
+    count = 0
+    if kind == ALL:
+        if fill:
+            for p in range(start, stop):
+                out_indices[offset + count] = a_indices[p]
+                positions[offset + count] = p
+                count += 1
+        else:
+            count = stop - start
+    elif kind == STRIDE:
+        lo = _lower_bound(a_indices, start, stop, begin)
+        hi = _lower_bound(a_indices, lo, stop, end + 1)
+        for p in range(lo, hi):
+            offset_in_range = a_indices[p] - begin
+            if offset_in_range % inc == 0:
+                if fill:
+                    out_indices[offset + count] = offset_in_range // inc
+                    positions[offset + count] = p
+                count += 1
+    else:
+        # Each column may be selected any number of times
+        for p in range(start, stop):
+            col = a_indices[p]
+            lo = _lower_bound(sorted_cols, 0, sorted_cols.size, col)
+            hi = _lower_bound(sorted_cols, lo, sorted_cols.size, col + 1)
+            for k in range(lo, hi):
+                if fill:
+                    out_indices[offset + count] = order[k]
+                    positions[offset + count] = p
+                count += 1
+        if fill and count > 1:
+            perm = np.argsort(out_indices[offset : offset + count], kind="mergesort")
+            out_indices[offset : offset + count] = out_indices[offset : offset + count][perm]
+            positions[offset : offset + count] = positions[offset : offset + count][perm]
+    return count
+
+
+@numba.njit(parallel=True)
+def _extract_count(
+    a_indptr, a_indices, rows, kind, begin, end, inc, sorted_cols, order
+):  # pragma: no cover
+    counts = np.empty(rows.size, dtype=np.int64)
+    dummy = np.empty(0, dtype=np.int64)
+    for i in numba.prange(rows.size):
+        counts[i] = _extract_row(
+            a_indptr,
+            a_indices,
+            rows[i],
+            kind,
+            begin,
+            end,
+            inc,
+            sorted_cols,
+            order,
+            dummy,
+            dummy,
+            0,
+            False,
+        )
+    return counts
+
+
+@numba.njit(parallel=True)
+def _extract_fill(
+    a_indptr,
+    a_indices,
+    rows,
+    kind,
+    begin,
+    end,
+    inc,
+    sorted_cols,
+    order,
+    indptr,
+    out_indices,
+    positions,
+):  # pragma: no cover
+    for i in numba.prange(rows.size):
+        _extract_row(
+            a_indptr,
+            a_indices,
+            rows[i],
+            kind,
+            begin,
+            end,
+            inc,
+            sorted_cols,
+            order,
+            out_indices,
+            positions,
+            indptr[i],
+            True,
+        )
+
+
+def scatter(a, rows, cols, shape):
+    """Place each ``a(i, j)`` at ``(rows[i], cols[j])`` in a csr_matrix of the given shape.
+
+    If indices are duplicated, the last value is used.
+    """
+    indptr, indices, data = csr_parts(a)
+    r = rows.array()[np.repeat(np.arange(a.shape[0]), np.diff(indptr))]
+    c = cols.array()[indices]
+    keys = r * shape[1] + c
+    # np.unique gives the first occurrence, so search in reverse to get the last
+    _, first = np.unique(keys[::-1], return_index=True)
+    keep = keys.size - 1 - first
+    return csr_matrix((data[keep], (r[keep], c[keep])), shape=shape)
+
+
+def fill_region(value, rows, cols, shape, dtype, within=None):
+    """Return a csr_matrix with `value` everywhere in the region ``(rows, cols)``.
+
+    If `within` is given, only entries of the region that are also in `within`
+    (which has the given shape) are included.
+    """
+    if within is not None:
+        pattern = select(within, region_entries(within, rows, cols))
+        data = np.full(pattern.nnz, value, dtype=dtype)
+        return csr_matrix((data, pattern.indices, pattern.indptr), shape=shape)
+    row_array = rows.array()
+    col_array = cols.array()
+    region = csr_matrix(
+        (
+            np.full(row_array.size * col_array.size, value, dtype=dtype),
+            np.tile(np.arange(col_array.size), row_array.size),
+            np.arange(row_array.size + 1) * col_array.size,
+        ),
+        shape=(row_array.size, col_array.size),
+    )
+    return scatter(region, rows, cols, shape)
+
+
+def region_entries(a, rows, cols):
+    """A boolean array that is True for the entries of `a` in the region ``(rows, cols)``"""
+    indptr, indices, _ = csr_parts(a)
+    entry_rows = np.repeat(np.arange(a.shape[0]), np.diff(indptr))
+    return rows.selected(a.shape[0])[entry_rows] & cols.selected(a.shape[1])[indices]
+
+
+def select(a, keep):
+    """Return a csr_matrix of the entries of `a` where `keep` is True"""
+    indptr, indices, data = csr_parts(a)
+    cumsum = np.zeros(keep.size + 1, dtype=np.int64)
+    np.cumsum(keep, out=cumsum[1:])
+    return csr_matrix((data[keep], indices[keep], cumsum[indptr]), shape=a.shape)
+
+
+def vector_row():
+    """The index of the only row of a vector, which is stored as a 1 x n csr_matrix"""
+    return Index(LIST, 1, indices=np.zeros(1, dtype=np.int64))
+
+
+def assign(C, A, rows, cols, mask, accum, desc, *, subassign):
+    """Return the csr_matrix for ``C<mask>(rows, cols) = accum(C(rows, cols), A)``.
+
+    `A` has shape ``(rows.size, cols.size)``.  For assign, `mask` has the shape of `C`
+    and applies to all of `C`.  For subassign, `mask` has the shape of `A` and only
+    applies within the region.
+    """
+    S = scatter(A, rows, cols, C.shape)
+    if subassign and mask is not None:
+        mask = scatter(mask, rows, cols, C.shape)
+    return assign_scattered(C, S, rows, cols, mask, accum, desc, subassign=subassign)
+
+
+def assign_scalar(C, value, rows, cols, mask, accum, desc, *, subassign):
+    """Return the csr_matrix for ``C<mask>(rows, cols) = accum(C(rows, cols), value)``"""
+    if subassign and mask is not None:
+        mask = scatter(mask, rows, cols, C.shape)
+    # Only fill the region where a (non-complemented) mask may allow values
+    within = None if mask is None or desc.mask_comp else mask
+    S = fill_region(value, rows, cols, C.shape, C.dtype, within)
+    return assign_scattered(C, S, rows, cols, mask, accum, desc, subassign=subassign)
+
+
+def assign_scattered(C, S, rows, cols, mask, accum, desc, *, subassign):
+    """Compute the assignment where `S` (and `mask` for subassign) have the shape of `C`"""
+    in_region = region_entries(C, rows, cols)
+    c_in = select(C, in_region)
+    c_out = select(C, ~in_region)
+    if accum is not None:
+        z_in = ewise(c_in, S, accum, union=True)
+    else:
+        z_in = S
+    # The two parts don't overlap, so they can be merged with any operator
+    merge = typed_binaryop("SECOND", C.dtype)
+    if subassign:
+        z_in = update(c_in, z_in, mask, None, desc)
+        return ewise(c_out, z_in, merge, union=True).astype(C.dtype, copy=False)
+    Z = ewise(c_out, z_in, merge, union=True)
+    return update(C, Z, mask, None, desc)
+
+
+def assign_row(C, i, u, cols, mask, accum, desc, *, subassign):
+    """Return the csr_matrix for ``C<mask>(i, cols) = accum(C(i, cols), u)``.
+
+    `u` has one row.  For assign, `mask` has one row the width of `C`; for subassign,
+    it has the shape of `u`.  Either way, it only applies to row `i`.
+    """
+    row = single_index(i, C.shape[0])
+    all_cols = resolve_index(GrB_ALL, None, C.shape[1])
+    old_row = extract(C, row, all_cols)
+    new_row = assign(old_row, u, vector_row(), cols, mask, accum, desc, subassign=subassign)
+    others = select(C, ~region_entries(C, row, all_cols))
+    new_row = scatter(new_row, row, all_cols, C.shape)
+    merge = typed_binaryop("SECOND", C.dtype)
+    return ewise(others, new_row, merge, union=True).astype(C.dtype, copy=False)
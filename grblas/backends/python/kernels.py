@@ -0,0 +1,501 @@
+"""Numba kernels and helpers shared by operations on CSR buffers.
+
+Every GraphBLAS operation computes an intermediate result ``T`` and then updates
+the output with ``C<M, replace> = C accum T``.  ``update`` implements this final step
+for all operations, so the operations only need to compute ``T`` (possibly using the
+mask to skip work).  Vectors are stored as csr_matrix objects with a single row,
+so the same kernels are used for Matrix and Vector.
+
+Kernels that produce output of unknown size run in two passes: the first counts
+the entries in each row, and the second fills preallocated arrays.  Rows are
+processed in parallel with ``numba.prange``.
+"""
+import numba
+import numpy as np
+from numba.np.numpy_support import as_dtype
+from scipy.sparse import csr_matrix
+
+from .descriptors import Descriptor
+from .operators import GrB_BinaryOp
+from .types import GrB_Type
+
+default_desc = Descriptor()
+
+
+def get_desc(desc):
+    return default_desc if desc is None else desc
+
+
+def op_dtypes(op):
+    """Return the numpy input and output dtypes of a jitted operator"""
+    sig = op.nopython_signatures[0]
+    return as_dtype(sig.args[0]), as_dtype(sig.return_type)
+
+
+def typed_binaryop(name, dtype):
+    """Get a jitted BinaryOp such as ``typed_binaryop("SECOND", np.int64)``"""
+    try:
+        return getattr(GrB_BinaryOp, f"GrB_{name}_{GrB_Type.lookup_name(numba.from_dtype(dtype))}")
+    except AttributeError:
+        # Boolean-only operators don't have a suffix
+        return getattr(GrB_BinaryOp, f"GrB_{name}")
+
+
+def csr_parts(matrix, dtype=None):
+    """Return (indptr, indices, data) of a csr_matrix (or csc_matrix) with sorted indices"""
+    if not matrix.has_sorted_indices:
+        matrix.sort_indices()
+    data = matrix.data
+    if dtype is not None:
+        data = data.astype(dtype, copy=False)
+    return matrix.indptr, matrix.indices, data
+
+
+def mask_pattern(mask, desc):
+    """Return (indptr, indices) of the entries of `mask` that may be written.
+
+    Structural masks use every entry, and value masks use entries that are not zero.
+    The complement is not applied here; see ``desc.mask_comp``.
+    """
+    indptr, indices, data = csr_parts(mask)
+    if desc.mask_struct:
+        return indptr, indices
+    keep = data.astype(bool)
+    if keep.all():
+        return indptr, indices
+    cumsum = np.zeros(keep.size + 1, dtype=np.int64)
+    np.cumsum(keep, out=cumsum[1:])
+    return cumsum[indptr], indices[keep]
+
+
+def chunk_count(nrows):
+    """Number of chunks of rows to process in parallel, each with its own workspace"""
+    return max(1, min(nrows, 4 * numba.get_num_threads()))
+
+
+def compact(shape, m_indptr, m_indices, data, present):
+    """Create a csr_matrix from values computed for each entry of a mask pattern"""
+    cumsum = np.zeros(present.size + 1, dtype=np.int64)
+    np.cumsum(present, out=cumsum[1:])
+    return csr_matrix((data[present], m_indices[present], cumsum[m_indptr]), shape=shape)
+
+
+def update(C, T, mask, accum, desc):
+    """Return the csr_matrix for ``C<mask, replace> = C accum T``.
+
+    `C` and `T` are csr_matrix objects of the same shape, `mask` is a csr_matrix or
+    None, and `accum` is a jitted BinaryOp or None.  The result has the dtype of `C`.
+    """
+    desc = get_desc(desc)
+    if mask is None:
+        if desc.mask_comp:
+            # The complement of no mask is a mask that is always False
+            if desc.clear_output:
+                return csr_matrix(C.shape, dtype=C.dtype)
+            return C
+        if accum is None:
+            return T.astype(C.dtype, copy=False)
+    has_accum = accum is not None
+    if has_accum:
+        in_dtype, _ = op_dtypes(accum)
+    else:
+        in_dtype = C.dtype
+        accum = typed_binaryop("SECOND", in_dtype)
+    c_indptr, c_indices, c_data = csr_parts(C, in_dtype)
+    t_indptr, t_indices, t_data = csr_parts(T, in_dtype)
+    if mask is None:
+        has_mask = False
+        m_indptr = np.zeros(C.shape[0] + 1, dtype=np.int64)
+        m_indices = np.empty(0, dtype=np.int64)
+    else:
+        has_mask = True
+        m_indptr, m_indices = mask_pattern(mask, desc)
+    args = (
+        c_indptr,
+        c_indices,
+        c_data,
+        t_indptr,
+        t_indices,
+        t_data,
+        m_indptr,
+        m_indices,
+        has_mask,
+        desc.mask_comp,
+        desc.clear_output,
+        accum,
+        has_accum,
+    )
+    counts = _update_count(*args, np.empty(0, dtype=np.int64), np.empty(0, dtype=C.dtype))
+    indptr = np.zeros(counts.size + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    indices = np.empty(indptr[-1], dtype=np.int64)
+    data = np.empty(indptr[-1], dtype=C.dtype)
+    _update_fill(*args, indptr, indices, data)
+    return csr_matrix((data, indices, indptr), shape=C.shape)
+
+
+@numba.njit
+def _update_row(
+    i,
+    c_indptr,
+    c_indices,
+    c_data,
+    t_indptr,
+    t_indices,
+    t_data,
+    m_indptr,
+    m_indices,
+    has_mask,
+    comp,
+    replace,
+    accum,
+    has_accum,
+    out_indices,
+    out_data,
+    offset,
+    fill,
+):  # pragma: no cover
+    # Merge row i of C and T, and look up each index in the (sorted) mask row
+    pc = c_indptr[i]
+    c_end = c_indptr[i + 1]
+    pt = t_indptr[i]
+    t_end = t_indptr[i + 1]
+    pm = m_indptr[i]
+    m_end = m_indptr[i + 1]
+    count = 0
+    while pc < c_end or pt < t_end:
+        if pt >= t_end or pc < c_end and c_indices[pc] <= t_indices[pt]:
+            j = c_indices[pc]
+        else:
+            j = t_indices[pt]
+        in_c = pc < c_end and c_indices[pc] == j
+        in_t = pt < t_end and t_indices[pt] == j
+        if has_mask:
+            while pm < m_end and m_indices[pm] < j:
+                pm += 1
+            allowed = pm < m_end and m_indices[pm] == j
+            if comp:
+                allowed = not allowed
+        else:
+            allowed = True
+        if allowed:
+            if in_t:
+                if fill:
+                    out_indices[offset + count] = j
+                    if in_c and has_accum:
+                        out_data[offset + count] = accum(c_data[pc], t_data[pt])
+                    else:
+                        out_data[offset + count] = t_data[pt]
+                count += 1
+            elif in_c and has_accum:
+                if fill:
+                    out_indices[offset + count] = j
+                    out_data[offset + count] = c_data[pc]
+                count += 1
+        elif in_c and not replace:
+            if fill:
+                out_indices[offset + count] = j
+                out_data[offset + count] = c_data[pc]
+            count += 1
+        if in_c:
+            pc += 1
+        if in_t:
+            pt += 1
+    return count
+
+
+@numba.njit(parallel=True)
+def _update_count(
+    c_indptr,
+    c_indices,
+    c_data,
+    t_indptr,
+    t_indices,
+    t_data,
+    m_indptr,
+    m_indices,
+    has_mask,
+    comp,
+    replace,
+    accum,
+    has_accum,
+    out_indices,
+    out_data,
+):  # pragma: no cover
+    nrows = c_indptr.size - 1
+    counts = np.empty(nrows, dtype=np.int64)
+    for i in numba.prange(nrows):
+        counts[i] = _update_row(
+            i,
+            c_indptr,
+            c_indices,
+            c_data,
+            t_indptr,
+            t_indices,
+            t_data,
+            m_indptr,
+            m_indices,
+            has_mask,
+            comp,
+            replace,
+            accum,
+            has_accum,
+            out_indices,
+            out_data,
+            0,
+            False,
+        )
+    return counts
+
+
+@numba.njit(parallel=True)
+def _update_fill(
+    c_indptr,
+    c_indices,
+    c_data,
+    t_indptr,
+    t_indices,
+    t_data,
+    m_indptr,
+    m_indices,
+    has_mask,
+    comp,
+    replace,
+    accum,
+    has_accum,
+    indptr,
+    out_indices,
+    out_data,
+):  # pragma: no cover
+    nrows = c_indptr.size - 1
+    for i in numba.prange(nrows):
+        _update_row(
+            i,
+            c_indptr,
+            c_indices,
+            c_data,
+            t_indptr,
+            t_indices,
+            t_data,
+            m_indptr,
+            m_indices,
+            has_mask,
+            comp,
+            replace,
+            accum,
+            has_accum,
+            out_indices,
+            out_data,
+            indptr[i],
+            True,
+        )
+
+
+def ewise(a, b, op, *, union):
+    """Compute the element-wise union (eWiseAdd) or intersection (eWiseMult) of a and b"""
+    in_dtype, out_dtype = op_dtypes(op)
+    a_indptr, a_indices, a_data = csr_parts(a, in_dtype)
+    b_indptr, b_indices, b_data = csr_parts(b, in_dtype)
+    args = (a_indptr, a_indices, a_data, b_indptr, b_indices, b_data, op, union)
+    counts = _ewise_count(*args, np.empty(0, dtype=np.int64), np.empty(0, dtype=out_dtype))
+    indptr = np.zeros(counts.size + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    indices = np.empty(indptr[-1], dtype=np.int64)
+    data = np.empty(indptr[-1], dtype=out_dtype)
+    _ewise_fill(*args, indptr, indices, data)
+    return csr_matrix((data, indices, indptr), shape=a.shape)
+
+
+@numba.njit
+def _ewise_row(
+    i,
+    a_indptr,
+    a_indices,
+    a_data,
+    b_indptr,
+    b_indices,
+    b_data,
+    op,
+    union,
+    out_indices,
+    out_data,
+    offset,
+    fill,
+):  # pragma: no cover
+    # Merge sorted row i of a and b
+    pa = a_indptr[i]
+    a_end = a_indptr[i + 1]
+    pb = b_indptr[i]
+    b_end = b_indptr[i + 1]
+    count = 0
+    while pa < a_end or pb < b_end:
+        if pb >= b_end or pa < a_end and a_indices[pa] < b_indices[pb]:
+            if union:
+                if fill:
+                    out_indices[offset + count] = a_indices[pa]
+                    out_data[offset + count] = a_data[pa]
+                count += 1
+            pa += 1
+        elif pa >= a_end or b_indices[pb] < a_indices[pa]:
+            if union:
+                if fill:
+                    out_indices[offset + count] = b_indices[pb]
+                    out_data[offset + count] = b_data[pb]
+                count += 1
+            pb += 1
+        else:
+            if fill:
+                out_indices[offset + count] = a_indices[pa]
+                out_data[offset + count] = op(a_data[pa], b_data[pb])
+            count += 1
+            pa += 1
+            pb += 1
+    return count
+
+
+@numba.njit(parallel=True)
+def _ewise_count(
+    a_indptr, a_indices, a_data, b_indptr, b_indices, b_data, op, union, out_indices, out_data
+):  # pragma: no cover
+    nrows = a_indptr.size - 1
+    counts = np.empty(nrows, dtype=np.int64)
+    for i in numba.prange(nrows):
+        counts[i] = _ewise_row(
+            i,
+            a_indptr,
+            a_indices,
+            a_data,
+            b_indptr,
+            b_indices,
+            b_data,
+            op,
+            union,
+            out_indices,
+            out_data,
+            0,
+            False,
+        )
+    return counts
+
+
+@numba.njit(parallel=True)
+def _ewise_fill(
+    a_indptr,
+    a_indices,
+    a_data,
+    b_indptr,
+    b_indices,
+    b_data,
+    op,
+    union,
+    indptr,
+    out_indices,
+    out_data,
+):  # pragma: no cover
+    nrows = a_indptr.size - 1
+    for i in numba.prange(nrows):
+        _ewise_row(
+            i,
+            a_indptr,
+            a_indices,
+            a_data,
+            b_indptr,
+            b_indices,
+            b_data,
+            op,
+            union,
+            out_indices,
+            out_data,
+            indptr[i],
+            True,
+        )
+
+
+def reduce_rows(a, monoid):
+    """Reduce each row of a with a Monoid; return a 1-row csr_matrix of the non-empty rows"""
+    op = monoid.op
+    in_dtype, out_dtype = op_dtypes(op)
+    indptr, indices, data = csr_parts(a, in_dtype)
+    nrows = a.shape[0]
+    out = np.empty(nrows, dtype=out_dtype)
+    _reduce_rows(indptr, data, op, out)
+    rows = np.flatnonzero(np.diff(indptr))
+    return csr_matrix((out[rows], rows, np.array([0, rows.size], dtype=np.int64)), shape=(1, nrows))
+
+
+def reduce_scalar(a, monoid):
+    """Reduce all values of a with a Monoid; returns the identity if a is empty"""
+    op = monoid.op
+    in_dtype, out_dtype = op_dtypes(op)
+    data = a.data.astype(in_dtype, copy=False)
+    nchunks = max(1, min(data.size // 1024, 4 * numba.get_num_threads()))
+    partials = np.empty(nchunks, dtype=out_dtype)
+    return _reduce_scalar(data, op, out_dtype.type(monoid.identity), nchunks, partials)
+
+
+@numba.njit(parallel=True)
+def _reduce_rows(indptr, data, op, out):  # pragma: no cover
+    nrows = indptr.size - 1
+    for i in numba.prange(nrows):
+        start = indptr[i]
+        end = indptr[i + 1]
+        if start < end:
+            val = data[start]
+            for p in range(start + 1, end):
+                val = op(val, data[p])
+            out[i] = val
+
+
+@numba.njit(parallel=True)
+def _reduce_scalar(data, op, identity, nchunks, partials):  # pragma: no cover
+    n = data.size
+    for chunk in numba.prange(nchunks):
+        val = identity
+        for p in range(chunk * n // nchunks, (chunk + 1) * n // nchunks):
+            val = op(val, data[p])
+        partials[chunk] = val
+    val = identity
+    for chunk in range(nchunks):
+        val = op(val, partials[chunk])
+    return val
+
+
+def build(shape, rows, cols, values, dup):
+    """Return a csr_matrix from coordinates, combining duplicates with the BinaryOp `dup`"""
+    # lexsort is stable, so duplicates are combined in the order they were given
+    order = np.lexsort((cols, rows))
+    rows = rows[order]
+    cols = cols[order]
+    values = values[order]
+    if rows.size > 0:
+        new_entry = np.empty(rows.size, dtype=bool)
+        new_entry[0] = True
+        new_entry[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        starts = np.flatnonzero(new_entry)
+    else:
+        starts = np.empty(0, dtype=np.int64)
+    if starts.size < rows.size:
+        data = np.empty(starts.size, dtype=values.dtype)
+        _reduce_segments(values, starts, dup, data)
+    else:
+        data = values
+    indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows[starts], minlength=shape[0]), out=indptr[1:])
+    return csr_matrix((data, cols[starts], indptr), shape=shape)
+
+
+@numba.njit(parallel=True)
+def _reduce_segments(values, starts, op, out):  # pragma: no cover
+    n = starts.size
+    for k in numba.prange(n):
+        stop = starts[k + 1] if k + 1 < n else values.size
+        val = values[starts[k]]
+        for p in range(starts[k] + 1, stop):
+            val = op(val, values[p])
+        out[k] = val
+
+
+def transpose(a):
+    """Return the transpose of a csr_matrix in CSR format with sorted indices"""
+    # scipy's conversion is a linear-time counting sort, which is hard to beat
+    return a.T.tocsr()
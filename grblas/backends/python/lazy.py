@@ -0,0 +1,405 @@
+"""Deferred and fused evaluation of element-wise operations.
+
+``apply`` (with a UnaryOp or a BinaryOp and a bound scalar), ``eWiseAdd`` and
+``eWiseMult`` are recorded as an ``Expr``: one or two csr_matrix inputs, an optional
+BinaryOp that merges them, and a chain of steps applied to each value.  ``record``
+evaluates the expression right away in blocking mode.  In non-blocking mode it is
+stored as a ``Pending`` operation on the output object and computed when the data is
+needed, such as by another operation or ``GrB_wait``.
+
+If an ``apply`` reads a pending object and overwrites that same object, the new step
+is appended to the object's chain, since nothing else can read the old value.  Chains
+such as ``C = apply(C)`` after ``C = eWiseAdd(A, B)`` are then computed in a single
+pass over the inputs.  Any other pending input is computed once and stored first.  A mask
+(if not complemented) is applied in the same pass, so values are only computed where
+they may be written.
+"""
+import numba
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from . import context
+from .kernels import (
+    csr_parts,
+    get_desc,
+    mask_pattern,
+    op_dtypes,
+    transpose,
+    typed_binaryop,
+    update,
+)
+
+# Kinds of steps in a chain
+UNARY = 0
+BIND_FIRST = 1
+BIND_SECOND = 2
+
+
+class Expr:
+    """Element-wise expression ``steps(a)`` or ``steps(binary(a, b))``"""
+
+    __slots__ = "a", "b", "binary", "union", "steps", "dtype"
+
+    def __init__(self, a, b=None, binary=None, union=False, steps=(), dtype=None):
+        self.a = a
+        self.b = b
+        self.binary = binary
+        self.union = union
+        self.steps = steps
+        self.dtype = a.dtype if dtype is None else dtype
+
+    @property
+    def shape(self):
+        return self.a.shape
+
+    @classmethod
+    def ewise(cls, a, b, op, *, union):
+        _, out_dtype = op_dtypes(op)
+        return cls(a, b, op, union, (), out_dtype)
+
+    def _then(self, kind, op, scalar, dtype):
+        steps = self.steps + ((kind, op, scalar),)
+        return Expr(self.a, self.b, self.binary, self.union, steps, dtype)
+
+    def cast(self, dtype):
+        dtype = np.dtype(dtype)
+        if dtype == self.dtype:
+            return self
+        return self._then(UNARY, _cast_to(dtype), 0, dtype)
+
+    def apply(self, op):
+        in_dtype, out_dtype = op_dtypes(op)
+        return self.cast(in_dtype)._then(UNARY, op, 0, out_dtype)
+
+    def bind(self, op, scalar, *, first):
+        in_dtype, out_dtype = op_dtypes(op)
+        kind = BIND_FIRST if first else BIND_SECOND
+        return self.cast(in_dtype)._then(kind, op, in_dtype.type(scalar), out_dtype)
+
+    def evaluate(self, mask=None, desc=None):
+        """Compute the csr_matrix, only where `mask` (not complemented) allows if given"""
+        a = self.a
+        nrows = a.shape[0]
+        if self.b is None:
+            a_indptr, a_indices, a_data = csr_parts(a)
+            b_indptr = np.zeros(nrows + 1, dtype=np.int64)
+            b_indices = np.empty(0, dtype=np.int64)
+            b_data = np.empty(0, dtype=a_data.dtype)
+            has_b = False
+            binary = typed_binaryop("SECOND", a_data.dtype)
+            to_out = _cast_to(a_data.dtype)
+        else:
+            in_dtype, out_dtype = op_dtypes(self.binary)
+            a_indptr, a_indices, a_data = csr_parts(a, in_dtype)
+            b_indptr, b_indices, b_data = csr_parts(self.b, in_dtype)
+            has_b = True
+            binary = self.binary
+            to_out = _cast_to(out_dtype)
+        if mask is None:
+            has_mask = False
+            m_indptr = np.zeros(nrows + 1, dtype=np.int64)
+            m_indices = np.empty(0, dtype=np.int64)
+        else:
+            has_mask = True
+            m_indptr, m_indices = mask_pattern(mask, get_desc(desc))
+        chain = _compile_chain(self.steps)
+        scalars = tuple(scalar for _, _, scalar in self.steps)
+        args = (
+            a_indptr,
+            a_indices,
+            a_data,
+            b_indptr,
+            b_indices,
+            b_data,
+            has_b,
+            binary,
+            self.union,
+            to_out,
+            chain,
+            scalars,
+            m_indptr,
+            m_indices,
+            has_mask,
+        )
+        counts = _fused_count(*args, np.empty(0, dtype=np.int64), np.empty(0, dtype=self.dtype))
+        indptr = np.zeros(nrows + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        indices = np.empty(indptr[-1], dtype=np.int64)
+        data = np.empty(indptr[-1], dtype=self.dtype)
+        _fused_fill(*args, indptr, indices, data)
+        return csr_matrix((data, indices, indptr), shape=a.shape)
+
+
+class Pending:
+    """The operation ``C<mask, replace> = C accum expr`` waiting to be computed"""
+
+    __slots__ = "expr", "mask", "accum", "desc"
+
+    def __init__(self, expr, mask, accum, desc):
+        self.expr = expr
+        self.mask = mask
+        self.accum = accum
+        self.desc = get_desc(desc)
+
+    @property
+    def overwrites(self):
+        """Whether the result replaces C without depending on its old value"""
+        return overwrites(self.mask, self.accum, self.desc)
+
+    def evaluate(self, C):
+        if self.mask is not None and not self.desc.mask_comp:
+            T = self.expr.evaluate(self.mask, self.desc)
+        else:
+            T = self.expr.evaluate()
+        return update(C, T, self.mask, self.accum, self.desc)
+
+
+def overwrites(mask, accum, desc):
+    """Whether ``C<mask, replace> = C accum T`` replaces C without depending on its old value"""
+    return mask is None and accum is None and not get_desc(desc).mask_comp
+
+
+def source(A, transposed=False, *, into=None):
+    """An Expr for the values of container A.
+
+    If A is `into`, the output that the Expr overwrites, A's pending chain is reused.
+    Otherwise a pending A is computed and stored, so other readers don't repeat it.
+    """
+    pending = A._pending
+    if A is into and pending is not None and pending.overwrites and not transposed:
+        return pending.expr
+    data = A._get_data()
+    return Expr(transpose(data) if transposed else data)
+
+
+def record(C, mask, accum, expr, desc):
+    """Compute ``C<mask, replace> = C accum expr`` now or, in non-blocking mode, later"""
+    pending = Pending(expr, mask, accum, desc)
+    if context.is_blocking():
+        C._set_data(pending.evaluate(C._get_data()))
+        return
+    if pending.overwrites:
+        # Cast to the dtype of C so other expressions may continue the chain
+        pending.expr = expr.cast(C._data.dtype)
+    else:
+        # Earlier operations on C must be done first
+        C._get_data()
+    C._pending = pending
+    context.pending_objects.add(C)
+
+
+_casts = {}
+_chains = {}
+
+
+def _cast_to(dtype):
+    """Get a jitted function that converts a value to `dtype`"""
+    dtype = np.dtype(dtype)
+    if dtype not in _casts:
+        np_type = dtype.type
+
+        @numba.njit
+        def cast(x):  # pragma: no cover
+            return np_type(x)
+
+        _casts[dtype] = cast
+    return _casts[dtype]
+
+
+@numba.njit
+def _identity(x, scalars):  # pragma: no cover
+    return x
+
+
+def _compose(inner, kind, op, k):
+    if kind == UNARY:
+
+        @numba.njit
+        def step(x, scalars):  # pragma: no cover
+            return op(inner(x, scalars))
+
+    elif kind == BIND_FIRST:
+
+        @numba.njit
+        def step(x, scalars):  # pragma: no cover
+            return op(scalars[k], inner(x, scalars))
+
+    else:
+
+        @numba.njit
+        def step(x, scalars):  # pragma: no cover
+            return op(inner(x, scalars), scalars[k])
+
+    return step
+
+
+def _compile_chain(steps):
+    """Compose the operators of a chain into one jitted function ``f(x, scalars)``"""
+    key = tuple((kind, op) for kind, op, _ in steps)
+    if key not in _chains:
+        func = _identity
+        for k, (kind, op) in enumerate(key):
+            func = _compose(func, kind, op, k)
+        _chains[key] = func
+    return _chains[key]
+
+
+@numba.njit
+def _fused_row(
+    i,
+    a_indptr,
+    a_indices,
+    a_data,
+    b_indptr,
+    b_indices,
+    b_data,
+    has_b,
+    binary,
+    union,
+    to_out,
+    chain,
+    scalars,
+    m_indptr,
+    m_indices,
+    has_mask,
+    out_indices,
+    out_data,
+    offset,
+    fill,
+):  # pragma: no cover
+    # Merge sorted row i of a and b (if given), skip entries outside the mask,
+    # and compute the chain for the rest.
+    pa = a_indptr[i]
+    a_end = a_indptr[i + 1]
+    pb = b_indptr[i]
+    b_end = b_indptr[i + 1]
+    pm = m_indptr[i]
+    m_end = m_indptr[i + 1]
+    count = 0
+    while pa < a_end or pb < b_end:
+        if pb >= b_end or pa < a_end and a_indices[pa] < b_indices[pb]:
+            j = a_indices[pa]
+            which = 0
+            pa += 1
+        elif pa >= a_end or b_indices[pb] < a_indices[pa]:
+            j = b_indices[pb]
+            which = 1
+            pb += 1
+        else:
+            j = a_indices[pa]
+            which = 2
+            pa += 1
+            pb += 1
+        if has_b and not union and which != 2:
+            continue
+        if has_mask:
+            while pm < m_end and m_indices[pm] < j:
+                pm += 1
+            if pm >= m_end or m_indices[pm] != j:
+                continue
+        if fill:
+            if which == 0:
+                val = to_out(a_data[pa - 1])
+            elif which == 1:
+                val = to_out(b_data[pb - 1])
+            else:
+                val = binary(a_data[pa - 1], b_data[pb - 1])
+            out_indices[offset + count] = j
+            out_data[offset + count] = chain(val, scalars)
+        count += 1
+    return count
+
+
+@numba.njit(parallel=True)
+def _fused_count(
+    a_indptr,
+    a_indices,
+    a_data,
+    b_indptr,
+    b_indices,
+    b_data,
+    has_b,
+    binary,
+    union,
+    to_out,
+    chain,
+    scalars,
+    m_indptr,
+    m_indices,
+    has_mask,
+    out_indices,
+    out_data,
+):  # pragma: no cover
+    nrows = a_indptr.size - 1
+    counts = np.empty(nrows, dtype=np.int64)
+    for i in numba.prange(nrows):
+        counts[i] = _fused_row(
+            i,
+            a_indptr,
+            a_indices,
+            a_data,
+            b_indptr,
+            b_indices,
+            b_data,
+            has_b,
+            binary,
+            union,
+            to_out,
+            chain,
+            scalars,
+            m_indptr,
+            m_indices,
+            has_mask,
+            out_indices,
+            out_data,
+            0,
+            False,
+        )
+    return counts
+
+
+@numba.njit(parallel=True)
+def _fused_fill(
+    a_indptr,
+    a_indices,
+    a_data,
+    b_indptr,
+    b_indices,
+    b_data,
+    has_b,
+    binary,
+    union,
+    to_out,
+    chain,
+    scalars,
+    m_indptr,
+    m_indices,
+    has_mask,
+    indptr,
+    out_indices,
+    out_data,
+):  # pragma: no cover
+    nrows = a_indptr.size - 1
+    for i in numba.prange(nrows):
+        _fused_row(
+            i,
+            a_indptr,
+            a_indices,
+            a_data,
+            b_indptr,
+            b_indices,
+            b_data,
+            has_b,
+            binary,
+            union,
+            to_out,
+            chain,
+            scalars,
+            m_indptr,
+            m_indices,
+            has_mask,
+            out_indices,
+            out_data,
+            indptr[i],
+            True,
+        )
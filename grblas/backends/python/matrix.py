@@ -2,9 +2,42 @@ import numba
 import numpy as np
 from scipy.sparse import csr_matrix
 
-from .base import BasePointer, GraphBlasContainer
+from .base import (
+    GxB_BY_ROW,
+    GxB_FORMAT,
+    GxB_SPARSE,
+    GxB_SPARSITY_STATUS,
+    BasePointer,
+    GraphBlasContainer,
+)
 from .context import handle_panic, return_error
-from .exceptions import GrB_Info
+from .exceptions import GrB_error, GrB_Info
+from .indexing import (
+    assign,
+    assign_row,
+    assign_scalar,
+    extract,
+    region_entries,
+    resolve_index,
+    select,
+    single_index,
+)
+from .kernels import (
+    build,
+    chunk_count,
+    compact,
+    csr_parts,
+    ewise,
+    get_desc,
+    mask_pattern,
+    op_dtypes,
+    reduce_rows,
+    reduce_scalar,
+    transpose,
+    typed_binaryop,
+    update,
+)
+from .lazy import Expr, overwrites, record, source
 
 
 class MatrixPtr(BasePointer):
@@ -15,7 +48,10 @@ class MatrixPtr(BasePointer):
 class Matrix(GraphBlasContainer):
     def __init__(self, matrix):
         assert isinstance(matrix, csr_matrix)
-        self.matrix = matrix
+        self._data = matrix
+        self._pending = None
+
+    matrix = property(GraphBlasContainer._get_data, GraphBlasContainer._set_data)
 
     @classmethod
     def new_from_dtype(cls, dtype, nrows, ncols):
@@ -24,7 +60,7 @@ class Matrix(GraphBlasContainer):
 
     @classmethod
     def new_from_existing(cls, other):
-        matrix = csr_matrix(other)
+        matrix = other.matrix.copy()
         return cls(matrix)
 
     @classmethod
@@ -34,10 +70,10 @@ class Matrix(GraphBlasContainer):
 
 @handle_panic
 def Matrix_new(A: MatrixPtr, dtype: type, nrows: int, ncols: int):
-    if nrows <= 0:
-        return_error(GrB_Info.GrB_INVALID_VALUE, "nrows must be > 0")
-    if ncols <= 0:
-        return_error(GrB_Info.GrB_INVALID_VALUE, "ncols must be > 0")
+    if nrows < 0:
+        return return_error(GrB_Info.GrB_INVALID_VALUE, "nrows must be >= 0")
+    if ncols < 0:
+        return return_error(GrB_Info.GrB_INVALID_VALUE, "ncols must be >= 0")
     matrix = Matrix.new_from_dtype(dtype, nrows, ncols)
     A.set_matrix(matrix)
     return GrB_Info.GrB_SUCCESS
@@ -52,103 +88,624 @@ def Matrix_dup(C: MatrixPtr, A: Matrix):
 
 @handle_panic
 def Matrix_resize(C: Matrix, nrows: int, ncols: int):
-    if nrows <= 0:
-        return_error(GrB_Info.GrB_INVALID_VALUE, "nrows must be > 0")
-    if ncols <= 0:
-        return_error(GrB_Info.GrB_INVALID_VALUE, "ncols must be > 0")
-    C.matrix.resize((nrows, ncols))
+    if nrows < 0:
+        return return_error(GrB_Info.GrB_INVALID_VALUE, "nrows must be >= 0")
+    if ncols < 0:
+        return return_error(GrB_Info.GrB_INVALID_VALUE, "ncols must be >= 0")
+    # Resize a copy, since pending operations may use the current matrix
+    matrix = C.matrix.copy()
+    matrix.resize((nrows, ncols))
+    C.matrix = matrix
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_free(A: MatrixPtr):
+    A.instance = None
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_wait(A: MatrixPtr):
+    A[0].wait()
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_error(error, A: Matrix):
+    error[0] = GrB_error() or ""
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_nrows(nrows, A: Matrix):
+    nrows[0] = A.matrix.shape[0]
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_ncols(ncols, A: Matrix):
+    ncols[0] = A.matrix.shape[1]
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_nvals(nvals, A: Matrix):
+    nvals[0] = A.matrix.nnz
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_clear(A: Matrix):
+    A.matrix = csr_matrix(A.matrix.shape, dtype=A.matrix.dtype)
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_build(C: Matrix, row_indices, col_indices, values, nvals, dup):
+    if C.matrix.nnz > 0:
+        return return_error(GrB_Info.GrB_OUTPUT_NOT_EMPTY, "C must be empty")
+    nrows, ncols = C.matrix.shape
+    rows = np.asarray(row_indices[:nvals], dtype=np.int64)
+    cols = np.asarray(col_indices[:nvals], dtype=np.int64)
+    if nvals > 0 and (rows.max() >= nrows or cols.max() >= ncols):
+        return return_error(GrB_Info.GrB_INDEX_OUT_OF_BOUNDS, "Index out of bounds")
+    values = np.asarray(values[:nvals], dtype=C.matrix.dtype)
+    C.matrix = build(C.matrix.shape, rows, cols, values, dup)
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_extractTuples(row_indices, col_indices, values, nvals, A: Matrix):
+    indptr, indices, data = csr_parts(A.matrix)
+    n = data.size
+    if nvals[0] < n:
+        return return_error(GrB_Info.GrB_INSUFFICIENT_SPACE, "Arrays are too small")
+    # Output arrays may be NULL
+    if row_indices is not None:
+        row_indices[:n] = np.repeat(np.arange(A.matrix.shape[0]), np.diff(indptr))
+    if col_indices is not None:
+        col_indices[:n] = indices
+    if values is not None:
+        values[:n] = data
+    nvals[0] = n
+    return GrB_Info.GrB_SUCCESS
+
+
+def _check_element(A, i, j):
+    nrows, ncols = A.matrix.shape
+    if not (0 <= i < nrows and 0 <= j < ncols):
+        return return_error(GrB_Info.GrB_INVALID_INDEX, f"Index ({i}, {j}) out of bounds")
+
+
+@handle_panic
+def Matrix_setElement(C: Matrix, x, i, j):
+    info = _check_element(C, i, j)
+    if info is not None:
+        return info
+    element = csr_matrix(([x], ([i], [j])), shape=C.matrix.shape, dtype=C.matrix.dtype)
+    C.matrix = ewise(C.matrix, element, typed_binaryop("SECOND", C.matrix.dtype), union=True)
     return GrB_Info.GrB_SUCCESS
 
 
-# TODO: this is just the essential code; it needs to handle descriptors, masks, accumulators, etc
 @handle_panic
-def mxm(C, A, B, semiring):
-    cr, cc = C.shape
-    ar, ac = A.shape
-    br, bc = B.shape
+def Matrix_extractElement(x, A: Matrix, i, j):
+    info = _check_element(A, i, j)
+    if info is not None:
+        return info
+    # Indices may be numpy.uint64, which numpy doesn't add to ints without casting
+    i = int(i)
+    j = int(j)
+    indptr, indices, data = csr_parts(A.matrix)
+    start = indptr[i]
+    p = start + np.searchsorted(indices[start : indptr[i + 1]], j)
+    if p < indptr[i + 1] and indices[p] == j:
+        x[0] = data[p]
+        return GrB_Info.GrB_SUCCESS
+    return GrB_Info.GrB_NO_VALUE
+
+
+@handle_panic
+def Matrix_Option_get(A: Matrix, field, value):
+    if field == GxB_FORMAT:
+        value[0] = GxB_BY_ROW
+    elif field == GxB_SPARSITY_STATUS:
+        value[0] = GxB_SPARSE
+    else:
+        return return_error(GrB_Info.GrB_INVALID_VALUE, f"Unsupported option field: {field}")
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_iso(iso, A: Matrix):
+    # Values are always stored explicitly
+    iso[0] = False
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_removeElement(C: Matrix, i, j):
+    info = _check_element(C, i, j)
+    if info is not None:
+        return info
+    nrows, ncols = C.matrix.shape
+    element = region_entries(C.matrix, single_index(i, nrows), single_index(j, ncols))
+    C.matrix = select(C.matrix, ~element)
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def mxm(C: Matrix, Mask, accum, semiring, A: Matrix, B: Matrix, desc):
+    desc = get_desc(desc)
+    a = A.matrix.T.tocsr() if desc.trans0 else A.matrix
+    b = B.matrix.T.tocsr() if desc.trans1 else B.matrix
+    cr, cc = C.matrix.shape
+    ar, ac = a.shape
+    br, bc = b.shape
     if cr != ar:
-        return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "C.nrows != A.nrows")
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "C.nrows != A.nrows")
     if cc != bc:
-        return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "C.ncols != B.ncols")
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "C.ncols != B.ncols")
     if ac != br:
-        return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "A.nrows != B.ncols")
-    b = B.tocsc()
-    d, i, ip = _sparse_matmul(
-        A.data,
-        A.indices,
-        A.indptr,
-        b.data,
-        b.indices,
-        b.indptr,
-        semiring.plus.op,
-        semiring.times,
-        semiring.plus.identity,
-        C.dtype,
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "A.ncols != B.nrows")
+    mask = None if Mask is None else Mask.matrix
+    T = matmul(a, b, semiring, mask, desc)
+    C.matrix = update(C.matrix, T, mask, accum, desc)
+    return GrB_Info.GrB_SUCCESS
+
+
+def _input(A, transposed):
+    return transpose(A.matrix) if transposed else A.matrix
+
+
+def _update_matrix(C, Mask, accum, T, desc):
+    if T.shape != C.matrix.shape:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "Output shape doesn't match")
+    if Mask is not None and Mask.matrix.shape != C.matrix.shape:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "Mask shape doesn't match")
+    C.matrix = update(C.matrix, T, None if Mask is None else Mask.matrix, accum, desc)
+    return GrB_Info.GrB_SUCCESS
+
+
+def _record_matrix(C, Mask, accum, expr, desc):
+    # Like _update_matrix, but the result may be computed later (see lazy.py)
+    if expr.shape != C._data.shape:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "Output shape doesn't match")
+    if Mask is not None and Mask.matrix.shape != C._data.shape:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "Mask shape doesn't match")
+    record(C, None if Mask is None else Mask.matrix, accum, expr, desc)
+    return GrB_Info.GrB_SUCCESS
+
+
+def _ewise(C, Mask, accum, op, A, B, desc, union):
+    desc = get_desc(desc)
+    a = _input(A, desc.trans0)
+    b = _input(B, desc.trans1)
+    if a.shape != b.shape:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "A.shape != B.shape")
+    return _record_matrix(C, Mask, accum, Expr.ewise(a, b, op, union=union), desc)
+
+
+@handle_panic
+def Matrix_eWiseAdd_BinaryOp(C: Matrix, Mask, accum, op, A: Matrix, B: Matrix, desc):
+    return _ewise(C, Mask, accum, op, A, B, desc, True)
+
+
+@handle_panic
+def Matrix_eWiseAdd_Monoid(C: Matrix, Mask, accum, monoid, A: Matrix, B: Matrix, desc):
+    return _ewise(C, Mask, accum, monoid.op, A, B, desc, True)
+
+
+@handle_panic
+def Matrix_eWiseMult_BinaryOp(C: Matrix, Mask, accum, op, A: Matrix, B: Matrix, desc):
+    return _ewise(C, Mask, accum, op, A, B, desc, False)
+
+
+@handle_panic
+def Matrix_eWiseMult_Monoid(C: Matrix, Mask, accum, monoid, A: Matrix, B: Matrix, desc):
+    return _ewise(C, Mask, accum, monoid.op, A, B, desc, False)
+
+
+@handle_panic
+def Matrix_apply(C: Matrix, Mask, accum, op, A: Matrix, desc):
+    desc = get_desc(desc)
+    into = C if overwrites(Mask, accum, desc) else None
+    expr = source(A, desc.trans0, into=into).apply(op)
+    return _record_matrix(C, Mask, accum, expr, desc)
+
+
+@handle_panic
+def Matrix_apply_BinaryOp1st(C: Matrix, Mask, accum, op, x, B: Matrix, desc):
+    desc = get_desc(desc)
+    into = C if overwrites(Mask, accum, desc) else None
+    expr = source(B, desc.trans1, into=into).bind(op, x, first=True)
+    return _record_matrix(C, Mask, accum, expr, desc)
+
+
+@handle_panic
+def Matrix_apply_BinaryOp2nd(C: Matrix, Mask, accum, op, A: Matrix, y, desc):
+    desc = get_desc(desc)
+    into = C if overwrites(Mask, accum, desc) else None
+    expr = source(A, desc.trans0, into=into).bind(op, y, first=False)
+    return _record_matrix(C, Mask, accum, expr, desc)
+
+
+@handle_panic
+def Matrix_reduce_Monoid(w, mask, accum, monoid, A: Matrix, desc):
+    desc = get_desc(desc)
+    T = reduce_rows(_input(A, desc.trans0), monoid)
+    if T.shape != w.vector.shape:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "w.size != A.nrows")
+    m = None if mask is None else mask.vector
+    w.vector = update(w.vector, T, m, accum, desc)
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_reduce_Scalar(s, accum, monoid, A: Matrix, desc):
+    val = reduce_scalar(A.matrix, monoid)
+    if accum is not None:
+        val = accum(s[0], val)
+    s[0] = val
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_transpose(C: Matrix, Mask, accum, A: Matrix, desc):
+    desc = get_desc(desc)
+    # A transposed input is transposed back, so it's copied as is
+    T = A.matrix.copy() if desc.trans0 else transpose(A.matrix)
+    return _update_matrix(C, Mask, accum, T, desc)
+
+
+@handle_panic
+def Matrix_extract(C: Matrix, Mask, accum, A: Matrix, row_indices, ni, col_indices, nj, desc):
+    desc = get_desc(desc)
+    a = _input(A, desc.trans0)
+    T = extract(
+        a, resolve_index(row_indices, ni, a.shape[0]), resolve_index(col_indices, nj, a.shape[1])
     )
-    C.data = d
-    C.indices = i
-    C.indptr = ip
+    return _update_matrix(C, Mask, accum, T, desc)
+
+
+def _assign_mask(C, mask, rows, cols, subassign):
+    # Return an error if the mask doesn't match; otherwise None
+    if mask is not None and mask.shape != ((rows.size, cols.size) if subassign else C.shape):
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "Mask shape doesn't match")
+
+
+def _assign(C, Mask, accum, A, row_indices, ni, col_indices, nj, desc, subassign):
+    desc = get_desc(desc)
+    a = _input(A, desc.trans0)
+    rows = resolve_index(row_indices, ni, C.matrix.shape[0])
+    cols = resolve_index(col_indices, nj, C.matrix.shape[1])
+    if a.shape != (rows.size, cols.size):
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "A.shape != (len(I), len(J))")
+    mask = None if Mask is None else Mask.matrix
+    info = _assign_mask(C.matrix, mask, rows, cols, subassign)
+    if info is not None:
+        return info
+    C.matrix = assign(C.matrix, a, rows, cols, mask, accum, desc, subassign=subassign)
     return GrB_Info.GrB_SUCCESS
 
 
-@numba.njit
-def _sparse_matmul(
-    a_data,
-    a_indices,
+def _assign_scalar(C, Mask, accum, x, row_indices, ni, col_indices, nj, desc, subassign):
+    desc = get_desc(desc)
+    rows = resolve_index(row_indices, ni, C.matrix.shape[0])
+    cols = resolve_index(col_indices, nj, C.matrix.shape[1])
+    mask = None if Mask is None else Mask.matrix
+    info = _assign_mask(C.matrix, mask, rows, cols, subassign)
+    if info is not None:
+        return info
+    C.matrix = assign_scalar(C.matrix, x, rows, cols, mask, accum, desc, subassign=subassign)
+    return GrB_Info.GrB_SUCCESS
+
+
+def _assign_row(C, mask, accum, u, i, col_indices, nj, desc, subassign, transposed):
+    # Assign to a row of C, or to a column if `transposed` is True
+    desc = get_desc(desc)
+    c = transpose(C.matrix) if transposed else C.matrix
+    cols = resolve_index(col_indices, nj, c.shape[1])
+    if u.vector.shape[1] != cols.size:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "u.size != len(J)")
+    m = None if mask is None else mask.vector
+    if m is not None and m.shape[1] != (cols.size if subassign else c.shape[1]):
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "mask size doesn't match")
+    c = assign_row(c, i, u.vector, cols, m, accum, desc, subassign=subassign)
+    C.matrix = transpose(c) if transposed else c
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Matrix_assign(C: Matrix, Mask, accum, A: Matrix, row_indices, ni, col_indices, nj, desc):
+    return _assign(C, Mask, accum, A, row_indices, ni, col_indices, nj, desc, False)
+
+
+@handle_panic
+def Matrix_subassign(C: Matrix, Mask, accum, A: Matrix, row_indices, ni, col_indices, nj, desc):
+    return _assign(C, Mask, accum, A, row_indices, ni, col_indices, nj, desc, True)
+
+
+@handle_panic
+def Matrix_assign_Scalar(C: Matrix, Mask, accum, x, row_indices, ni, col_indices, nj, desc):
+    return _assign_scalar(C, Mask, accum, x, row_indices, ni, col_indices, nj, desc, False)
+
+
+@handle_panic
+def Matrix_subassign_Scalar(C: Matrix, Mask, accum, x, row_indices, ni, col_indices, nj, desc):
+    return _assign_scalar(C, Mask, accum, x, row_indices, ni, col_indices, nj, desc, True)
+
+
+@handle_panic
+def Row_assign(C: Matrix, mask, accum, u, i, col_indices, nj, desc):
+    return _assign_row(C, mask, accum, u, i, col_indices, nj, desc, False, False)
+
+
+@handle_panic
+def Row_subassign(C: Matrix, mask, accum, u, i, col_indices, nj, desc):
+    return _assign_row(C, mask, accum, u, i, col_indices, nj, desc, True, False)
+
+
+@handle_panic
+def Col_assign(C: Matrix, mask, accum, u, row_indices, ni, j, desc):
+    return _assign_row(C, mask, accum, u, j, row_indices, ni, desc, False, True)
+
+
+@handle_panic
+def Col_subassign(C: Matrix, mask, accum, u, row_indices, ni, j, desc):
+    return _assign_row(C, mask, accum, u, j, row_indices, ni, desc, True, True)
+
+
+def matmul(a, b, semiring, mask=None, desc=None, *, flip=False):
+    """Compute ``T = a plus.times b`` for csr_matrix objects `a` and `b`.
+
+    If `mask` is given and not complemented, only entries allowed by the mask are
+    computed.  The masked product chooses between a dot product of each row of `a`
+    with the columns of `b` given by the mask, and a Gustavson saxpy that scatters
+    rows of `b` into a dense workspace, by estimating the work of each.
+
+    If `flip` is True, ``times(b_ij, a_ij)`` is used instead of ``times(a_ij, b_ij)``.
+    """
+    desc = get_desc(desc)
+    plus = semiring.plus.op
+    times = semiring.times
+    in_dtype, _ = op_dtypes(times)
+    _, out_dtype = op_dtypes(plus)
+    a_indptr, a_indices, a_data = csr_parts(a, in_dtype)
+    b_indptr, b_indices, b_data = csr_parts(b, in_dtype)
+    nrows = a.shape[0]
+    ncols = b.shape[1]
+    if mask is not None and not desc.mask_comp:
+        m_indptr, m_indices = mask_pattern(mask, desc)
+        data = np.empty(m_indices.size, dtype=out_dtype)
+        present = np.zeros(m_indices.size, dtype=bool)
+        # Estimate the work of saxpy (flops) and of dot products (merges)
+        flops = np.diff(b_indptr)[a_indices].sum()
+        mask_rows = np.repeat(np.arange(nrows), np.diff(m_indptr))
+        b_col_lengths = np.bincount(b_indices, minlength=ncols)
+        dot_work = np.diff(a_indptr)[mask_rows].sum() + b_col_lengths[m_indices].sum()
+        if dot_work + b_indices.size < flops:
+            bt_indptr, bt_indices, bt_data = csr_parts(b.tocsc(), in_dtype)
+            _dot_masked(
+                a_indptr,
+                a_indices,
+                a_data,
+                bt_indptr,
+                bt_indices,
+                bt_data,
+                m_indptr,
+                m_indices,
+                plus,
+                times,
+                flip,
+                data,
+                present,
+            )
+        else:
+            _saxpy_masked(
+                a_indptr,
+                a_indices,
+                a_data,
+                b_indptr,
+                b_indices,
+                b_data,
+                m_indptr,
+                m_indices,
+                ncols,
+                chunk_count(nrows),
+                plus,
+                times,
+                flip,
+                data,
+                present,
+            )
+        return compact((nrows, ncols), m_indptr, m_indices, data, present)
+    nchunks = chunk_count(nrows)
+    counts = _saxpy_count(a_indptr, a_indices, b_indptr, b_indices, ncols, nchunks)
+    indptr = np.zeros(nrows + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    indices = np.empty(indptr[-1], dtype=np.int64)
+    data = np.empty(indptr[-1], dtype=out_dtype)
+    _saxpy_fill(
+        a_indptr,
+        a_indices,
+        a_data,
+        b_indptr,
+        b_indices,
+        b_data,
+        ncols,
+        nchunks,
+        plus,
+        times,
+        flip,
+        indptr,
+        indices,
+        data,
+    )
+    return csr_matrix((data, indices, indptr), shape=(nrows, ncols))
+
+
+@numba.njit(parallel=True)
+def _saxpy_count(a_indptr, a_indices, b_indptr, b_indices, ncols, nchunks):  # pragma: no cover
+    nrows = a_indptr.size - 1
+    counts = np.empty(nrows, dtype=np.int64)
+    for chunk in numba.prange(nchunks):
+        marks = np.full(ncols, -1, dtype=np.int64)
+        for i in range(chunk * nrows // nchunks, (chunk + 1) * nrows // nchunks):
+            count = 0
+            for pa in range(a_indptr[i], a_indptr[i + 1]):
+                k = a_indices[pa]
+                for pb in range(b_indptr[k], b_indptr[k + 1]):
+                    j = b_indices[pb]
+                    if marks[j] != i:
+                        marks[j] = i
+                        count += 1
+            counts[i] = count
+    return counts
+
+
+@numba.njit(parallel=True)
+def _saxpy_fill(
     a_indptr,
-    b_data,
+    a_indices,
+    a_data,
+    b_indptr,
     b_indices,
+    b_data,
+    ncols,
+    nchunks,
+    plus,
+    times,
+    flip,
+    indptr,
+    out_indices,
+    out_data,
+):  # pragma: no cover
+    nrows = a_indptr.size - 1
+    for chunk in numba.prange(nchunks):
+        marks = np.full(ncols, -1, dtype=np.int64)
+        work = np.empty(ncols, dtype=out_data.dtype)
+        for i in range(chunk * nrows // nchunks, (chunk + 1) * nrows // nchunks):
+            start = indptr[i]
+            pos = start
+            for pa in range(a_indptr[i], a_indptr[i + 1]):
+                k = a_indices[pa]
+                a_val = a_data[pa]
+                for pb in range(b_indptr[k], b_indptr[k + 1]):
+                    j = b_indices[pb]
+                    if flip:
+                        val = times(b_data[pb], a_val)
+                    else:
+                        val = times(a_val, b_data[pb])
+                    if marks[j] != i:
+                        marks[j] = i
+                        work[j] = val
+                        out_indices[pos] = j
+                        pos += 1
+                    else:
+                        work[j] = plus(work[j], val)
+            out_indices[start:pos].sort()
+            for p in range(start, pos):
+                out_data[p] = work[out_indices[p]]
+
+
+@numba.njit(parallel=True)
+def _saxpy_masked(
+    a_indptr,
+    a_indices,
+    a_data,
     b_indptr,
+    b_indices,
+    b_data,
+    m_indptr,
+    m_indices,
+    ncols,
+    nchunks,
+    plus,
+    times,
+    flip,
+    out_data,
+    present,
+):  # pragma: no cover
+    # marks[j] == 2 * i means column j is allowed by the mask in row i,
+    # and marks[j] == 2 * i + 1 means it has also been computed.
+    nrows = a_indptr.size - 1
+    for chunk in numba.prange(nchunks):
+        marks = np.full(ncols, -1, dtype=np.int64)
+        work = np.empty(ncols, dtype=out_data.dtype)
+        for i in range(chunk * nrows // nchunks, (chunk + 1) * nrows // nchunks):
+            allowed = 2 * i
+            seen = allowed + 1
+            for pm in range(m_indptr[i], m_indptr[i + 1]):
+                marks[m_indices[pm]] = allowed
+            for pa in range(a_indptr[i], a_indptr[i + 1]):
+                k = a_indices[pa]
+                a_val = a_data[pa]
+                for pb in range(b_indptr[k], b_indptr[k + 1]):
+                    j = b_indices[pb]
+                    mark = marks[j]
+                    if mark != allowed and mark != seen:
+                        continue
+                    if flip:
+                        val = times(b_data[pb], a_val)
+                    else:
+                        val = times(a_val, b_data[pb])
+                    if mark == allowed:
+                        marks[j] = seen
+                        work[j] = val
+                    else:
+                        work[j] = plus(work[j], val)
+            for pm in range(m_indptr[i], m_indptr[i + 1]):
+                j = m_indices[pm]
+                if marks[j] == seen:
+                    out_data[pm] = work[j]
+                    present[pm] = True
+
+
+@numba.njit(parallel=True)
+def _dot_masked(
+    a_indptr,
+    a_indices,
+    a_data,
+    bt_indptr,
+    bt_indices,
+    bt_data,
+    m_indptr,
+    m_indices,
     plus,
     times,
-    identity,
-    dtype,
-):
-    # Final array size is unknown, so we give ourselves room and then adjust on the fly
-    tmp_output_size = a_data.size * 2
-    data = np.empty((tmp_output_size,), dtype=dtype)
-    indices = np.empty((tmp_output_size,), dtype=a_indices.dtype)
-    indptr = np.empty((a_indptr.size,), dtype=a_indptr.dtype)
-    output_counter = 0
-    for iptr in range(a_indptr.size - 1):
-        indptr[iptr] = output_counter
-        for jptr in range(b_indptr.size - 1):
-            a_counter = a_indptr[iptr]
-            a_stop = a_indptr[iptr + 1]
-            b_counter = b_indptr[jptr]
-            b_stop = b_indptr[jptr + 1]
-            val = identity
-            nonempty = False
-            while a_counter < a_stop and b_counter < b_stop:
-                a_k = a_indices[a_counter]
-                b_k = b_indices[b_counter]
-                if a_k == b_k:
-                    val = plus(val, times(a_data[a_counter], b_data[b_counter]))
-                    nonempty = True
-                    a_counter += 1
-                    b_counter += 1
-                elif a_k < b_k:
-                    a_counter += 1
+    flip,
+    out_data,
+    present,
+):  # pragma: no cover
+    # bt is the transpose of b (i.e., b in CSC format); merge sorted rows of a and bt
+    nrows = m_indptr.size - 1
+    for i in numba.prange(nrows):
+        a_start = a_indptr[i]
+        a_end = a_indptr[i + 1]
+        for pm in range(m_indptr[i], m_indptr[i + 1]):
+            j = m_indices[pm]
+            pa = a_start
+            pb = bt_indptr[j]
+            b_end = bt_indptr[j + 1]
+            found = False
+            while pa < a_end and pb < b_end:
+                ka = a_indices[pa]
+                kb = bt_indices[pb]
+                if ka == kb:
+                    if flip:
+                        val = times(bt_data[pb], a_data[pa])
+                    else:
+                        val = times(a_data[pa], bt_data[pb])
+                    if found:
+                        out_data[pm] = plus(out_data[pm], val)
+                    else:
+                        out_data[pm] = val
+                        found = True
+                    pa += 1
+                    pb += 1
+                elif ka < kb:
+                    pa += 1
                 else:
-                    b_counter += 1
-            if nonempty:
-                if output_counter >= tmp_output_size:
-                    # We filled up the allocated space; copy existing data to a larger array
-                    tmp_output_size *= 2
-                    new_data = np.empty((tmp_output_size,), dtype=data.dtype)
-                    new_indices = np.empty((tmp_output_size,), dtype=indices.dtype)
-                    new_data[:output_counter] = data[:output_counter]
-                    new_indices[:output_counter] = indices[:output_counter]
-                    data = new_data
-                    indices = new_indices
-                data[output_counter] = val
-                indices[output_counter] = jptr
-                output_counter += 1
-    # Add final entry to indptr (should indicate nnz in the output)
-    nnz = output_counter
-    indptr[iptr + 1] = nnz
-    # Trim output arrays
-    data = data[:nnz]
-    indices = indices[:nnz]
-
-    return (data, indices, indptr)
+                    pb += 1
+            present[pm] = found
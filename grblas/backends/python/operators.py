@@ -1,13 +1,16 @@
+import numpy as np
 from numba import njit
 from numba import types as nt
 
+from .context import handle_panic
+from .exceptions import GrB_Info
 from .types import GrB_Type
 
 
 class OpContainer:
-    def _compile(self, signatures, nosuffix=False):
+    def _compile(self, signatures, nosuffix=False, prefix="GrB"):
         def ncompiler(func):
-            funcname = f"GrB_{func.__name__.upper()}"
+            funcname = f"{prefix}_{func.__name__.upper()}"
             for sig in signatures:
                 if nosuffix:
                     typed_name = funcname
@@ -23,6 +26,8 @@ class OpContainer:
 
 GrB_UnaryOp = OpContainer()
 GrB_BinaryOp = OpContainer()
+GrB_Monoid = OpContainer()
+GrB_Semiring = OpContainer()
 
 
 ##################################
@@ -219,6 +224,18 @@ def second(x, y):
     return y
 
 
+@GrB_BinaryOp._compile(_binary_all, prefix="GxB")
+def any(x, y):
+    """Either argument (the second is used)"""
+    return y
+
+
+@GrB_BinaryOp._compile(_binary_all, prefix="GxB")
+def pair(x, y):
+    """One"""
+    return 1
+
+
 @GrB_BinaryOp._compile(_binary_int + _binary_float)
 def min(x, y):
     """Minimum"""
@@ -265,3 +282,62 @@ class Semiring:
     def __init__(self, plus_monoid, times_operator):
         self.plus = plus_monoid
         self.times = times_operator
+
+
+@handle_panic
+def Monoid_new(monoid, op, identity):
+    monoid[0] = Monoid(op, identity)
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Semiring_new(semiring, add: Monoid, multiply):
+    semiring[0] = Semiring(add, multiply)
+    return GrB_Info.GrB_SUCCESS
+
+
+##############################
+# Built-in Monoids and Semirings
+##############################
+def _identities(name):
+    # The identity of each monoid with numeric types
+    for typ in GrB_Type.types:
+        if typ == "BOOL":
+            continue
+        dtype = getattr(GrB_Type, f"GrB_{typ}")
+        if name == "PLUS":
+            yield typ, dtype(0)
+        elif name == "TIMES":
+            yield typ, dtype(1)
+        elif typ.startswith("FP"):
+            yield typ, dtype(np.inf if name == "MIN" else -np.inf)
+        else:
+            info = np.iinfo(dtype)
+            yield typ, dtype(info.max if name == "MIN" else info.min)
+
+
+for _name in ["PLUS", "TIMES", "MIN", "MAX"]:
+    for _typ, _identity in _identities(_name):
+        _monoid = Monoid(getattr(GrB_BinaryOp, f"GrB_{_name}_{_typ}"), _identity)
+        setattr(GrB_Monoid, f"GrB_{_name}_MONOID_{_typ}", _monoid)
+        if _name == "TIMES":
+            continue
+        for _mult in ["PLUS", "TIMES", "FIRST", "SECOND", "MIN", "MAX"]:
+            _semiring = Semiring(_monoid, getattr(GrB_BinaryOp, f"GrB_{_mult}_{_typ}"))
+            setattr(GrB_Semiring, f"GrB_{_name}_{_mult}_SEMIRING_{_typ}", _semiring)
+for _name, _identity in [("LOR", False), ("LAND", True), ("LXOR", False), ("LXNOR", True)]:
+    _monoid = Monoid(getattr(GrB_BinaryOp, f"GrB_{_name}"), np.bool_(_identity))
+    setattr(GrB_Monoid, f"GrB_{_name}_MONOID_BOOL", _monoid)
+    for _mult in ["LOR", "LAND"]:
+        _semiring = Semiring(_monoid, getattr(GrB_BinaryOp, f"GrB_{_mult}"))
+        setattr(GrB_Semiring, f"GrB_{_name}_{_mult}_SEMIRING_BOOL", _semiring)
+for _typ in GrB_Type.types:
+    _monoid = Monoid(getattr(GrB_BinaryOp, f"GxB_ANY_{_typ}"), getattr(GrB_Type, f"GrB_{_typ}")(0))
+    setattr(GrB_Monoid, f"GxB_ANY_{_typ}_MONOID", _monoid)
+    _semiring = Semiring(_monoid, getattr(GrB_BinaryOp, f"GxB_PAIR_{_typ}"))
+    setattr(GrB_Semiring, f"GxB_ANY_PAIR_{_typ}", _semiring)
+    if _typ != "BOOL":
+        _monoid = getattr(GrB_Monoid, f"GrB_PLUS_MONOID_{_typ}")
+        _semiring = Semiring(_monoid, getattr(GrB_BinaryOp, f"GxB_PAIR_{_typ}"))
+        setattr(GrB_Semiring, f"GxB_PLUS_PAIR_{_typ}", _semiring)
+del _name, _typ, _identity, _monoid, _mult, _semiring
@@ -25,7 +25,7 @@ class GrB_Type:
 GrB_Type = GrB_Type()
 #                                 name     numpy dtype  numba type
 for name, dtype, numba_type in [
-    ("BOOL", np.bool, nt.boolean),
+    ("BOOL", np.bool_, nt.boolean),
     ("INT8", np.int8, nt.int8),
     ("UINT8", np.uint8, nt.uint8),
     ("INT16", np.int16, nt.int16),
@@ -1,8 +1,34 @@
+import numpy as np
 from scipy.sparse import csr_matrix
 
-from .base import BasePointer, GraphBlasContainer
+from .base import GxB_SPARSE, GxB_SPARSITY_STATUS, BasePointer, GraphBlasContainer
 from .context import handle_panic, return_error
-from .exceptions import GrB_Info
+from .exceptions import GrB_error, GrB_Info
+from .indexing import (
+    assign,
+    assign_scalar,
+    extract,
+    region_entries,
+    resolve_index,
+    select,
+    single_index,
+    vector_row,
+)
+from .kernels import (
+    build,
+    compact,
+    csr_parts,
+    ewise,
+    get_desc,
+    mask_pattern,
+    op_dtypes,
+    reduce_scalar,
+    transpose,
+    typed_binaryop,
+    update,
+)
+from .lazy import Expr, overwrites, record, source
+from .matrix import _dot_masked, matmul
 
 
 class VectorPtr(BasePointer):
@@ -13,7 +39,10 @@ class VectorPtr(BasePointer):
 class Vector(GraphBlasContainer):
     def __init__(self, vector):
         assert isinstance(vector, csr_matrix)
-        self.vector = vector
+        self._data = vector
+        self._pending = None
+
+    vector = property(GraphBlasContainer._get_data, GraphBlasContainer._set_data)
 
     @classmethod
     def new_from_dtype(cls, dtype, nsize):
@@ -22,7 +51,7 @@ class Vector(GraphBlasContainer):
 
     @classmethod
     def new_from_existing(cls, other):
-        vector = csr_matrix(other)
+        vector = other.vector.copy()
         return cls(vector)
 
     @classmethod
@@ -32,8 +61,8 @@ class Vector(GraphBlasContainer):
 
 @handle_panic
 def Vector_new(A: VectorPtr, dtype: type, nsize: int):
-    if nsize <= 0:
-        return_error(GrB_Info.GrB_INVALID_VALUE, "nsize must be > 0")
+    if nsize < 0:
+        return return_error(GrB_Info.GrB_INVALID_VALUE, "nsize must be >= 0")
     vector = Vector.new_from_dtype(dtype, nsize)
     A.set_vector(vector)
     return GrB_Info.GrB_SUCCESS
@@ -48,7 +77,347 @@ def Vector_dup(C: VectorPtr, A: Vector):
 
 @handle_panic
 def Vector_resize(C: Vector, nsize: int):
-    if nsize <= 0:
-        return_error(GrB_Info.GrB_INVALID_VALUE, "nsize must be > 0")
-    C.vector.resize((1, nsize))
+    if nsize < 0:
+        return return_error(GrB_Info.GrB_INVALID_VALUE, "nsize must be >= 0")
+    # Resize a copy, since pending operations may use the current vector
+    vector = C.vector.copy()
+    vector.resize((1, nsize))
+    C.vector = vector
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_free(v: VectorPtr):
+    v.instance = None
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_wait(v: VectorPtr):
+    v[0].wait()
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_error(error, v: Vector):
+    error[0] = GrB_error() or ""
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_size(nsize, v: Vector):
+    nsize[0] = v.vector.shape[1]
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_nvals(nvals, v: Vector):
+    nvals[0] = v.vector.nnz
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_clear(v: Vector):
+    v.vector = csr_matrix(v.vector.shape, dtype=v.vector.dtype)
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_build(w: Vector, indices, values, nvals, dup):
+    if w.vector.nnz > 0:
+        return return_error(GrB_Info.GrB_OUTPUT_NOT_EMPTY, "w must be empty")
+    cols = np.asarray(indices[:nvals], dtype=np.int64)
+    if nvals > 0 and cols.max() >= w.vector.shape[1]:
+        return return_error(GrB_Info.GrB_INDEX_OUT_OF_BOUNDS, "Index out of bounds")
+    rows = np.zeros(nvals, dtype=np.int64)
+    values = np.asarray(values[:nvals], dtype=w.vector.dtype)
+    w.vector = build(w.vector.shape, rows, cols, values, dup)
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_extractTuples(indices, values, nvals, v: Vector):
+    _, v_indices, data = csr_parts(v.vector)
+    n = data.size
+    if nvals[0] < n:
+        return return_error(GrB_Info.GrB_INSUFFICIENT_SPACE, "Arrays are too small")
+    # Output arrays may be NULL
+    if indices is not None:
+        indices[:n] = v_indices
+    if values is not None:
+        values[:n] = data
+    nvals[0] = n
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_setElement(w: Vector, x, i):
+    if not 0 <= i < w.vector.shape[1]:
+        return return_error(GrB_Info.GrB_INVALID_INDEX, f"Index {i} out of bounds")
+    element = csr_matrix(([x], ([0], [i])), shape=w.vector.shape, dtype=w.vector.dtype)
+    w.vector = ewise(w.vector, element, typed_binaryop("SECOND", w.vector.dtype), union=True)
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_extractElement(x, v: Vector, i):
+    if not 0 <= i < v.vector.shape[1]:
+        return return_error(GrB_Info.GrB_INVALID_INDEX, f"Index {i} out of bounds")
+    _, indices, data = csr_parts(v.vector)
+    p = np.searchsorted(indices, i)
+    if p < indices.size and indices[p] == i:
+        x[0] = data[p]
+        return GrB_Info.GrB_SUCCESS
+    return GrB_Info.GrB_NO_VALUE
+
+
+@handle_panic
+def Vector_Option_get(v: Vector, field, value):
+    if field == GxB_SPARSITY_STATUS:
+        value[0] = GxB_SPARSE
+    else:
+        return return_error(GrB_Info.GrB_INVALID_VALUE, f"Unsupported option field: {field}")
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_iso(iso, v: Vector):
+    # Values are always stored explicitly
+    iso[0] = False
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_removeElement(w: Vector, i):
+    if not 0 <= i < w.vector.shape[1]:
+        return return_error(GrB_Info.GrB_INVALID_INDEX, f"Index {i} out of bounds")
+    element = region_entries(w.vector, vector_row(), single_index(i, w.vector.shape[1]))
+    w.vector = select(w.vector, ~element)
+    return GrB_Info.GrB_SUCCESS
+
+
+def _update_vector(w, mask, accum, T, desc):
+    if mask is not None and mask.vector.shape != w.vector.shape:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "mask.size != w.size")
+    w.vector = update(w.vector, T, None if mask is None else mask.vector, accum, desc)
+    return GrB_Info.GrB_SUCCESS
+
+
+def _record_vector(w, mask, accum, expr, desc):
+    # Like _update_vector, but the result may be computed later (see lazy.py)
+    if expr.shape != w._data.shape:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "u.size != w.size")
+    if mask is not None and mask.vector.shape != w._data.shape:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "mask.size != w.size")
+    record(w, None if mask is None else mask.vector, accum, expr, desc)
+    return GrB_Info.GrB_SUCCESS
+
+
+def _ewise(w, mask, accum, op, u, v, desc, union):
+    if u.vector.shape != v.vector.shape or u.vector.shape != w.vector.shape:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "Vector sizes don't match")
+    return _record_vector(w, mask, accum, Expr.ewise(u.vector, v.vector, op, union=union), desc)
+
+
+@handle_panic
+def Vector_eWiseAdd_BinaryOp(w: Vector, mask, accum, op, u: Vector, v: Vector, desc):
+    return _ewise(w, mask, accum, op, u, v, desc, True)
+
+
+@handle_panic
+def Vector_eWiseAdd_Monoid(w: Vector, mask, accum, monoid, u: Vector, v: Vector, desc):
+    return _ewise(w, mask, accum, monoid.op, u, v, desc, True)
+
+
+@handle_panic
+def Vector_eWiseMult_BinaryOp(w: Vector, mask, accum, op, u: Vector, v: Vector, desc):
+    return _ewise(w, mask, accum, op, u, v, desc, False)
+
+
+@handle_panic
+def Vector_eWiseMult_Monoid(w: Vector, mask, accum, monoid, u: Vector, v: Vector, desc):
+    return _ewise(w, mask, accum, monoid.op, u, v, desc, False)
+
+
+@handle_panic
+def Vector_apply(w: Vector, mask, accum, op, u: Vector, desc):
+    into = w if overwrites(mask, accum, desc) else None
+    return _record_vector(w, mask, accum, source(u, into=into).apply(op), desc)
+
+
+@handle_panic
+def Vector_apply_BinaryOp1st(w: Vector, mask, accum, op, x, u: Vector, desc):
+    into = w if overwrites(mask, accum, desc) else None
+    return _record_vector(w, mask, accum, source(u, into=into).bind(op, x, first=True), desc)
+
+
+@handle_panic
+def Vector_apply_BinaryOp2nd(w: Vector, mask, accum, op, u: Vector, y, desc):
+    into = w if overwrites(mask, accum, desc) else None
+    return _record_vector(w, mask, accum, source(u, into=into).bind(op, y, first=False), desc)
+
+
+@handle_panic
+def Vector_reduce_Scalar(s, accum, monoid, u: Vector, desc):
+    val = reduce_scalar(u.vector, monoid)
+    if accum is not None:
+        val = accum(s[0], val)
+    s[0] = val
     return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_extract(w: Vector, mask, accum, u: Vector, indices, ni, desc):
+    index = resolve_index(indices, ni, u.vector.shape[1])
+    if w.vector.shape[1] != index.size:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "w.size != len(I)")
+    return _update_vector(w, mask, accum, extract(u.vector, vector_row(), index), desc)
+
+
+@handle_panic
+def Col_extract(w: Vector, mask, accum, A, indices, ni, j, desc):
+    desc = get_desc(desc)
+    # Column j of A is row j of A.T, and A.T transposed is A
+    a = A.matrix if desc.trans0 else transpose(A.matrix)
+    index = resolve_index(indices, ni, a.shape[1])
+    if w.vector.shape[1] != index.size:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "w.size != len(I)")
+    T = extract(a, single_index(j, a.shape[0]), index)
+    return _update_vector(w, mask, accum, T, desc)
+
+
+def _assign_mask(w, mask, index, subassign):
+    # Return an error if the mask doesn't match; otherwise None
+    if mask is not None and mask.vector.shape[1] != (
+        index.size if subassign else w.vector.shape[1]
+    ):
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "mask size doesn't match")
+
+
+def _assign_vector(w, mask, accum, u, indices, ni, desc, subassign):
+    desc = get_desc(desc)
+    index = resolve_index(indices, ni, w.vector.shape[1])
+    if u.vector.shape[1] != index.size:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "u.size != len(I)")
+    info = _assign_mask(w, mask, index, subassign)
+    if info is not None:
+        return info
+    m = None if mask is None else mask.vector
+    w.vector = assign(w.vector, u.vector, vector_row(), index, m, accum, desc, subassign=subassign)
+    return GrB_Info.GrB_SUCCESS
+
+
+def _assign_scalar(w, mask, accum, x, indices, ni, desc, subassign):
+    desc = get_desc(desc)
+    index = resolve_index(indices, ni, w.vector.shape[1])
+    info = _assign_mask(w, mask, index, subassign)
+    if info is not None:
+        return info
+    m = None if mask is None else mask.vector
+    w.vector = assign_scalar(w.vector, x, vector_row(), index, m, accum, desc, subassign=subassign)
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def Vector_assign(w: Vector, mask, accum, u: Vector, indices, ni, desc):
+    return _assign_vector(w, mask, accum, u, indices, ni, desc, False)
+
+
+@handle_panic
+def Vector_subassign(w: Vector, mask, accum, u: Vector, indices, ni, desc):
+    return _assign_vector(w, mask, accum, u, indices, ni, desc, True)
+
+
+@handle_panic
+def Vector_assign_Scalar(w: Vector, mask, accum, x, indices, ni, desc):
+    return _assign_scalar(w, mask, accum, x, indices, ni, desc, False)
+
+
+@handle_panic
+def Vector_subassign_Scalar(w: Vector, mask, accum, x, indices, ni, desc):
+    return _assign_scalar(w, mask, accum, x, indices, ni, desc, True)
+
+
+@handle_panic
+def mxv(w: Vector, mask, accum, semiring, A, u: Vector, desc):
+    desc = get_desc(desc)
+    a = A.matrix
+    nrows, ncols = a.shape
+    if desc.trans0:
+        nrows, ncols = ncols, nrows
+    if w.vector.shape[1] != nrows:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "w.size != A.nrows")
+    if u.vector.shape[1] != ncols:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "u.size != A.ncols")
+    m = None if mask is None else mask.vector
+    if desc.trans0:
+        # w' = u' A, computed as a row times a matrix
+        T = matmul(u.vector, a, semiring, m, desc, flip=True)
+    else:
+        T = _rows_dot(a, u.vector, semiring, m, desc, flip=False)
+    w.vector = update(w.vector, T, m, accum, desc)
+    return GrB_Info.GrB_SUCCESS
+
+
+@handle_panic
+def vxm(w: Vector, mask, accum, semiring, u: Vector, A, desc):
+    desc = get_desc(desc)
+    a = A.matrix
+    nrows, ncols = a.shape
+    if desc.trans1:
+        nrows, ncols = ncols, nrows
+    if w.vector.shape[1] != ncols:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "w.size != A.ncols")
+    if u.vector.shape[1] != nrows:
+        return return_error(GrB_Info.GrB_DIMENSION_MISMATCH, "u.size != A.nrows")
+    m = None if mask is None else mask.vector
+    if desc.trans1:
+        # w = A u, computed as dot products of the rows of A with u
+        T = _rows_dot(a, u.vector, semiring, m, desc, flip=True)
+    else:
+        T = matmul(u.vector, a, semiring, m, desc)
+    w.vector = update(w.vector, T, m, accum, desc)
+    return GrB_Info.GrB_SUCCESS
+
+
+def _rows_dot(a, u, semiring, mask, desc, *, flip):
+    """Compute the dot product of each row of `a` with `u` and return a 1-row csr_matrix.
+
+    This treats `u` as the single column of a CSC matrix and uses the masked dot
+    product kernel with a mask of the rows to compute.
+    """
+    plus = semiring.plus.op
+    times = semiring.times
+    in_dtype, _ = op_dtypes(times)
+    _, out_dtype = op_dtypes(plus)
+    a_indptr, a_indices, a_data = csr_parts(a, in_dtype)
+    u_indptr, u_indices, u_data = csr_parts(u, in_dtype)
+    nrows = a.shape[0]
+    if mask is not None and not desc.mask_comp:
+        _, rows = mask_pattern(mask, desc)
+    else:
+        rows = np.arange(nrows)
+    # A mask with one column and the allowed rows
+    m_indptr = np.zeros(nrows + 1, dtype=np.int64)
+    m_indptr[rows + 1] = 1
+    np.cumsum(m_indptr, out=m_indptr)
+    m_indices = np.zeros(rows.size, dtype=np.int64)
+    data = np.empty(rows.size, dtype=out_dtype)
+    present = np.zeros(rows.size, dtype=bool)
+    _dot_masked(
+        a_indptr,
+        a_indices,
+        a_data,
+        u_indptr,
+        u_indices,
+        u_data,
+        m_indptr,
+        m_indices,
+        plus,
+        times,
+        flip,
+        data,
+        present,
+    )
+    T = compact((nrows, 1), m_indptr, m_indices, data, present)
+    return csr_matrix(T.T)
@@ -1,4 +1,6 @@
 from contextvars import ContextVar
+from random import random
+from time import perf_counter_ns
 
 from . import config, ffi
 from . import replace as replace_singleton
@@ -14,6 +16,8 @@ NULL = ffi.NULL
 CData = ffi.CData
 _recorder = ContextVar("recorder")
 _prev_recorder = None
+_call_hooks = ()  # tuple of (func, sample_rate); see grblas.hooks
+_memory_tracker = None  # see grblas.ss.enable_memory_tracking
 
 
 def record_raw(text):
@@ -25,6 +29,15 @@ def record_raw(text):
 def call(cfunc_name, args):
     call_args = [getattr(x, "_carg", x) if x is not None else NULL for x in args]
     cfunc = libget(cfunc_name)
+    rec = _recorder.get(_prev_recorder)
+    if rec is not None and rec.instrument:
+        info = rec._begin_call(args)
+        info.start = perf_counter_ns()
+    else:
+        info = None
+    hooks = _call_hooks and [hook for hook, rate in _call_hooks if rate >= 1 or random() < rate]
+    if hooks:
+        start = perf_counter_ns()
     try:
         err_code = cfunc(*call_args)
     except TypeError as exc:
@@ -40,17 +53,21 @@ def call(cfunc_name, args):
             f" - C signature: {sig}\n"
             f" - Error: {exc}"
         )
+    if info is not None:
+        info.duration = perf_counter_ns() - info.start
+    if hooks:
+        duration = (perf_counter_ns() - start) / 1e9
+        for hook in hooks:
+            hook(cfunc_name, duration, err_code)
     try:
         rv = check_status(err_code, args)
     except Exception as exc:
         # Record calls that fail for easier debugging
-        rec = _recorder.get(_prev_recorder)
         if rec is not None:
-            rec.record(cfunc_name, args, exc=exc)
+            rec.record(cfunc_name, args, exc=exc, info=info)
         raise
-    rec = _recorder.get(_prev_recorder)
     if rec is not None:
-        rec.record(cfunc_name, args)
+        rec.record(cfunc_name, args, info=info)
     return rv
 
 
@@ -186,6 +203,8 @@ class BaseType:
         self.gb_obj = gb_obj
         self.dtype = lookup_dtype(dtype)
         self.name = name
+        if _memory_tracker is not None and not self._is_scalar:
+            _memory_tracker.add(self)
 
     def __call__(
         self, *optional_mask_accum_replace, mask=None, accum=None, replace=False, input_mask=None
@@ -429,11 +448,11 @@ class BaseType:
             output_replace=replace,
         )
         if self._is_scalar:
-            is_fake_scalar = delayed.method_name == "inner"
-            if is_fake_scalar:
-                from .vector import Vector
+            is_vector_output = delayed.method_name == "inner"
+            if is_vector_output:
+                from .scalar import _as_vector, _from_vector
 
-                fake_self = Vector.new(self.dtype, size=1)
+                fake_self = _as_vector(self, with_value=accum is not None)
                 args = [fake_self, mask, accum]
                 cfunc_name = delayed.cfunc_name
             else:
@@ -449,9 +468,10 @@ class BaseType:
         # Make the GraphBLAS call
         call(cfunc_name, args)
         if self._is_scalar:
-            if is_fake_scalar:
-                self.value = fake_self[0].value
-            self._is_empty = False
+            if is_vector_output:
+                _from_vector(self, fake_self)
+            else:
+                self._is_empty = False
 
     @property
     def _name_html(self):
@@ -0,0 +1,498 @@
+"""Chunked Matrix and Vector objects whose chunks are grblas objects computed with dask.
+
+Each chunk of a ``grblas.dask.Matrix`` is a ``grblas.Matrix`` tile (see
+``Matrix.ss.split``), and each chunk of a ``grblas.dask.Vector`` is a
+``grblas.Vector``.  Operations build a dask task graph one task per tile, and
+``compute`` runs the graph with a local dask scheduler (``scheduler="threads"``
+or ``scheduler="processes"`` for multi-process scale-out) and assembles the result.
+
+**THIS API IS EXPERIMENTAL AND MAY CHANGE**
+"""
+import itertools
+
+import numpy as np
+
+from . import Matrix as _Matrix
+from . import Vector as _Vector
+from . import binary, monoid, semiring, unary
+from ._ss.matrix import get_reduce_monoid, normalize_chunks, reduce_tiles_scalar
+from .base import _expect_op, _expect_type
+from .exceptions import DimensionMismatch
+from .matrix import TransposedMatrix
+from .operator import get_typed_op
+from .scalar import Scalar
+
+try:
+    import dask
+except ImportError:  # pragma: no cover
+    dask = None
+
+
+def _require_dask():
+    if dask is None:  # pragma: no cover
+        raise ImportError("dask is required for grblas.dask")
+
+
+class _dask_matrix:
+    """Used in `_expect_type` by classmethods"""
+
+
+class _dask_vector:
+    """Used in `_expect_type` by classmethods"""
+
+
+_dask_matrix.__name__ = "Matrix"
+_dask_matrix = _dask_matrix()
+_dask_vector.__name__ = "Vector"
+_dask_vector = _dask_vector()
+
+
+def _offsets(sizes):
+    return np.cumsum([0] + list(sizes)).tolist()
+
+
+_OPCLASS_MODULES = {
+    "UnaryOp": unary,
+    "BinaryOp": binary,
+    "Monoid": monoid,
+    "Semiring": semiring,
+}
+
+
+def _lookup_op(opclass, name, type_name):
+    op = _OPCLASS_MODULES[opclass]
+    for attr in name.split("."):
+        op = getattr(op, attr)
+    return _OpRef(op[type_name])
+
+
+class _OpRef:
+    """Typed operator passed to tasks; pickled by name so tasks can run in other processes"""
+
+    __slots__ = "op"
+
+    def __init__(self, op):
+        self.op = op
+
+    def __reduce__(self):
+        op = self.op
+        return _lookup_op, (op.opclass, op.name, op.type.name)
+
+
+def _finalize(x):
+    # Complete any pending work so the result may be shared between threads
+    x.wait()
+    return x
+
+
+##############
+# Tile tasks #
+##############
+def _ewise_add(a, b, op, require_monoid):
+    op = op.op
+    return _finalize(a.ewise_add(b, op, require_monoid=require_monoid).new())
+
+
+def _ewise_mult(a, b, op):
+    op = op.op
+    return _finalize(a.ewise_mult(b, op).new())
+
+
+def _apply(x, op, right, left):
+    op = op.op
+    return _finalize(x.apply(op, right=right, left=left).new())
+
+
+def _sum_products(pairs, op, method, output):
+    """Accumulate ``x.method(y, op)`` for each ``(x, y)`` pair into `output`"""
+    for x, y in pairs:
+        if x._nvals > 0 and y._nvals > 0:
+            output(op.monoid) << getattr(x, method)(y, op)
+    return _finalize(output)
+
+
+def _mxm_tile(a_tiles, b_tiles, op, nrows, ncols):
+    op = op.op
+    output = _Matrix.new(op.return_type, nrows, ncols)
+    return _sum_products(zip(a_tiles, b_tiles), op, "mxm", output)
+
+
+def _mxv_tile(a_tiles, v_chunks, op, size):
+    op = op.op
+    output = _Vector.new(op.return_type, size)
+    return _sum_products(zip(a_tiles, v_chunks), op, "mxv", output)
+
+
+def _vxm_tile(v_chunks, a_tiles, op, size):
+    op = op.op
+    output = _Vector.new(op.return_type, size)
+    return _sum_products(zip(v_chunks, a_tiles), op, "vxm", output)
+
+
+def _reduce_tiles(tiles, op, method, size):
+    op = op.op
+    output = _Vector.new(op.return_type, size)
+    for tile in tiles:
+        if tile._nvals > 0:
+            output(op) << getattr(tile, method)(op)
+    return _finalize(output)
+
+
+def _reduce_scalar(chunks, op):
+    return reduce_tiles_scalar(chunks, op.op)
+
+
+def _split_matrix(matrix, tile_nrows, tile_ncols):
+    # SS, SuiteSparse-specific: split
+    return [[_finalize(tile) for tile in row] for row in matrix.ss.split([tile_nrows, tile_ncols])]
+
+
+def _split_vector(vector, chunks):
+    offsets = _offsets(chunks)
+    return [_finalize(vector[start:stop].new()) for start, stop in zip(offsets, offsets[1:])]
+
+
+def _concat_matrix(tiles, dtype, name):
+    from .ss import concat
+
+    # SS, SuiteSparse-specific: concat
+    return concat(tiles, dtype, name=name)
+
+
+def _concat_vector(chunks, dtype, size, name):
+    rv = _Vector.new(dtype, size, name=name)
+    start = 0
+    for chunk in chunks:
+        stop = start + chunk._size
+        if chunk._nvals > 0:
+            rv[start:stop] = chunk
+        start = stop
+    return rv
+
+
+def _check_chunks(self, other, self_chunks, other_chunks, within):
+    if self_chunks != other_chunks:
+        raise DimensionMismatch(
+            f"Chunks must match for {type(self).__name__}.{within}; got "
+            f"{self_chunks} and {other_chunks}.  Use `rechunk` to change the chunks."
+        )
+
+
+class Matrix:
+    """A Matrix split into a 2D grid of ``grblas.Matrix`` tiles computed with dask.
+
+    Create with ``grblas.dask.Matrix.from_matrix(A, chunks)``; `chunks` is
+    interpreted the same as in ``Matrix.ss.split``.  Operations return new
+    lazy objects.  Use ``compute`` to get a ``grblas.Matrix``.
+
+    **THIS API IS EXPERIMENTAL AND MAY CHANGE**
+    """
+
+    __slots__ = "_tiles", "dtype", "_nrows", "_ncols", "_chunks", "name"
+    _name_counter = itertools.count()
+
+    def __init__(self, tiles, dtype, chunks, *, name=None):
+        _require_dask()
+        if name is None:
+            name = f"DM_{next(Matrix._name_counter)}"
+        self._tiles = tiles
+        self.dtype = dtype
+        self._chunks = [list(chunks[0]), list(chunks[1])]
+        self._nrows = sum(self._chunks[0])
+        self._ncols = sum(self._chunks[1])
+        self.name = name
+
+    @classmethod
+    def from_matrix(cls, matrix, chunks, *, name=None):
+        """Split a ``grblas.Matrix`` into tiles according to `chunks`"""
+        _require_dask()
+        matrix = _expect_type(
+            _dask_matrix,
+            matrix,
+            (_Matrix, TransposedMatrix),
+            within="from_matrix",
+            argname="matrix",
+        )
+        if matrix._is_transposed:
+            matrix = matrix.new()
+        tile_nrows, tile_ncols = normalize_chunks(chunks, matrix.shape)
+        tiles = _split_matrix(matrix, tile_nrows, tile_ncols)
+        tiles = [[dask.delayed(tile, traverse=False) for tile in row] for row in tiles]
+        return cls(tiles, matrix.dtype, [tile_nrows, tile_ncols], name=name)
+
+    @property
+    def nrows(self):
+        return self._nrows
+
+    @property
+    def ncols(self):
+        return self._ncols
+
+    @property
+    def shape(self):
+        return (self._nrows, self._ncols)
+
+    @property
+    def chunks(self):
+        return [list(self._chunks[0]), list(self._chunks[1])]
+
+    @property
+    def ntiles(self):
+        return (len(self._chunks[0]), len(self._chunks[1]))
+
+    def __repr__(self):
+        m, n = self.ntiles
+        return (
+            f"grblas.dask.Matrix({self.name}, dtype={self.dtype}, shape={self.shape}, "
+            f"tiles={m}x{n})"
+        )
+
+    def _map_tiles(self, func, *args, dtype):
+        tiles = [[dask.delayed(func)(tile, *args) for tile in row] for row in self._tiles]
+        return Matrix(tiles, dtype, self._chunks)
+
+    def _map_tile_pairs(self, other, func, *args, dtype):
+        tiles = [
+            [dask.delayed(func)(a, b, *args) for a, b in zip(row_a, row_b)]
+            for row_a, row_b in zip(self._tiles, other._tiles)
+        ]
+        return Matrix(tiles, dtype, self._chunks)
+
+    def rechunk(self, chunks):
+        """Return a new object with different chunks.  This concatenates and re-splits tiles."""
+        tile_nrows, tile_ncols = normalize_chunks(chunks, self.shape)
+        matrix = dask.delayed(_concat_matrix)(self._tiles, self.dtype, None)
+        split = dask.delayed(_split_matrix)(matrix, tile_nrows, tile_ncols)
+        tiles = [[split[i][j] for j in range(len(tile_ncols))] for i in range(len(tile_nrows))]
+        return Matrix(tiles, self.dtype, [tile_nrows, tile_ncols])
+
+    def ewise_add(self, other, op=monoid.plus, *, require_monoid=True):
+        """Blockwise ``Matrix.ewise_add``; the chunks of both objects must match"""
+        other = _expect_type(self, other, Matrix, within="ewise_add", argname="other")
+        _check_chunks(self, other, self._chunks, other._chunks, "ewise_add")
+        op = get_typed_op(op, self.dtype, other.dtype, kind="binary")
+        return self._map_tile_pairs(
+            other, _ewise_add, _OpRef(op), require_monoid, dtype=op.return_type
+        )
+
+    def ewise_mult(self, other, op=binary.times):
+        """Blockwise ``Matrix.ewise_mult``; the chunks of both objects must match"""
+        other = _expect_type(self, other, Matrix, within="ewise_mult", argname="other")
+        _check_chunks(self, other, self._chunks, other._chunks, "ewise_mult")
+        op = get_typed_op(op, self.dtype, other.dtype, kind="binary")
+        return self._map_tile_pairs(other, _ewise_mult, _OpRef(op), dtype=op.return_type)
+
+    def apply(self, op, right=None, *, left=None):
+        """Blockwise ``Matrix.apply``"""
+        if left is None and right is None:
+            op = get_typed_op(op, self.dtype, kind="unary")
+        elif right is None:
+            op = get_typed_op(op, Scalar.from_value(left).dtype, self.dtype, kind="binary")
+        else:
+            op = get_typed_op(op, self.dtype, Scalar.from_value(right).dtype, kind="binary")
+        return self._map_tiles(_apply, _OpRef(op), right, left, dtype=op.return_type)
+
+    def mxm(self, other, op=semiring.plus_times):
+        """Tiled ``Matrix.mxm``; tile ``[i, j]`` of the result is the sum of ``A[i, k] @ B[k, j]``
+
+        The column chunks of `self` must match the row chunks of `other`.
+        """
+        other = _expect_type(self, other, Matrix, within="mxm", argname="other")
+        if self._chunks[1] != other._chunks[0]:
+            raise DimensionMismatch(
+                "Column chunks of the first Matrix must match row chunks of the second Matrix; "
+                f"got {self._chunks[1]} and {other._chunks[0]}"
+            )
+        op = get_typed_op(op, self.dtype, other.dtype, kind="semiring")
+        _expect_op(self, op, "Semiring", within="mxm", argname="op")
+        tiles = [
+            [
+                dask.delayed(_mxm_tile)(
+                    row, [other_row[j] for other_row in other._tiles], _OpRef(op), nrows, ncols
+                )
+                for j, ncols in enumerate(other._chunks[1])
+            ]
+            for row, nrows in zip(self._tiles, self._chunks[0])
+        ]
+        return Matrix(tiles, op.return_type, [self._chunks[0], other._chunks[1]])
+
+    def mxv(self, other, op=semiring.plus_times):
+        """Tiled ``Matrix.mxv``; the column chunks of `self` must match the chunks of `other`"""
+        other = _expect_type(self, other, Vector, within="mxv", argname="other")
+        _check_chunks(self, other, self._chunks[1], other._chunks, "mxv")
+        op = get_typed_op(op, self.dtype, other.dtype, kind="semiring")
+        _expect_op(self, op, "Semiring", within="mxv", argname="op")
+        chunks = [
+            dask.delayed(_mxv_tile)(row, other._chunks_delayed, _OpRef(op), size)
+            for row, size in zip(self._tiles, self._chunks[0])
+        ]
+        return Vector(chunks, op.return_type, self._chunks[0])
+
+    def reduce_rowwise(self, op=monoid.plus):
+        """Reduce each row; partial results from each tile are combined with the monoid"""
+        op = get_reduce_monoid(self, op, "reduce_rowwise")
+        chunks = [
+            dask.delayed(_reduce_tiles)(row, _OpRef(op), "reduce_rowwise", size)
+            for row, size in zip(self._tiles, self._chunks[0])
+        ]
+        return Vector(chunks, op.return_type, self._chunks[0])
+
+    def reduce_columnwise(self, op=monoid.plus):
+        """Reduce each column; partial results from each tile are combined with the monoid"""
+        op = get_reduce_monoid(self, op, "reduce_columnwise")
+        chunks = [
+            dask.delayed(_reduce_tiles)(
+                [row[j] for row in self._tiles], _OpRef(op), "reduce_columnwise", size
+            )
+            for j, size in enumerate(self._chunks[1])
+        ]
+        return Vector(chunks, op.return_type, self._chunks[1])
+
+    def reduce_scalar(self, op=monoid.plus):
+        """Reduce all values into a Scalar.  Returns a dask Delayed object."""
+        op = get_reduce_monoid(self, op, "reduce_scalar")
+        return dask.delayed(_reduce_scalar)(
+            [tile for row in self._tiles for tile in row], _OpRef(op)
+        )
+
+    def to_delayed(self):
+        """Return a 2D list of dask Delayed objects, one per tile"""
+        return [list(row) for row in self._tiles]
+
+    def persist(self, **kwargs):
+        """Compute all tiles and keep them in memory as a new object"""
+        (tiles,) = dask.persist(self._tiles, **kwargs)
+        return Matrix(tiles, self.dtype, self._chunks, name=self.name)
+
+    def compute(self, *, name=None, **kwargs):
+        """Compute all tiles and concatenate them into a new ``grblas.Matrix``
+
+        Keyword arguments such as ``scheduler="processes"`` are passed to ``dask.compute``.
+        """
+        (tiles,) = dask.compute(self._tiles, **kwargs)
+        return _concat_matrix(tiles, self.dtype, name)
+
+
+class Vector:
+    """A Vector split into ``grblas.Vector`` chunks computed with dask.
+
+    Create with ``grblas.dask.Vector.from_vector(v, chunks)``, where `chunks`
+    is an integer chunk size or a list of chunk sizes.  Operations return new
+    lazy objects.  Use ``compute`` to get a ``grblas.Vector``.
+
+    **THIS API IS EXPERIMENTAL AND MAY CHANGE**
+    """
+
+    __slots__ = "_chunks_delayed", "dtype", "_size", "_chunks", "name"
+    _name_counter = itertools.count()
+
+    def __init__(self, chunks_delayed, dtype, chunks, *, name=None):
+        _require_dask()
+        if name is None:
+            name = f"DV_{next(Vector._name_counter)}"
+        self._chunks_delayed = chunks_delayed
+        self.dtype = dtype
+        self._chunks = list(chunks)
+        self._size = sum(self._chunks)
+        self.name = name
+
+    @classmethod
+    def from_vector(cls, vector, chunks, *, name=None):
+        """Split a ``grblas.Vector`` into chunks"""
+        _require_dask()
+        vector = _expect_type(_dask_vector, vector, _Vector, within="from_vector", argname="vector")
+        chunks = normalize_chunks([chunks, None], (vector._size, 1))[0]
+        pieces = _split_vector(vector, chunks)
+        pieces = [dask.delayed(piece, traverse=False) for piece in pieces]
+        return cls(pieces, vector.dtype, chunks, name=name)
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def shape(self):
+        return (self._size,)
+
+    @property
+    def chunks(self):
+        return list(self._chunks)
+
+    def __repr__(self):
+        return (
+            f"grblas.dask.Vector({self.name}, dtype={self.dtype}, size={self._size}, "
+            f"chunks={len(self._chunks)})"
+        )
+
+    def _map_chunks(self, func, *args, dtype):
+        chunks = [dask.delayed(func)(chunk, *args) for chunk in self._chunks_delayed]
+        return Vector(chunks, dtype, self._chunks)
+
+    def _map_chunk_pairs(self, other, func, *args, dtype):
+        chunks = [
+            dask.delayed(func)(a, b, *args)
+            for a, b in zip(self._chunks_delayed, other._chunks_delayed)
+        ]
+        return Vector(chunks, dtype, self._chunks)
+
+    def ewise_add(self, other, op=monoid.plus, *, require_monoid=True):
+        """Blockwise ``Vector.ewise_add``; the chunks of both objects must match"""
+        other = _expect_type(self, other, Vector, within="ewise_add", argname="other")
+        _check_chunks(self, other, self._chunks, other._chunks, "ewise_add")
+        op = get_typed_op(op, self.dtype, other.dtype, kind="binary")
+        return self._map_chunk_pairs(
+            other, _ewise_add, _OpRef(op), require_monoid, dtype=op.return_type
+        )
+
+    def ewise_mult(self, other, op=binary.times):
+        """Blockwise ``Vector.ewise_mult``; the chunks of both objects must match"""
+        other = _expect_type(self, other, Vector, within="ewise_mult", argname="other")
+        _check_chunks(self, other, self._chunks, other._chunks, "ewise_mult")
+        op = get_typed_op(op, self.dtype, other.dtype, kind="binary")
+        return self._map_chunk_pairs(other, _ewise_mult, _OpRef(op), dtype=op.return_type)
+
+    def apply(self, op, right=None, *, left=None):
+        """Blockwise ``Vector.apply``"""
+        if left is None and right is None:
+            op = get_typed_op(op, self.dtype, kind="unary")
+        elif right is None:
+            op = get_typed_op(op, Scalar.from_value(left).dtype, self.dtype, kind="binary")
+        else:
+            op = get_typed_op(op, self.dtype, Scalar.from_value(right).dtype, kind="binary")
+        return self._map_chunks(_apply, _OpRef(op), right, left, dtype=op.return_type)
+
+    def vxm(self, other, op=semiring.plus_times):
+        """Tiled ``Vector.vxm``; the chunks of `self` must match the row chunks of `other`"""
+        other = _expect_type(self, other, Matrix, within="vxm", argname="other")
+        _check_chunks(self, other, self._chunks, other._chunks[0], "vxm")
+        op = get_typed_op(op, self.dtype, other.dtype, kind="semiring")
+        _expect_op(self, op, "Semiring", within="vxm", argname="op")
+        chunks = [
+            dask.delayed(_vxm_tile)(
+                self._chunks_delayed, [row[j] for row in other._tiles], _OpRef(op), size
+            )
+            for j, size in enumerate(other._chunks[1])
+        ]
+        return Vector(chunks, op.return_type, other._chunks[1])
+
+    def reduce(self, op=monoid.plus):
+        """Reduce all values into a Scalar.  Returns a dask Delayed object."""
+        op = get_reduce_monoid(self, op, "reduce")
+        return dask.delayed(_reduce_scalar)(self._chunks_delayed, _OpRef(op))
+
+    def to_delayed(self):
+        """Return a list of dask Delayed objects, one per chunk"""
+        return list(self._chunks_delayed)
+
+    def persist(self, **kwargs):
+        """Compute all chunks and keep them in memory as a new object"""
+        (chunks,) = dask.persist(self._chunks_delayed, **kwargs)
+        return Vector(chunks, self.dtype, self._chunks, name=self.name)
+
+    def compute(self, *, name=None, **kwargs):
+        """Compute all chunks and assemble them into a new ``grblas.Vector``
+
+        Keyword arguments such as ``scheduler="processes"`` are passed to ``dask.compute``.
+        """
+        (chunks,) = dask.compute(self._chunks_delayed, **kwargs)
+        return _concat_vector(chunks, self.dtype, self._size, name)
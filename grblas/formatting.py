@@ -1,10 +1,9 @@
 import numpy as np
 
-from . import config, monoid, unary
+from . import config, unary
 from .dtypes import BOOL
 from .exceptions import OutOfMemory
 from .matrix import Matrix, TransposedMatrix
-from .vector import Vector
 
 try:
     import pandas as pd
@@ -90,82 +89,61 @@ table.dataframe {
 """
 
 
+def _mask_values(vals, mask):
+    # Show 1 where the mask is True and 0 where it is False
+    if mask.structure:
+        rv = np.ones(vals.size, dtype=np.uint8)
+    else:
+        rv = vals.astype(bool).astype(np.uint8)
+    if mask.complement:
+        rv ^= 1
+    return rv
+
+
+def _get_slice(indices):
+    if indices is None:
+        return slice(None)
+    return slice(indices[0], indices[-1] + 1)
+
+
+def _get_shift(indices, offset):
+    # Position in the DataFrame of the first index of this group
+    if indices is None:
+        return 0
+    return indices[0] - (offset or 0)
+
+
 def _update_matrix_dataframe(df, matrix, rows, row_offset, columns, column_offset, *, mask=None):
     if rows is None and columns is None:
-        if mask is None:
-            submatrix = matrix
-        else:
-            submatrix = Matrix.new("UINT8", matrix._nrows, matrix._ncols, name="")
-            if mask.structure:
-                submatrix(matrix.S)[...] = 0 if mask.complement else 1
-            else:
-                submatrix(matrix.S)[...] = 1 if mask.complement else 0
-                submatrix(matrix.V)[...] = 0 if mask.complement else 1
+        submatrix = matrix
     else:
-        if rows is None:
-            rows = slice(None)
-        if columns is None:
-            columns = slice(None)
+        # Only extract the block that is displayed, which is cheap even for huge matrices
+        row_slice = _get_slice(rows)
+        col_slice = _get_slice(columns)
         if type(matrix) is TransposedMatrix:
-            parent = matrix._matrix
-            submatrix = Matrix.new(parent.dtype, parent._nrows, parent._ncols, name="")
-            # Get val to support iso-valued matrices
-            val = parent.reduce_scalar(monoid.any).new(name="")
-            submatrix(parent.S)[columns, rows] = val
-            submatrix(submatrix.S)[...] = parent
-            if row_offset is not None or column_offset is not None:
-                submatrix = submatrix[column_offset:, row_offset:].new(name="")
-            submatrix = submatrix.T
+            submatrix = matrix._matrix[col_slice, row_slice].new(name="").T
         else:
-            if mask is None:
-                submatrix = Matrix.new(matrix.dtype, matrix._nrows, matrix._ncols, name="")
-                # Get val to support iso-valued matrices
-                val = matrix.reduce_scalar(monoid.any).new(name="")
-                submatrix(matrix.S)[rows, columns] = val
-                submatrix(submatrix.S)[...] = matrix
-            else:
-                submatrix = Matrix.new("UINT8", matrix._nrows, matrix._ncols, name="")
-                if mask.structure:
-                    submatrix(matrix.S)[rows, columns] = 0 if mask.complement else 1
-                else:
-                    submatrix(matrix.S)[rows, columns] = 1 if mask.complement else 0
-                    submatrix(matrix.V)[rows, columns] = 0 if mask.complement else 1
-            if row_offset is not None or column_offset is not None:
-                submatrix = submatrix[row_offset:, column_offset:].new(name="")
-    rows, cols, vals = submatrix.to_values()
-    df.values[rows, cols] = vals
+            submatrix = matrix[row_slice, col_slice].new(name="")
+    row_indices, col_indices, vals = submatrix.to_values()
+    row_indices += _get_shift(rows, row_offset)
+    col_indices += _get_shift(columns, column_offset)
+    if mask is not None:
+        vals = _mask_values(vals, mask)
+    df.values[row_indices, col_indices] = vals
     nulls = np.isnan(vals)
-    df.values[rows[nulls], cols[nulls]] = "nan"
+    df.values[row_indices[nulls], col_indices[nulls]] = "nan"
 
 
 def _update_vector_dataframe(df, vector, columns, column_offset, *, mask=None):
     if columns is None:
-        if mask is None:
-            subvector = vector
-        else:
-            subvector = Vector.new("UINT8", vector._size, name="")
-            if mask.structure:
-                subvector(vector.S)[...] = 0 if mask.complement else 1
-            else:
-                subvector(vector.S)[...] = 1 if mask.complement else 0
-                subvector(vector.V)[...] = 0 if mask.complement else 1
+        subvector = vector
     else:
-        if mask is None:
-            subvector = Vector.new(vector.dtype, vector._size, name="")
-            # Get val to support iso-valued vectors
-            val = vector.reduce(monoid.any).new(name="")
-            subvector(vector.S)[columns] = val
-            subvector(subvector.S)[...] = vector
-        else:
-            subvector = Vector.new("UINT8", vector._size, name="")
-            if mask.structure:
-                subvector(vector.S)[columns] = 0 if mask.complement else 1
-            else:
-                subvector(vector.S)[columns] = 1 if mask.complement else 0
-                subvector(vector.V)[columns] = 0 if mask.complement else 1
-        if column_offset is not None:
-            subvector = subvector[column_offset:].new(name="")
+        # Only extract the part that is displayed
+        subvector = vector[_get_slice(columns)].new(name="")
     cols, vals = subvector.to_values()
+    cols += _get_shift(columns, column_offset)
+    if mask is not None:
+        vals = _mask_values(vals, mask)
     df.values[0, cols] = vals
     df.values[0, cols[np.isnan(vals)]] = "nan"
 
@@ -238,7 +216,13 @@ def _get_matrix_dataframe(matrix, max_rows, min_rows, max_columns, *, mask=None)
         if num_rows < matrix._nvals:
             df = df.append(pd.Series(["..."] * 3, index=df.columns, name="..."))
         return df
-    if mask is not None and not mask.structure and df.shape != matrix.shape:
+    if (
+        mask is not None
+        and not mask.structure
+        and df.shape != matrix.shape
+        # This passes over all the data, so skip it if it would be too expensive
+        and matrix._nvals <= config.get("repr_max_nvals")
+    ):
         # This performs more calculation and uses more memory than I would prefer.
         # Perhaps we could use the efficient "constant vector or matrix" trick.
         nonzero = matrix.apply(unary.one["UINT8"]).new(mask=matrix.V, name="")
@@ -286,7 +270,13 @@ def _get_vector_dataframe(vector, max_rows, min_rows, max_columns, *, mask=None)
         if num_rows < vector._nvals:
             df = df.append(pd.Series(["..."] * 2, index=df.columns, name="..."))
         return df
-    if mask is not None and not mask.structure and df.size != vector._size:
+    if (
+        mask is not None
+        and not mask.structure
+        and df.size != vector._size
+        # This passes over all the data, so skip it if it would be too expensive
+        and vector._nvals <= config.get("repr_max_nvals")
+    ):
         # This performs more calculation and uses more memory than I would prefer.
         # Perhaps we could use the efficient "constant vector or matrix" trick.
         nonzero = vector.apply(unary.one["UINT8"]).new(mask=vector.V, name="")
@@ -0,0 +1,159 @@
+"""Lightweight hooks on GraphBLAS C calls for monitoring.
+
+Hooks are called after sampled calls to GraphBLAS C functions as
+``hook(cfunc_name, duration, status)``, where `duration` is the wall time
+in seconds and `status` is the returned ``GrB_Info`` code (0 is success).
+Nothing is formatted or inspected, so overhead is small, and when there
+are no hooks (the default), calls aren't timed at all.
+
+``metrics`` is a built-in registry of per-function call counters and latency
+histograms that can be enabled with ``enable_metrics`` and scraped with
+``metrics.snapshot()`` or ``metrics.to_prometheus()``.
+"""
+import bisect
+import threading
+
+from . import base
+from .exceptions import GrB_NO_VALUE, GrB_SUCCESS
+
+
+def add_call_hook(func, sample_rate=1.0):
+    """Call ``func(cfunc_name, duration, status)`` after a fraction of GraphBLAS calls.
+
+    Parameters
+    ----------
+    func : callable
+    sample_rate : float, default 1.0
+        Probability that any given call is timed and passed to `func`.
+    """
+    if not callable(func):
+        raise TypeError(f"func must be callable; got {type(func)}")
+    if not 0 < sample_rate <= 1:
+        raise ValueError(f"sample_rate must be in (0, 1]; got {sample_rate}")
+    remove_call_hook(func)
+    base._call_hooks = base._call_hooks + ((func, sample_rate),)
+
+
+def remove_call_hook(func):
+    """Remove a hook added with ``add_call_hook``.  Does nothing if not found."""
+    base._call_hooks = tuple((f, rate) for f, rate in base._call_hooks if f is not func)
+
+
+def get_call_hooks():
+    """Return a list of ``(func, sample_rate)`` for all call hooks"""
+    return list(base._call_hooks)
+
+
+# Latency bucket upper bounds in seconds, from 1 microsecond to 100 seconds
+DEFAULT_BUCKETS = tuple(10.0 ** (i / 2) for i in range(-12, 5))
+
+
+class Histogram:
+    """Latency histogram with cumulative semantics like Prometheus"""
+
+    __slots__ = "buckets", "counts", "count", "sum"
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self):
+        """Return a list of ``(upper_bound, count)`` including ``+Inf``"""
+        rv = []
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            rv.append((bound, total))
+        return rv
+
+
+class MetricsRegistry:
+    """In-process registry of GraphBLAS call counts, errors, and latency histograms.
+
+    Counts are of sampled calls; divide by ``sample_rate`` to estimate totals.
+    The registry is itself a call hook.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.sample_rate = None
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._errors = {}
+        self._histograms = {}
+
+    def __call__(self, cfunc_name, duration, status):
+        with self._lock:
+            hist = self._histograms.get(cfunc_name)
+            if hist is None:
+                hist = self._histograms[cfunc_name] = Histogram(self.buckets)
+                self._calls[cfunc_name] = 0
+                self._errors[cfunc_name] = 0
+            hist.observe(duration)
+            self._calls[cfunc_name] += 1
+            if status != GrB_SUCCESS and status != GrB_NO_VALUE:
+                self._errors[cfunc_name] += 1
+
+    def reset(self):
+        with self._lock:
+            self._calls.clear()
+            self._errors.clear()
+            self._histograms.clear()
+
+    def snapshot(self):
+        """Return a dict of the current metrics keyed by C function name"""
+        with self._lock:
+            return {
+                name: {
+                    "calls": self._calls[name],
+                    "errors": self._errors[name],
+                    "seconds_sum": hist.sum,
+                    "buckets": hist.cumulative_counts(),
+                }
+                for name, hist in self._histograms.items()
+            }
+
+    def to_prometheus(self, prefix="grblas"):
+        """Format the metrics in the Prometheus text exposition format"""
+        lines = [
+            f"# HELP {prefix}_calls_total Sampled GraphBLAS C calls",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        snapshot = self.snapshot()
+        for name, data in snapshot.items():
+            lines.append(f'{prefix}_calls_total{{cfunc="{name}"}} {data["calls"]}')
+        lines.append(f"# HELP {prefix}_errors_total Sampled GraphBLAS C calls that failed")
+        lines.append(f"# TYPE {prefix}_errors_total counter")
+        for name, data in snapshot.items():
+            lines.append(f'{prefix}_errors_total{{cfunc="{name}"}} {data["errors"]}')
+        lines.append(f"# HELP {prefix}_call_seconds Latency of sampled GraphBLAS C calls")
+        lines.append(f"# TYPE {prefix}_call_seconds histogram")
+        for name, data in snapshot.items():
+            for bound, count in data["buckets"]:
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_call_seconds_bucket{{cfunc="{name}",le="{le}"}} {count}')
+            lines.append(f'{prefix}_call_seconds_sum{{cfunc="{name}"}} {data["seconds_sum"]}')
+            lines.append(f'{prefix}_call_seconds_count{{cfunc="{name}"}} {data["calls"]}')
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+def enable_metrics(sample_rate=0.01):
+    """Collect call metrics into ``grblas.hooks.metrics`` for a fraction of calls"""
+    add_call_hook(metrics, sample_rate)
+    metrics.sample_rate = sample_rate
+
+
+def disable_metrics():
+    """Stop collecting call metrics into ``grblas.hooks.metrics``"""
+    remove_call_hook(metrics)
+    metrics.sample_rate = None
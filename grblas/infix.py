@@ -82,6 +82,7 @@ class VectorInfixExpr(InfixExprBase):
     outer = wrapdoc(Vector.outer)(property(_automethods.outer))
     reduce = wrapdoc(Vector.reduce)(property(_automethods.reduce))
     ss = wrapdoc(Vector.ss)(property(_automethods.ss))
+    to_pandas = wrapdoc(Vector.to_pandas)(property(_automethods.to_pandas))
     to_pygraphblas = wrapdoc(Vector.to_pygraphblas)(property(_automethods.to_pygraphblas))
     to_values = wrapdoc(Vector.to_values)(property(_automethods.to_values))
     vxm = wrapdoc(Vector.vxm)(property(_automethods.vxm))
@@ -1,3 +1,5 @@
+import numpy as np
+
 from . import Matrix, Vector
 from .dtypes import FP64, lookup_dtype
 from .exceptions import GrblasException
@@ -29,44 +31,141 @@ def draw(m):  # pragma: no cover
     plt.show()
 
 
-def from_networkx(g, dtype=FP64):
-    """
-    Returns a Matrix
-    """
-    import networkx as nx
+def from_networkx(g, dtype=FP64, *, weight="weight", nodelist=None, name=None):
+    """Create a Matrix from the adjacency structure of a networkx graph.
 
-    ss = nx.convert_matrix.to_scipy_sparse_matrix(g)
-    nrows, ncols = ss.shape
-    rows, cols = ss.nonzero()
-    m = Matrix.from_values(rows, cols, ss.data, nrows=nrows, ncols=ncols, dtype=dtype)
-    return m
+    Parameters
+    ----------
+    g : networkx.Graph
+    dtype : dtype, default FP64
+    weight : str or None, default "weight"
+        Edge attribute to use for values.  Edges without this attribute have value 1.
+        If None, all values are 1.
+    nodelist : list, optional
+        The rows and columns are ordered according to the nodes in `nodelist`.
+        If not given, the ordering is produced by ``list(g)``.
+    name : str, optional
+        Name of the new Matrix.
 
+    Parallel edges of a multigraph are summed.
 
-# TODO: add parameter to indicate empty value (default is 0 and NaN)
-def from_numpy(m):
+    Returns
+    -------
+    Matrix
     """
+    dtype = lookup_dtype(dtype)
+    if nodelist is None:
+        nodelist = list(g)
+        adj = g.adj
+    else:
+        nodelist = list(nodelist)
+        adj = g.subgraph(nodelist).adj
+    index = {node: i for i, node in enumerate(nodelist)}
+    if len(index) != len(nodelist):
+        raise ValueError("nodelist contains duplicates")
+    n = len(nodelist)
+    nvals = sum(map(len, adj.values()))
+    rows = np.empty(nvals, dtype=np.uint64)
+    cols = np.empty(nvals, dtype=np.uint64)
+    if weight is not None:
+        values = np.empty(nvals, dtype=dtype.np_type)
+    is_multigraph = g.is_multigraph()
+    get_index = index.__getitem__
+    start = 0
+    for node, nbrs in adj.items():
+        end = start + len(nbrs)
+        if end == start:
+            continue
+        rows[start:end] = index[node]
+        cols[start:end] = np.fromiter(map(get_index, nbrs), np.uint64, end - start)
+        if weight is not None:
+            if is_multigraph:
+                vals = (sum(d.get(weight, 1) for d in kd.values()) for kd in nbrs.values())
+            else:
+                vals = (d.get(weight, 1) for d in nbrs.values())
+            values[start:end] = np.fromiter(vals, dtype.np_type, end - start)
+        start = end
+    if weight is None:
+        values = 1
+    rv = Matrix.new(dtype, nrows=n, ncols=n, name=name)
+    if nvals > 0:
+        if weight is None:
+            # SS, SuiteSparse-specific: build_Scalar
+            rv.ss.build_scalar(rows, cols, values)
+        else:
+            rv.build(rows, cols, values)
+    return rv
+
+
+def _missing_mask(m, missing):
+    """Return a boolean array of present values, or None if all values are present"""
+    if missing is None:
+        return None
+    try:
+        is_nan = bool(np.isnan(missing))
+    except TypeError:
+        is_nan = False
+    if is_nan:
+        if not np.issubdtype(m.dtype, np.inexact):
+            return None
+        mask = ~np.isnan(m)
+    else:
+        mask = m != missing
+    if mask.all():
+        return None
+    return mask
+
+
+def from_numpy(m, *, missing=0, name=None):
+    """Create a Vector or Matrix from a dense numpy array.
+
     If m.ndim == 1, returns a Vector
     if m.ndim == 2, returns a Matrix
     if m.ndim > 2, raises an error
     dtype is inferred from m.dtype
+
+    Parameters
+    ----------
+    m : np.ndarray
+    missing : scalar or None, default 0
+        Elements equal to this value are treated as missing (use ``np.nan`` to
+        drop NaN values).  If None, all elements are kept and the result is full.
+    name : str, optional
+        Name of the new Vector or Matrix.
+
+    The data is imported directly in "full" or "bitmap" format, so this copies
+    the values once and never goes through a coordinate format.
     """
+    m = np.asarray(m)
     if m.ndim > 2:
         raise GrblasException("m.ndim must be <= 2")
-
-    try:
-        from scipy.sparse import coo_matrix, csr_matrix
-    except ImportError:  # pragma: no cover
-        raise ImportError("scipy is required to import from numpy")
-
+    mask = _missing_mask(m, missing)
     if m.ndim == 1:
-        ss = csr_matrix(m)
-        _, size = ss.shape
-        dtype = lookup_dtype(m.dtype)
-        g = Vector.from_values(ss.indices, ss.data, size=size, dtype=dtype)
-        return g
-    else:
-        ss = coo_matrix(m)
-        return from_scipy_sparse_matrix(ss)
+        if m.size == 0:
+            return Vector.new(lookup_dtype(m.dtype), size=0, name=name)
+        # SS, SuiteSparse-specific: import
+        if mask is None:
+            return Vector.ss.import_full(m, name=name)
+        # `mask` is a new array, so we may give ownership of it (and a copy of values)
+        return Vector.ss.import_bitmap(bitmap=mask, values=m.copy(), take_ownership=True, name=name)
+    if m.size == 0:
+        nrows, ncols = m.shape
+        return Matrix.new(lookup_dtype(m.dtype), nrows, ncols, name=name)
+    # SS, SuiteSparse-specific: import
+    if m.flags.f_contiguous and not m.flags.c_contiguous:
+        if mask is None:
+            return Matrix.ss.import_fullc(m, name=name)
+        return Matrix.ss.import_bitmapc(
+            bitmap=np.asfortranarray(mask),
+            values=m.copy("F"),
+            take_ownership=True,
+            name=name,
+        )
+    if mask is None:
+        return Matrix.ss.import_fullr(m, name=name)
+    return Matrix.ss.import_bitmapr(
+        bitmap=mask, values=np.array(m, order="C"), take_ownership=True, name=name
+    )
 
 
 def from_scipy_sparse_matrix(m, *, dup_op=None, name=None):
@@ -82,26 +181,247 @@ def from_scipy_sparse_matrix(m, *, dup_op=None, name=None):
     return g
 
 
-# TODO: add parameters to allow different networkx classes and attribute names
-def to_networkx(m):
+def to_networkx(m, edge_attribute="weight", *, nodes=None, create_using=None, **edge_attributes):
+    """Create a networkx graph from a square Matrix.
+
+    Parameters
+    ----------
+    m : Matrix
+        Entries become edges; the values are stored as the `edge_attribute` edge attribute.
+    edge_attribute : str or None, default "weight"
+        Name of the edge attribute for the values of `m`.  If None, values are not stored.
+    nodes : array-like, optional
+        Node labels; index ``i`` of the Matrix becomes node ``nodes[i]``.
+        Default is to use the integer indices.
+    create_using : networkx graph constructor, optional
+        Graph type to create.  Default is ``networkx.DiGraph``.
+    **edge_attributes : Matrix
+        Additional edge attributes, one Matrix per attribute.  Entries that are
+        not in `m` will add edges.
+
+    Returns
+    -------
+    networkx.Graph
+    """
     import networkx as nx
 
-    g = nx.DiGraph()
-    for row, col, val in zip(*m.to_values()):
-        g.add_edge(row, col, weight=val)
+    if create_using is None:
+        create_using = nx.DiGraph
+    g = nx.empty_graph(0, create_using)
+    n = max(m._nrows, m._ncols)
+    if nodes is None:
+        g.add_nodes_from(range(n))
+    else:
+        nodes = np.asarray(nodes)
+        if nodes.ndim != 1 or nodes.size != n:
+            raise ValueError(
+                f"nodes must be a 1-d array of length {n} to match the Matrix; "
+                f"got shape {nodes.shape}"
+            )
+        g.add_nodes_from(nodes.tolist())
+
+    def add_edges(matrix, attr):
+        rows, cols, values = matrix.to_values()
+        if nodes is not None:
+            rows = nodes[rows]
+            cols = nodes[cols]
+        if attr is None:
+            g.add_edges_from(zip(rows.tolist(), cols.tolist()))
+        else:
+            g.add_weighted_edges_from(
+                zip(rows.tolist(), cols.tolist(), values.tolist()), weight=attr
+            )
+
+    add_edges(m, edge_attribute)
+    for attr, matrix in edge_attributes.items():
+        if matrix.shape != m.shape:
+            raise ValueError(
+                f"Matrix for edge attribute {attr!r} has shape {matrix.shape}; "
+                f"expected {m.shape}"
+            )
+        add_edges(matrix, attr)
     return g
 
 
-def to_numpy(m):
-    try:
-        import scipy  # noqa
-    except ImportError:  # pragma: no cover
-        raise ImportError("scipy is required to export to numpy")
-    if output_type(m) is Vector:
-        return to_scipy_sparse_matrix(m).toarray()[0]
+def to_numpy(m, fill_value=0):
+    """Convert a Vector or Matrix to a dense numpy array.
+
+    Missing values are set to `fill_value`, which must be representable
+    by the dtype of `m`.  The data is exported in "full" or "bitmap" format,
+    so no coordinate arrays are created.
+    """
+    typ = output_type(m)
+    if typ is TransposedMatrix:
+        return to_numpy(m._matrix, fill_value).T
+    if typ is not Vector and typ is not Matrix:
+        raise TypeError(f"Expected Vector or Matrix; got {type(m)}")
+    if type(m) is not typ:
+        m = m._get_value()
+    # SS, SuiteSparse-specific: export
+    if typ is Vector:
+        shape = (m._size,)
+        if m._nvals == m._size:
+            fmt = "full"
+        else:
+            fmt = "bitmap"
+    else:
+        shape = m.shape
+        is_columnwise = m.ss.orientation == "columnwise"
+        if m._nvals == m._nrows * m._ncols:
+            fmt = "fullc" if is_columnwise else "fullr"
+        else:
+            fmt = "bitmapc" if is_columnwise else "bitmapr"
+    if 0 in shape:
+        return np.full(shape, fill_value, dtype=m.dtype.np_type)
+    info = m.ss.export(fmt)
+    values = info["values"]
+    if info["is_iso"]:
+        if fmt.startswith("full"):
+            return np.full(shape, values[0], dtype=values.dtype)
+        rv = np.full(shape, fill_value, dtype=values.dtype)
+        rv[info["bitmap"]] = values[0]
+        return rv
+    if fmt.startswith("bitmap"):
+        np.copyto(values, fill_value, where=~info["bitmap"])
+    return values
+
+
+def from_pandas_edgelist(
+    df,
+    source="source",
+    target="target",
+    weight=None,
+    *,
+    nrows=None,
+    ncols=None,
+    dtype=None,
+    dup_op=None,
+    name=None,
+):
+    """Create a Matrix from an edge list in a pandas DataFrame.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    source : str, default "source"
+        Column of integer row indices.
+    target : str, default "target"
+        Column of integer column indices.
+    weight : str, optional
+        Column of values.  If not given, all values are 1 (and the Matrix is iso-valued).
+    nrows : int, optional
+    ncols : int, optional
+        If not given, these are computed from the max row and column index.
+    dtype : dtype, optional
+    dup_op : BinaryOp, optional
+        Used to combine values of duplicate edges.
+    name : str, optional
+        Name of the new Matrix.
+
+    Returns
+    -------
+    Matrix
+    """
+    rows = df[source].to_numpy()
+    cols = df[target].to_numpy()
+    if weight is None:
+        if dtype is None:
+            dtype = bool
+        values = 1
+        dup_op = None
     else:
-        sparse = to_scipy_sparse_matrix(m, "coo")
-        return sparse.toarray()
+        values = df[weight].to_numpy()
+    return Matrix.from_values(
+        rows, cols, values, dtype, nrows=nrows, ncols=ncols, dup_op=dup_op, name=name
+    )
+
+
+def _sparse_array(indices, values, size, fill_value):
+    import pandas as pd
+    from scipy.sparse import csc_matrix
+
+    if size > np.iinfo(np.int32).max:
+        raise ValueError(f"pandas sparse arrays have 32-bit indices, so size {size} is too large")
+    column = csc_matrix((values, indices, [0, indices.size]), shape=(size, 1))
+    sparse = pd.arrays.SparseArray.from_spmatrix(column)
+    # from_spmatrix always uses a fill value of 0
+    dtype = pd.SparseDtype(values.dtype, fill_value)
+    return pd.arrays.SparseArray(sparse.sp_values, sparse_index=sparse.sp_index, dtype=dtype)
+
+
+def to_pandas(m, format="coo", *, fill_value=None):
+    """Convert a Vector or Matrix to a pandas object without densifying.
+
+    Parameters
+    ----------
+    m : Vector or Matrix
+    format : {"coo", "sparse"}, default "coo"
+        "coo" returns a Series indexed by position for a Vector, and a DataFrame
+        with "row", "col", and "value" columns for a Matrix.
+        "sparse" returns ``pd.arrays.SparseArray`` data of the full size: a Series
+        for a Vector, and a DataFrame with one sparse column per column for a Matrix.
+        This requires scipy, and the size (or number of rows) must fit in 32 bits.
+        pandas stores each column separately, so this is slow for a Matrix with
+        very many columns.
+    fill_value : scalar, optional
+        The fill value of the sparse arrays when format is "sparse".
+        Default is the default of ``pd.SparseDtype`` (NaN for floats, 0 for integers).
+
+    The data comes from a ``ss.export``, so values are not copied again.
+    """
+    import pandas as pd
+
+    typ = output_type(m)
+    if typ is TransposedMatrix:
+        m = m.new()
+        typ = Matrix
+    elif typ is not Vector and typ is not Matrix:
+        raise TypeError(f"Expected Vector or Matrix; got {type(m)}")
+    elif type(m) is not typ:
+        m = m._get_value()
+    format = format.lower()
+    if format not in {"coo", "sparse"}:
+        raise ValueError(f'Invalid format: {format!r}.  Must be "coo" or "sparse".')
+    dtype = m.dtype.np_type
+    # SS, SuiteSparse-specific: export
+    if typ is Vector:
+        info = m.ss.export("sparse", sort=True)
+        indices = info["indices"]
+        values = info["values"]
+        if info["is_iso"]:
+            values = np.repeat(values, indices.size)
+        if format == "coo":
+            return pd.Series(values, index=indices, dtype=dtype, name=m.name)
+        if fill_value is None:
+            fill_value = pd.SparseDtype(dtype).fill_value
+        return pd.Series(_sparse_array(indices, values, m._size, fill_value), name=m.name)
+    if format == "coo":
+        info = m.ss.export("coor", sort=True)
+        values = info["values"]
+        if info["is_iso"]:
+            values = np.repeat(values, info["rows"].size)
+        return pd.DataFrame({"row": info["rows"], "col": info["cols"], "value": values})
+    info = m.ss.export("csc", sort=True)
+    indptr = info["indptr"]
+    row_indices = info["row_indices"]
+    values = info["values"]
+    if info["is_iso"]:
+        values = np.repeat(values, row_indices.size)
+    if fill_value is None:
+        fill_value = pd.SparseDtype(dtype).fill_value
+    nrows = m._nrows
+    return pd.DataFrame(
+        {
+            j: _sparse_array(
+                row_indices[indptr[j] : indptr[j + 1]],
+                values[indptr[j] : indptr[j + 1]],
+                nrows,
+                fill_value,
+            )
+            for j in range(m._ncols)
+        },
+        index=pd.RangeIndex(nrows),
+    )
 
 
 def to_scipy_sparse_matrix(m, format="csr"):
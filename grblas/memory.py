@@ -0,0 +1,195 @@
+"""Custom memory management for SuiteSparse:GraphBLAS.
+
+Use a ``MemoryManager`` with ``grblas.init(memory_manager=MemoryManager(...))``
+to count allocations and limit the total memory used by GraphBLAS.  Every
+allocation made by GraphBLAS calls back into Python, so this is slower than the
+default "c" and "numpy" memory managers.
+"""
+import ctypes
+import sys
+import threading
+
+_memory_manager = None  # The MemoryManager that GraphBLAS was initialized with, if any
+
+
+def _get_libc():
+    if sys.platform == "win32":  # pragma: no cover
+        libc = ctypes.cdll.msvcrt
+    else:
+        libc = ctypes.CDLL(None)
+    libc.malloc.restype = ctypes.c_void_p
+    libc.malloc.argtypes = [ctypes.c_size_t]
+    libc.calloc.restype = ctypes.c_void_p
+    libc.calloc.argtypes = [ctypes.c_size_t, ctypes.c_size_t]
+    libc.realloc.restype = ctypes.c_void_p
+    libc.realloc.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    libc.free.restype = None
+    libc.free.argtypes = [ctypes.c_void_p]
+    return libc
+
+
+class MemoryManager:
+    """Allocate memory for SuiteSparse:GraphBLAS with statistics and a cap.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum total bytes that GraphBLAS may allocate.  Allocations that would
+        exceed this fail, so the operation raises ``OutOfMemory`` right away
+        instead of the process being killed.
+
+    Pass an instance to ``grblas.init(memory_manager=...)``.  Only one
+    MemoryManager may be used per process.
+
+    Only memory allocated by GraphBLAS is counted.  Buffers given to numpy by
+    ``.ss.export`` and ``.ss.unpack`` stop being counted when they are handed off,
+    and numpy arrays given to GraphBLAS by ``.ss.import_*`` or ``.ss.pack_*`` with
+    ``take_ownership=True`` are never counted.
+    """
+
+    def __init__(self, *, max_bytes=None):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes = {}  # address -> allocated size
+        self._callbacks = None
+        self._ffi = None
+        self._libc = None
+        self.nbytes = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset counters.  This doesn't change ``nbytes``, the current memory in use."""
+        self.nallocs = 0
+        self.nfrees = 0
+        self.nreallocs = 0
+        self.nfailed = 0
+        self.total_bytes = 0
+        self.peak_nbytes = self.nbytes
+
+    def stats(self):
+        """Return a dict of allocation statistics"""
+        with self._lock:
+            return {
+                "nbytes": self.nbytes,
+                "peak_nbytes": self.peak_nbytes,
+                "total_bytes": self.total_bytes,
+                "nallocs": self.nallocs,
+                "nfrees": self.nfrees,
+                "nreallocs": self.nreallocs,
+                "nfailed": self.nfailed,
+                "live_blocks": len(self._sizes),
+            }
+
+    def __repr__(self):
+        stats = ", ".join(f"{key}={val}" for key, val in self.stats().items())
+        return f"MemoryManager({stats})"
+
+    def _to_ptr(self, address):
+        if not address:
+            return self._ffi.NULL
+        return self._ffi.cast("void *", address)
+
+    def _to_address(self, ptr):
+        return int(self._ffi.cast("uintptr_t", ptr))
+
+    def _can_allocate(self, size):
+        if self.max_bytes is not None and self.nbytes + size > self.max_bytes:
+            self.nfailed += 1
+            return False
+        return True
+
+    def _record(self, address, size):
+        self._sizes[address] = size
+        self.nbytes += size
+        self.total_bytes += size
+        if self.nbytes > self.peak_nbytes:
+            self.peak_nbytes = self.nbytes
+
+    def _allocate(self, size, zero):
+        # Returns an address or 0
+        with self._lock:
+            if not self._can_allocate(size):
+                return 0
+            self.nallocs += 1
+            if zero:
+                address = self._libc.calloc(1, size)
+            else:
+                address = self._libc.malloc(size)
+            if not address:
+                self.nfailed += 1
+                return 0
+            self._record(address, size)
+            return address
+
+    def _malloc(self, size):
+        return self._to_ptr(self._allocate(size, False))
+
+    def _calloc(self, n, size):
+        return self._to_ptr(self._allocate(n * size, True))
+
+    def _realloc(self, ptr, size):
+        address = self._to_address(ptr)
+        if not address:
+            return self._malloc(size)
+        with self._lock:
+            old_size = self._sizes.get(address, 0)
+            if size <= old_size and 2 * size >= old_size:
+                # Keep the block if it wouldn't shrink by much
+                self.nreallocs += 1
+                return ptr
+            if not self._can_allocate(size - old_size):
+                return self._to_ptr(0)
+            new_address = self._libc.realloc(address, size)
+            if not new_address:
+                self.nfailed += 1
+                return self._to_ptr(0)
+            self.nreallocs += 1
+            self._sizes.pop(address, None)
+            self.nbytes -= old_size
+            self._record(new_address, size)
+        return self._to_ptr(new_address)
+
+    def _free(self, ptr):
+        address = self._to_address(ptr)
+        if not address:
+            return
+        with self._lock:
+            # Memory given to GraphBLAS by e.g. ``import_*(take_ownership=True)`` isn't counted
+            self.nbytes -= self._sizes.pop(address, 0)
+            self.nfrees += 1
+        self._libc.free(address)
+
+    def _release(self, ptr):
+        """Stop counting memory that was handed off to numpy, which will free it"""
+        address = self._to_address(ptr)
+        with self._lock:
+            self.nbytes -= self._sizes.pop(address, 0)
+
+    def _initialize(self, ffi, lib, blocking):
+        """Call GxB_init with callbacks to this memory manager"""
+        if self._callbacks is not None:
+            raise RuntimeError("This MemoryManager has already been used to initialize GraphBLAS")
+        self._ffi = ffi
+        self._libc = _get_libc()
+        self._callbacks = (
+            ffi.callback("void *(size_t)", self._malloc),
+            ffi.callback("void *(size_t, size_t)", self._calloc),
+            ffi.callback("void *(void *, size_t)", self._realloc),
+            ffi.callback("void (void *)", self._free),
+        )
+        mode = lib.GrB_BLOCKING if blocking else lib.GrB_NONBLOCKING
+        # The callbacks acquire the GIL, so they aren't safe to call from many OpenMP
+        # threads at once.  This makes SuiteSparse call them one at a time.
+        user_malloc_is_thread_safe = False
+        info = lib.GxB_init(mode, *self._callbacks, user_malloc_is_thread_safe)
+        if info != lib.GrB_SUCCESS:  # pragma: no cover
+            self._callbacks = None
+            raise RuntimeError(f"GxB_init failed with error code {info}")
+        global _memory_manager
+        _memory_manager = self
+
+
+def _release(ptr):
+    """Stop counting a buffer given to numpy, such as by ``export``"""
+    if _memory_manager is not None:
+        _memory_manager._release(ptr)
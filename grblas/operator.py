@@ -760,6 +760,9 @@ class UnaryOp(OpBase):
             # fmt: on
         ):
             for name in names:
+                if not _hasop(unary, name):  # pragma: no cover
+                    # SuiteSparse extensions aren't available from every backend
+                    continue
                 op = getattr(unary, name)
                 for input_types, target_type in types:
                     typed_op = op._typed_ops[target_type]
@@ -1010,9 +1013,13 @@ class BinaryOp(OpBase):
         # Add truediv which always points to floating point cdiv
         # We are effectively hacking cdiv to always return floating point values
         # If the inputs are FP32, we use DIV_FP32; use DIV_FP64 for all other input dtypes
-        truediv = binary.truediv = op.truediv = BinaryOp("truediv")
-        rtruediv = binary.rtruediv = op.rtruediv = BinaryOp("rtruediv")
-        for (new_op, builtin_op) in [(truediv, binary.cdiv), (rtruediv, binary.rdiv)]:
+        for new_name, builtin_name in [("truediv", "cdiv"), ("rtruediv", "rdiv")]:
+            if not _hasop(binary, builtin_name):  # pragma: no cover
+                continue
+            new_op = BinaryOp(new_name)
+            setattr(binary, new_name, new_op)
+            setattr(op, new_name, new_op)
+            builtin_op = getattr(binary, builtin_name)
             for dtype in builtin_op.types:
                 if dtype in {"FP32", "FC32", "FC64"}:
                     orig_dtype = dtype
@@ -1087,6 +1094,8 @@ class BinaryOp(OpBase):
             )
         for names, *types in name_types:
             for name in names:
+                if not _hasop(binary, name):  # pragma: no cover
+                    continue
                 cur_op = getattr(binary, name)
                 for input_types, target_type in types:
                     typed_op = cur_op._typed_ops[target_type]
@@ -1097,18 +1106,25 @@ class BinaryOp(OpBase):
                             cur_op._typed_ops[dtype] = typed_op
                             cur_op.coercions[dtype] = target_type
         # Not valid input dtypes
-        del binary.ldexp["FP32"]
-        del binary.ldexp["FP64"]
+        if _hasop(binary, "ldexp"):  # pragma: no branch
+            del binary.ldexp["FP32"]
+            del binary.ldexp["FP64"]
         # Fill in commutes info
         for left, right in cls._commutes_to.items():
+            if not _hasop(binary, left) or not _hasop(binary, right):  # pragma: no cover
+                continue
             left = getattr(binary, left)
             right = getattr(binary, right)
             left.commutes_to = right
             right.commutes_to = left
         for cur_op in cls._commutative:
+            if not _hasop(binary, cur_op):  # pragma: no cover
+                continue
             cur_op = getattr(binary, cur_op)
             cur_op.commutes_to = cur_op
         for left, right in cls._commutes_to_in_semiring.items():
+            if not _hasop(binary, left) or not _hasop(binary, right):  # pragma: no cover
+                continue
             left = getattr(binary, left)
             right = getattr(binary, right)
             left._semiring_commutes_to = right
@@ -1416,7 +1432,8 @@ class Semiring(OpBase):
             cls.register_new(f"{orig_name[:-3]}truediv", orig.monoid, binary.truediv)
             cls.register_new(f"{orig_name[:-3]}floordiv", orig.monoid, "floordiv", lazy=True)
         # For aggregators
-        cls.register_new("plus_pow", monoid.plus, binary.pow)
+        if _hasop(binary, "pow"):  # pragma: no branch
+            cls.register_new("plus_pow", monoid.plus, binary.pow)
         cls.register_new("plus_absfirst", monoid.plus, "absfirst", lazy=True)
         cls.register_new("max_absfirst", monoid.max, "absfirst", lazy=True)
 
@@ -1510,6 +1527,8 @@ class Semiring(OpBase):
             ("min_lor", "land_lor"),
             ("min_lxor", "land_lxor"),
         ):
+            if not _hasop(semiring, opname) or not _hasop(semiring, targetname):  # pragma: no cover
+                continue
             cur_op = getattr(semiring, opname)
             target = getattr(semiring, targetname)
             if "BOOL" in cur_op.types or "BOOL" not in target.types:  # pragma: no cover
@@ -1730,13 +1749,13 @@ _str_to_binary = {
     "/": binary.truediv,
     "//": "floordiv",
     "%": "numpy.mod",
-    "**": binary.pow,
+    "**": "pow",
     "&": binary.land,
     "|": binary.lor,
     "^": binary.lxor,
 }
 _str_to_monoid = {
-    "==": monoid.eq,
+    "==": "eq",
     "+": monoid.plus,
     "*": monoid.times,
     "&": monoid.land,
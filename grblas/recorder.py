@@ -1,11 +1,15 @@
 import collections
+import json
 
 from . import base, lib
 from .base import _recorder
 from .dtypes import DataType
 from .mask import Mask
-from .matrix import TransposedMatrix
+from .matrix import Matrix, TransposedMatrix
 from .operator import TypedOpBase
+from .vector import Vector
+
+ObjectStats = collections.namedtuple("ObjectStats", ["name", "nvals", "nbytes", "format"])
 
 
 def gbstr(arg):
@@ -27,6 +31,57 @@ def gbstr(arg):
     return name
 
 
+def _object_stats(arg):
+    if type(arg) is TransposedMatrix:
+        arg = arg._matrix
+    elif isinstance(arg, Mask):
+        arg = arg.mask
+    if type(arg) is not Matrix and type(arg) is not Vector:
+        return None
+    # SS, SuiteSparse-specific: nbytes and format
+    return ObjectStats(gbstr(arg), arg._nvals, arg.ss.nbytes, arg.ss.format)
+
+
+class CallInfo:
+    """Details of a single GraphBLAS C call recorded by an instrumented Recorder.
+
+    Attributes
+    ----------
+    cfunc_name : str
+        The name of the C function.
+    text : str
+        The C call as recorded in ``Recorder.data``.
+    start : int
+        Start time of the call from ``time.perf_counter_ns()``.
+    duration : int
+        Wall time of the call in nanoseconds.
+    error : str or None
+        Name of the exception raised by the call, if any.
+    before : list of ObjectStats
+        nvals, nbytes, and format of each Matrix and Vector argument before the call.
+    after : list of ObjectStats
+        nvals, nbytes, and format of each Matrix and Vector argument after the call.
+    burble : list of BurbleRecord or None
+        Diagnostics printed by the call if recorded within ``grblas.ss.burble()``.
+    """
+
+    __slots__ = "cfunc_name", "text", "start", "duration", "error", "before", "after", "burble"
+
+    def __init__(self, before):
+        self.before = before
+        self.cfunc_name = self.text = self.error = self.burble = None
+        self.start = self.duration = 0
+        self.after = []
+
+    @property
+    def nbytes_delta(self):
+        """Change in memory usage of the arguments in bytes"""
+        return sum(x.nbytes for x in self.after) - sum(x.nbytes for x in self.before)
+
+    def __repr__(self):
+        return f"<CallInfo {self.text} ({self.duration / 1e3:.1f} us)>"
+
+
 class Recorder:
     """Record GraphBLAS C calls.
 
@@ -41,25 +96,57 @@ class Recorder:
     'GrB_mxm(C, NULL, NULL, GxB_PLUS_TIMES_INT64, A, B, NULL)'
 
     Currently, only one recorder will record at a time within a context.
+
+    Use ``instrument=True`` to also record the wall time of each call and the
+    nvals, memory usage (``ss.nbytes``), and format of each Matrix and Vector
+    argument before and after the call.  These are stored as `CallInfo` objects
+    in ``.calls`` and can be summarized with ``.summary()`` or exported with
+    ``.to_chrome_trace()`` and ``.to_speedscope()``.  Getting nvals of the inputs
+    completes any pending work, so this adds overhead to every call.
     """
 
-    __slots__ = "data", "_token", "max_rows", "_prev_recorder", "__weakref__"
+    __slots__ = (
+        "data",
+        "calls",
+        "instrument",
+        "_token",
+        "max_rows",
+        "_prev_recorder",
+        "_burble",
+        "__weakref__",
+    )
 
-    def __init__(self, *, start=True, max_rows=20):
+    def __init__(self, *, start=True, max_rows=20, instrument=False):
         self.data = []
+        self.calls = []
+        self.instrument = instrument
         self._token = None
         self._prev_recorder = None
+        self._burble = None
         self.max_rows = max_rows
         if start:
             self.start()
 
-    def record(self, cfunc_name, args, *, exc=None):
+    def _begin_call(self, args):
+        return CallInfo([x for x in map(_object_stats, args) if x is not None])
+
+    def record(self, cfunc_name, args, *, exc=None, info=None):
         if not hasattr(lib, cfunc_name):
             cfunc_name = f"GxB_{cfunc_name[4:]}"
         val = f'{cfunc_name}({", ".join(gbstr(x) for x in args)});'
         if exc is not None:
             val += f" /* ERROR: {type(exc).__name__} */"
         self.data.append(val)
+        if info is not None:
+            info.cfunc_name = cfunc_name
+            info.text = val
+            if exc is None:
+                info.after = [x for x in map(_object_stats, args) if x is not None]
+            else:
+                info.error = type(exc).__name__
+            self.calls.append(info)
+        if self._burble is not None:
+            self._burble._collect(val, info)
         base._prev_recorder = self
 
     def record_raw(self, text):
@@ -82,6 +169,99 @@ class Recorder:
 
     def clear(self):
         self.data.clear()
+        self.calls.clear()
+
+    def summary(self):
+        """Summarize instrumented calls by C function as a pandas DataFrame.
+
+        Times are in seconds, and the rows are sorted by total time.
+        """
+        import pandas as pd
+
+        stats = {}
+        for info in self.calls:
+            if info.cfunc_name not in stats:
+                stats[info.cfunc_name] = [0, 0, 0, 0, 0]
+            cur = stats[info.cfunc_name]
+            cur[0] += 1
+            cur[1] += info.duration
+            cur[2] = max(cur[2], info.duration)
+            cur[3] += info.nbytes_delta
+            cur[4] += info.error is not None
+        df = pd.DataFrame.from_dict(
+            stats,
+            orient="index",
+            columns=["count", "total_time", "max_time", "nbytes_delta", "errors"],
+        )
+        df["total_time"] /= 1e9
+        df["max_time"] /= 1e9
+        df.insert(2, "mean_time", df["total_time"] / df["count"])
+        df.index.name = "cfunc_name"
+        return df.sort_values("total_time", ascending=False)
+
+    def _dump(self, data, filename):
+        if filename is not None:
+            with open(filename, "w") as f:
+                json.dump(data, f)
+        return data
+
+    def to_chrome_trace(self, filename=None):
+        """Export instrumented calls in the Chrome trace event format.
+
+        View the result in ``chrome://tracing`` or https://ui.perfetto.dev.
+        Returns the trace as a dict, and writes it as JSON if `filename` is given.
+        """
+        t0 = self.calls[0].start if self.calls else 0
+        events = []
+        for info in self.calls:
+            args = {"call": info.text}
+            for when in ["before", "after"]:
+                for stats in getattr(info, when):
+                    args[f"{stats.name} ({when})"] = stats._asdict()
+            if info.error is not None:
+                args["error"] = info.error
+            events.append(
+                {
+                    "name": info.cfunc_name,
+                    "cat": "grblas",
+                    "ph": "X",
+                    "ts": (info.start - t0) / 1e3,
+                    "dur": info.duration / 1e3,
+                    "pid": 0,
+                    "tid": 0,
+                    "args": args,
+                }
+            )
+        return self._dump({"traceEvents": events, "displayTimeUnit": "ms"}, filename)
+
+    def to_speedscope(self, filename=None):
+        """Export instrumented calls in the speedscope file format.
+
+        View the result at https://www.speedscope.app.
+        Returns the profile as a dict, and writes it as JSON if `filename` is given.
+        """
+        frames = {}
+        events = []
+        for info in self.calls:
+            frame = frames.setdefault(info.cfunc_name, len(frames))
+            events.append({"type": "O", "frame": frame, "at": info.start})
+            events.append({"type": "C", "frame": frame, "at": info.start + info.duration})
+        profile = {
+            "type": "evented",
+            "name": "grblas.Recorder",
+            "unit": "nanoseconds",
+            "startValue": events[0]["at"] if events else 0,
+            "endValue": events[-1]["at"] if events else 0,
+            "events": events,
+        }
+        data = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": [{"name": name} for name in frames]},
+            "profiles": [profile],
+            "name": "grblas.Recorder",
+            "exporter": "grblas",
+        }
+        return self._dump(data, filename)
 
     def __enter__(self):
         self.start()
@@ -1,13 +1,15 @@
 import itertools
+import weakref
 
 import numpy as np
 
 from . import _automethods, backend, ffi, utils
-from .base import BaseExpression, BaseType
+from .base import BaseExpression, BaseType, call
 from .binary import isclose
 from .dtypes import _INDEX, BOOL, lookup_dtype
+from .exceptions import NoValue
 from .operator import get_typed_op
-from .utils import output_type, wrapdoc
+from .utils import _Pointer, output_type, wrapdoc
 
 ffi_new = ffi.new
 
@@ -324,6 +326,45 @@ class ScalarExpression(BaseExpression):
     __ror__ = wrapdoc(Scalar.__ror__)(Scalar.__ror__)
 
 
+# Output Vectors of `_as_vector` by the id of their Scalar
+_output_vectors = {}
+
+
+def _as_vector(scalar, *, with_value=False):
+    """Vector of size 1 to use as the output of operations such as inner products.
+
+    The Vector is created once for each Scalar and reused.  If `with_value` is True,
+    it holds the value of `scalar` so it may be accumulated into.
+    """
+    key = id(scalar)
+    rv = _output_vectors.get(key)
+    if rv is None:
+        from .vector import Vector
+
+        rv = _output_vectors[key] = Vector.new(scalar.dtype, size=1)
+        weakref.finalize(scalar, _output_vectors.pop, key, None)
+    if with_value:
+        if scalar._is_empty:
+            rv.clear()
+        else:
+            call(f"GrB_Vector_setElement_{scalar.dtype}", [rv, _CScalar(scalar), _CScalar(0)])
+    return rv
+
+
+def _from_vector(scalar, vector):
+    """Set the value of `scalar` from the Vector of size 1 returned by `_as_vector`"""
+    if (
+        call(
+            f"GrB_Vector_extractElement_{scalar.dtype}",
+            [_Pointer(scalar), vector, _CScalar(0)],
+        )
+        is NoValue
+    ):
+        scalar.clear()
+    else:
+        scalar._is_empty = False
+
+
 class _CScalar:
     """Wrap scalars for calling into C.
 
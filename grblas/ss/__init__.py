@@ -1 +1,10 @@
+from ._burble import BurbleRecord, burble, parse_burble  # noqa
 from ._core import concat, diag  # noqa
+from ._memory import (  # noqa
+    MemoryReport,
+    MemoryUsage,
+    disable_memory_tracking,
+    enable_memory_tracking,
+    memory_report,
+)
+from ._tiled import TiledMatrix  # noqa
@@ -0,0 +1,196 @@
+import collections
+import ctypes
+import os
+import sys
+import tempfile
+
+from .. import base, ffi, lib
+from ..base import _recorder
+from ..exceptions import _error_code_lookup
+
+BurbleRecord = collections.namedtuple("BurbleRecord", ["call", "function", "seconds", "text"])
+BurbleRecord.__doc__ = """A single diagnostic message from SuiteSparse:GraphBLAS burble.
+
+call : str or None
+    The matching entry in ``Recorder.data``, if any.
+function : str
+    The name of the function that printed the message, such as ``"GrB_mxm"``.
+seconds : float or None
+    Time reported by SuiteSparse:GraphBLAS for the operation.
+text : str
+    The full message, which describes the algorithms and formats that were used,
+    such as ``"saxpy"`` or ``"dot"`` for mxm and any format conversions.
+"""
+
+
+def _get_burble():
+    val = ffi.new("bool*")
+    info = lib.GxB_Global_Option_get(lib.GxB_BURBLE, val)
+    if info != lib.GrB_SUCCESS:  # pragma: no cover
+        raise _error_code_lookup[info]("Unable to get GxB_BURBLE")
+    return val[0]
+
+
+def _set_burble(val):
+    # GxB_Global_Option_set is variadic, so the argument type must be given explicitly
+    info = lib.GxB_Global_Option_set(lib.GxB_BURBLE, ffi.cast("int", val))
+    if info != lib.GrB_SUCCESS:  # pragma: no cover
+        raise _error_code_lookup[info]("Unable to set GxB_BURBLE")
+
+
+def _fflush():
+    # Flush the C stdout buffer so all burble output is written to the file descriptor
+    try:
+        libc = ctypes.CDLL(None)
+    except OSError:  # pragma: no cover (Windows)
+        libc = ctypes.cdll.msvcrt
+    libc.fflush(None)
+
+
+def parse_burble(text, call=None):
+    """Parse burble output into a list of `BurbleRecord`.
+
+    Each message is enclosed in (possibly nested) square brackets.  Text that isn't
+    part of a message is ignored.
+    """
+    records = []
+    depth = 0
+    start = 0
+    for i, c in enumerate(text):
+        if c == "[":
+            if depth == 0:
+                start = i + 1
+            depth += 1
+        elif c == "]" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                records.append(_make_record(" ".join(text[start:i].split()), call))
+    return records
+
+
+def _make_record(message, call):
+    words = message.split()
+    function = words[0] if words else ""
+    seconds = None
+    if len(words) >= 2 and words[-1] == "sec":
+        try:
+            seconds = float(words[-2])
+        except ValueError:  # pragma: no cover
+            pass
+        else:
+            message = " ".join(words[:-2])
+    return BurbleRecord(call, function, seconds, message)
+
+
+class burble:
+    """Enable SuiteSparse:GraphBLAS burble diagnostics and capture them into Python.
+
+    Burble reports the algorithms chosen by SuiteSparse:GraphBLAS, such as saxpy
+    vs dot product for mxm, and any format conversions.  The C library prints this
+    to stdout, so when `capture` is True (the default), the stdout file descriptor
+    is redirected to a temporary file while the context is active.  Other output
+    written to stdout is passed through when the context exits.  If `capture` is
+    False, burble is printed as usual and nothing is parsed.
+
+    Burble messages are parsed into ``.records`` as `BurbleRecord` objects.
+    Each record is associated with the GraphBLAS call that created it using the
+    active `Recorder`, or a new Recorder if none is active.  If the Recorder is
+    instrumented, the records are also attached to the matching ``CallInfo.burble``.
+
+    >>> with grblas.ss.burble() as b:
+    ...     C = A.mxm(B).new()
+    >>> b.records[-1].function
+    'GrB_mxm'
+
+    Burble is a global option, so this isn't thread-safe.
+    """
+
+    __slots__ = "capture", "records", "recorder", "text", "_prev", "_owns_recorder", "_stdout"
+
+    def __init__(self, *, capture=True):
+        self.capture = capture
+        self.records = []
+        self.recorder = None
+        self.text = ""
+        self._prev = None
+        self._owns_recorder = False
+        self._stdout = None
+
+    def __enter__(self):
+        from ..recorder import Recorder
+
+        self.records = []
+        self.text = ""
+        rec = _recorder.get(base._prev_recorder)
+        self._owns_recorder = rec is None
+        if rec is None:
+            rec = Recorder()
+        rec._burble = self
+        self.recorder = rec
+        if self.capture:
+            sys.stdout.flush()
+            _fflush()
+            tmp = tempfile.TemporaryFile(buffering=0)
+            saved_fd = os.dup(1)
+            os.dup2(tmp.fileno(), 1)
+            self._stdout = (tmp, saved_fd, 0)
+        self._prev = _get_burble()
+        _set_burble(True)
+        return self
+
+    def __exit__(self, type_, value, traceback):
+        _set_burble(self._prev)
+        self._collect(None)
+        if self.capture:
+            tmp, saved_fd, _ = self._stdout
+            os.dup2(saved_fd, 1)
+            os.close(saved_fd)
+            tmp.close()
+            self._stdout = None
+        self.recorder._burble = None
+        if self._owns_recorder:
+            self.recorder.stop()
+        # Pass through output that wasn't from burble
+        other = self._other_text()
+        if other.strip():
+            sys.stdout.write(other)
+
+    def _read(self):
+        if self._stdout is None:
+            return ""
+        sys.stdout.flush()
+        _fflush()
+        tmp, saved_fd, pos = self._stdout
+        tmp.seek(pos)
+        data = tmp.read()
+        self._stdout = (tmp, saved_fd, pos + len(data))
+        return data.decode(errors="replace")
+
+    def _collect(self, call, info=None):
+        """Parse new output and associate it with `call` (called by Recorder.record)"""
+        text = self._read()
+        if not text:
+            return
+        self.text += text
+        records = parse_burble(text, call)
+        self.records.extend(records)
+        if info is not None:
+            info.burble = records
+
+    def _other_text(self):
+        depth = 0
+        other = []
+        for c in self.text:
+            if c == "[":
+                depth += 1
+            elif c == "]" and depth > 0:
+                depth -= 1
+            elif depth == 0:
+                other.append(c)
+        # Drop the whitespace that burble puts around each message
+        return "".join(line for line in "".join(other).splitlines(True) if line.strip())
+
+    def __repr__(self):
+        lines = [f"grblas.ss.burble ({len(self.records)} records)"]
+        lines.extend(f"  {record.text}" for record in self.records)
+        return "\n".join(lines)
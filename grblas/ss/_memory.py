@@ -0,0 +1,141 @@
+import collections
+import threading
+import weakref
+
+from .. import base, ffi, lib
+from ..exceptions import check_status
+from ..matrix import Matrix
+
+MemoryUsage = collections.namedtuple("MemoryUsage", ["name", "type", "shape", "nvals", "nbytes"])
+
+
+class _MemoryTracker:
+    __slots__ = "objects", "sampled_peak_nbytes", "peak_nobjects", "_lock"
+
+    def __init__(self):
+        self.objects = weakref.WeakSet()
+        # Only measured in `usage`, so allocations between calls may be missed
+        self.sampled_peak_nbytes = 0
+        self.peak_nobjects = 0
+        self._lock = threading.Lock()
+
+    def add(self, obj):
+        with self._lock:
+            self.objects.add(obj)
+            nobjects = len(self.objects)
+            if nobjects > self.peak_nobjects:
+                self.peak_nobjects = nobjects
+
+    def usage(self):
+        with self._lock:
+            objects = list(self.objects)
+        rv = []
+        size = ffi.new("size_t*")
+        nvals = ffi.new("GrB_Index*")
+        for obj in objects:
+            gb_obj = obj.gb_obj[0]
+            if gb_obj == ffi.NULL:
+                # Not yet created
+                continue
+            # Use lib directly so these calls aren't recorded or hooked
+            if type(obj) is Matrix:
+                check_status(lib.GxB_Matrix_memoryUsage(size, gb_obj), obj)
+                check_status(lib.GrB_Matrix_nvals(nvals, gb_obj), obj)
+                shape = (obj._nrows, obj._ncols)
+            else:
+                check_status(lib.GxB_Vector_memoryUsage(size, gb_obj), obj)
+                check_status(lib.GrB_Vector_nvals(nvals, gb_obj), obj)
+                shape = (obj._size,)
+            rv.append(MemoryUsage(obj.name, type(obj).__name__, shape, nvals[0], size[0]))
+        total = sum(x.nbytes for x in rv)
+        with self._lock:
+            if total > self.sampled_peak_nbytes:
+                self.sampled_peak_nbytes = total
+        return rv
+
+
+def enable_memory_tracking():
+    """Track all Matrix and Vector objects created from now on for ``memory_report``.
+
+    Objects are tracked with weak references, so tracking doesn't keep them alive.
+    """
+    if base._memory_tracker is None:
+        base._memory_tracker = _MemoryTracker()
+
+
+def disable_memory_tracking():
+    """Stop tracking Matrix and Vector objects and forget those already tracked"""
+    base._memory_tracker = None
+
+
+class MemoryReport:
+    """Memory held by live Matrix and Vector objects; see ``memory_report``.
+
+    Attributes
+    ----------
+    nbytes : int
+        Total memory in bytes of all tracked objects.
+    nobjects : int
+        Number of live tracked objects.
+    sampled_peak_nbytes : int
+        Largest total memory seen by any ``memory_report`` since tracking was enabled.
+        Memory is only measured when ``memory_report`` is called, so this is a lower
+        bound of the true peak.  Use ``grblas.memory.MemoryManager`` to measure the
+        true peak.
+    peak_nobjects : int
+        Largest number of live tracked objects since tracking was enabled.
+    by_type : dict
+        Mapping of "Matrix" and "Vector" to ``(count, nbytes)``.
+    top : list of MemoryUsage
+        The largest objects sorted by nbytes.
+    """
+
+    __slots__ = "nbytes", "nobjects", "sampled_peak_nbytes", "peak_nobjects", "by_type", "top"
+
+    def __init__(self, usage, n, sampled_peak_nbytes, peak_nobjects):
+        self.nbytes = sum(x.nbytes for x in usage)
+        self.nobjects = len(usage)
+        self.sampled_peak_nbytes = sampled_peak_nbytes
+        self.peak_nobjects = peak_nobjects
+        self.by_type = {}
+        for x in usage:
+            count, nbytes = self.by_type.get(x.type, (0, 0))
+            self.by_type[x.type] = (count + 1, nbytes + x.nbytes)
+        self.top = sorted(usage, key=lambda x: x.nbytes, reverse=True)[:n]
+
+    def __repr__(self):
+        lines = [
+            "grblas.ss.memory_report",
+            f"  total: {self.nbytes} bytes in {self.nobjects} objects",
+            f"  sampled peak: {self.sampled_peak_nbytes} bytes",
+            f"  peak: {self.peak_nobjects} objects",
+        ]
+        for typ, (count, nbytes) in sorted(self.by_type.items()):
+            lines.append(f"  {typ}: {nbytes} bytes in {count} objects")
+        if self.top:
+            lines.append("  largest:")
+            width = max(len(x.name) for x in self.top)
+            for x in self.top:
+                lines.append(
+                    f"    {x.name:<{width}}  {x.type:<6}  shape={x.shape}  "
+                    f"nvals={x.nvals}  nbytes={x.nbytes}"
+                )
+        return "\n".join(lines)
+
+
+def memory_report(n=10):
+    """Report the memory held by live Matrix and Vector objects and the n largest objects.
+
+    This requires ``enable_memory_tracking()`` to have been called, and only
+    objects created after that are included.  Memory is only measured when this is
+    called, so ``sampled_peak_nbytes`` is the largest total seen by these calls
+    rather than the true high-water mark.  Call it periodically to sample it.
+    """
+    tracker = base._memory_tracker
+    if tracker is None:
+        raise RuntimeError(
+            "Memory tracking is not enabled.  Use `grblas.ss.enable_memory_tracking()` to "
+            "track Matrix and Vector objects created afterwards."
+        )
+    usage = tracker.usage()
+    return MemoryReport(usage, n, tracker.sampled_peak_nbytes, tracker.peak_nobjects)
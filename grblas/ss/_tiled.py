@@ -0,0 +1,296 @@
+import itertools
+import json
+import os
+
+import numpy as np
+
+from .. import monoid, semiring
+from .._ss.matrix import get_reduce_monoid, normalize_chunks, reduce_tiles_scalar
+from ..base import _expect_op, _expect_type
+from ..dtypes import lookup_dtype
+from ..exceptions import DimensionMismatch
+from ..matrix import Matrix, TransposedMatrix
+from ..operator import get_typed_op
+from ..vector import Vector
+
+_METADATA_FILENAME = "tiles.json"
+
+
+class _tiled_matrix:
+    """Used in `_expect_type` by classmethods"""
+
+
+_tiled_matrix.__name__ = "TiledMatrix"
+_tiled_matrix = _tiled_matrix()
+
+
+class TiledMatrix:
+    """A Matrix stored on disk as a 2D grid of tiles, one file per tile.
+
+    Tiles are only loaded when needed, so operations such as ``mxv``, ``vxm``
+    and the reductions stream one tile through memory at a time.  This allows
+    working with matrices that are larger than memory.
+
+    Tiles follow the chunking model of `Matrix.ss.split` and `grblas.ss.concat`,
+    and each tile is stored as the (uncompressed) ``.npz`` of ``Matrix.ss.export``.
+
+    Use ``TiledMatrix.from_matrix`` to write an in-memory Matrix to disk, or
+    ``TiledMatrix.create`` followed by ``write_tile`` to build one tile at a time.
+    Use ``TiledMatrix(path)`` to open an existing tiled matrix.
+
+    **THIS API IS EXPERIMENTAL AND MAY CHANGE**
+    """
+
+    __slots__ = "path", "dtype", "_nrows", "_ncols", "_tile_nrows", "_tile_ncols", "_tile_nvals"
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        with open(os.path.join(self.path, _METADATA_FILENAME)) as f:
+            metadata = json.load(f)
+        self.dtype = lookup_dtype(metadata["dtype"])
+        self._nrows = metadata["nrows"]
+        self._ncols = metadata["ncols"]
+        self._tile_nrows = metadata["tile_nrows"]
+        self._tile_ncols = metadata["tile_ncols"]
+        self._tile_nvals = metadata["tile_nvals"]
+
+    @classmethod
+    def create(cls, path, dtype, nrows, ncols, chunks):
+        """Create a new, empty tiled matrix in directory `path`.
+
+        `chunks` is interpreted the same as in `Matrix.ss.split`.
+        """
+        dtype = lookup_dtype(dtype)
+        tile_nrows, tile_ncols = normalize_chunks(chunks, (nrows, ncols))
+        path = os.fspath(path)
+        os.makedirs(path, exist_ok=True)
+        if os.path.exists(os.path.join(path, _METADATA_FILENAME)):
+            raise FileExistsError(f"A tiled matrix already exists in {path!r}")
+        metadata = {
+            "dtype": dtype.name,
+            "nrows": nrows,
+            "ncols": ncols,
+            "tile_nrows": tile_nrows,
+            "tile_ncols": tile_ncols,
+            "tile_nvals": [[0] * len(tile_ncols) for _ in tile_nrows],
+        }
+        with open(os.path.join(path, _METADATA_FILENAME), "w") as f:
+            json.dump(metadata, f)
+        return cls(path)
+
+    @classmethod
+    def from_matrix(cls, matrix, path, chunks):
+        """Split `matrix` into tiles according to `chunks` and write them to `path`"""
+        matrix = _expect_type(
+            _tiled_matrix,
+            matrix,
+            (Matrix, TransposedMatrix),
+            within="from_matrix",
+            argname="matrix",
+        )
+        if type(matrix) is TransposedMatrix:
+            matrix = matrix.new()
+        rv = cls.create(path, matrix.dtype, matrix._nrows, matrix._ncols, chunks)
+        # SS, SuiteSparse-specific: split
+        tiles = matrix.ss.split([rv._tile_nrows, rv._tile_ncols])
+        for i, row_tiles in enumerate(tiles):
+            for j, tile in enumerate(row_tiles):
+                rv._write_tile(i, j, tile)
+        rv._write_metadata()
+        return rv
+
+    @property
+    def nrows(self):
+        return self._nrows
+
+    @property
+    def ncols(self):
+        return self._ncols
+
+    @property
+    def shape(self):
+        return (self._nrows, self._ncols)
+
+    @property
+    def nvals(self):
+        return sum(map(sum, self._tile_nvals))
+
+    @property
+    def chunks(self):
+        """Tile sizes for each dimension, as returned by `normalize_chunks`"""
+        return [list(self._tile_nrows), list(self._tile_ncols)]
+
+    @property
+    def ntiles(self):
+        """The number of tiles in each dimension"""
+        return (len(self._tile_nrows), len(self._tile_ncols))
+
+    def __repr__(self):
+        m, n = self.ntiles
+        return (
+            f"TiledMatrix({self.path!r}, dtype={self.dtype}, shape={self.shape}, "
+            f"nvals={self.nvals}, tiles={m}x{n})"
+        )
+
+    def _tile_filename(self, i, j):
+        return os.path.join(self.path, f"tile_{i}_{j}.npz")
+
+    def _write_metadata(self):
+        metadata = {
+            "dtype": self.dtype.name,
+            "nrows": self._nrows,
+            "ncols": self._ncols,
+            "tile_nrows": self._tile_nrows,
+            "tile_ncols": self._tile_ncols,
+            "tile_nvals": self._tile_nvals,
+        }
+        with open(os.path.join(self.path, _METADATA_FILENAME), "w") as f:
+            json.dump(metadata, f)
+
+    def write_tile(self, i, j, tile):
+        """Write `tile` to position ``[i, j]``, replacing the previous tile"""
+        self._write_tile(i, j, tile)
+        self._write_metadata()
+
+    def _write_tile(self, i, j, tile):
+        # Write the tile without updating the metadata on disk
+        tile = _expect_type(
+            self, tile, (Matrix, TransposedMatrix), within="write_tile", argname="tile"
+        )
+        shape = (self._tile_nrows[i], self._tile_ncols[j])
+        if tile.shape != shape:
+            raise ValueError(f"Tile [{i}, {j}] must have shape {shape}; got {tile.shape}")
+        if type(tile) is TransposedMatrix or tile.dtype != self.dtype:
+            tile = tile.new(self.dtype)
+        nvals = tile._nvals
+        filename = self._tile_filename(i, j)
+        if nvals == 0:
+            # Empty tiles aren't stored
+            if os.path.exists(filename):
+                os.remove(filename)
+        else:
+            # SS, SuiteSparse-specific: export
+            info = tile.ss.export()
+            np.savez(filename, **info)
+        self._tile_nvals[i][j] = nvals
+
+    def tile(self, i, j, *, name=None):
+        """Load the tile at position ``[i, j]`` from disk into a new Matrix"""
+        nrows = self._tile_nrows[i]
+        ncols = self._tile_ncols[j]
+        if name is None:
+            name = f"tile_{i}x{j}"
+        if self._tile_nvals[i][j] == 0:
+            return Matrix.new(self.dtype, nrows, ncols, name=name)
+        with np.load(self._tile_filename(i, j)) as f:
+            info = {key: f[key] for key in f.files}
+        info = {key: val.item() if val.ndim == 0 else val for key, val in info.items()}
+        # SS, SuiteSparse-specific: import
+        return Matrix.ss.import_any(**info, dtype=self.dtype, take_ownership=True, name=name)
+
+    def iter_tiles(self, *, skip_empty=False):
+        """Yield ``(i, j, tile)`` for each tile in row-major order, loading one at a time"""
+        for i, j in itertools.product(range(len(self._tile_nrows)), range(len(self._tile_ncols))):
+            if skip_empty and self._tile_nvals[i][j] == 0:
+                continue
+            yield i, j, self.tile(i, j)
+
+    def to_matrix(self, *, name=None):
+        """Load all tiles and concatenate them into a new Matrix"""
+        from ._core import concat
+
+        m, n = self.ntiles
+        tiles = [[self.tile(i, j) for j in range(n)] for i in range(m)]
+        # SS, SuiteSparse-specific: concat
+        return concat(tiles, self.dtype, name=name)
+
+    def _offsets(self, sizes):
+        return np.cumsum([0] + sizes).tolist()
+
+    def mxv(self, other, op=semiring.plus_times, *, name=None):
+        """Matrix-Vector multiplication, streaming one tile at a time.
+
+        Unlike ``Matrix.mxv``, this computes and returns a new Vector.
+        """
+        other = _expect_type(self, other, Vector, within="mxv", argname="other")
+        if other._size != self._ncols:
+            raise DimensionMismatch(f"Size mismatch: {self.shape} and Vector of size {other._size}")
+        op = get_typed_op(op, self.dtype, other.dtype, kind="semiring")
+        _expect_op(self, op, "Semiring", within="mxv", argname="op")
+        row_offsets = self._offsets(self._tile_nrows)
+        col_offsets = self._offsets(self._tile_ncols)
+        pieces = [other[start:stop].new() for start, stop in zip(col_offsets, col_offsets[1:])]
+        rv = Vector.new(op.return_type, self._nrows, name=name)
+        for i, (start, stop) in enumerate(zip(row_offsets, row_offsets[1:])):
+            partial = Vector.new(op.return_type, stop - start)
+            for j, piece in enumerate(pieces):
+                if self._tile_nvals[i][j] == 0 or piece._nvals == 0:
+                    continue
+                partial(op.monoid) << self.tile(i, j).mxv(piece, op)
+            if partial._nvals > 0:
+                rv[start:stop] = partial
+        return rv
+
+    def vxm(self, other, op=semiring.plus_times, *, name=None):
+        """Vector-Matrix multiplication (``other @ self``), streaming one tile at a time.
+
+        This computes and returns a new Vector.
+        """
+        other = _expect_type(self, other, Vector, within="vxm", argname="other")
+        if other._size != self._nrows:
+            raise DimensionMismatch(f"Size mismatch: Vector of size {other._size} and {self.shape}")
+        op = get_typed_op(op, other.dtype, self.dtype, kind="semiring")
+        _expect_op(self, op, "Semiring", within="vxm", argname="op")
+        row_offsets = self._offsets(self._tile_nrows)
+        col_offsets = self._offsets(self._tile_ncols)
+        pieces = [other[start:stop].new() for start, stop in zip(row_offsets, row_offsets[1:])]
+        partials = [
+            Vector.new(op.return_type, stop - start)
+            for start, stop in zip(col_offsets, col_offsets[1:])
+        ]
+        # Iterate in row-major order so each tile is loaded exactly once
+        for i, j, tile in self.iter_tiles(skip_empty=True):
+            if pieces[i]._nvals > 0:
+                partials[j](op.monoid) << pieces[i].vxm(tile, op)
+        rv = Vector.new(op.return_type, self._ncols, name=name)
+        for start, stop, partial in zip(col_offsets, col_offsets[1:], partials):
+            if partial._nvals > 0:
+                rv[start:stop] = partial
+        return rv
+
+    def reduce_rowwise(self, op=monoid.plus, *, name=None):
+        """Reduce all values in each row into a new Vector, streaming one tile at a time"""
+        op = get_reduce_monoid(self, op, "reduce_rowwise")
+        row_offsets = self._offsets(self._tile_nrows)
+        rv = Vector.new(op.return_type, self._nrows, name=name)
+        partial = None
+        cur_row = None
+        for i, j, tile in self.iter_tiles(skip_empty=True):
+            if i != cur_row:
+                if partial is not None and partial._nvals > 0:
+                    rv[row_offsets[cur_row] : row_offsets[cur_row + 1]] = partial
+                partial = Vector.new(op.return_type, self._tile_nrows[i])
+                cur_row = i
+            partial(op) << tile.reduce_rowwise(op)
+        if partial is not None and partial._nvals > 0:
+            rv[row_offsets[cur_row] : row_offsets[cur_row + 1]] = partial
+        return rv
+
+    def reduce_columnwise(self, op=monoid.plus, *, name=None):
+        """Reduce all values in each column into a new Vector, streaming one tile at a time"""
+        op = get_reduce_monoid(self, op, "reduce_columnwise")
+        col_offsets = self._offsets(self._tile_ncols)
+        partials = [Vector.new(op.return_type, ncols) for ncols in self._tile_ncols]
+        for i, j, tile in self.iter_tiles(skip_empty=True):
+            partials[j](op) << tile.reduce_columnwise(op)
+        rv = Vector.new(op.return_type, self._ncols, name=name)
+        for start, stop, partial in zip(col_offsets, col_offsets[1:], partials):
+            if partial._nvals > 0:
+                rv[start:stop] = partial
+        return rv
+
+    def reduce_scalar(self, op=monoid.plus, *, name=None):
+        """Reduce all values into a new Scalar, streaming one tile at a time"""
+        op = get_reduce_monoid(self, op, "reduce_scalar")
+        tiles = (tile for i, j, tile in self.iter_tiles(skip_empty=True))
+        return reduce_tiles_scalar(tiles, op, name=name)
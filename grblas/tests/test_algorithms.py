@@ -0,0 +1,306 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from grblas import Matrix, Vector, algorithms, monoid, unary
+from grblas.exceptions import DimensionMismatch
+
+
+@pytest.fixture
+def A():
+    #    0 1 2 3 4 5 6
+    # 0 [- 2 - 3 - - -]
+    # 1 [- - - - 8 - 4]
+    # 2 [- - - - - 1 -]
+    # 3 [3 - 3 - - - -]
+    # 4 [- - - - - 7 -]
+    # 5 [- - 1 - - - -]
+    # 6 [- - 5 7 3 - -]
+    data = [
+        [3, 0, 3, 5, 6, 0, 6, 1, 6, 2, 4, 1],
+        [0, 1, 2, 2, 2, 3, 3, 4, 4, 5, 5, 6],
+        [3, 2, 3, 1, 5, 3, 7, 8, 3, 1, 7, 4],
+    ]
+    return Matrix.from_values(*data)
+
+
+@pytest.fixture
+def G():
+    # A larger random graph, so "auto" switches between push and pull
+    rng = np.random.default_rng(1)
+    n = 300
+    rows = rng.integers(0, n, size=6 * n)
+    cols = rng.integers(0, n, size=6 * n)
+    return Matrix.from_values(rows, cols, 1.5, nrows=n, ncols=n)
+
+
+def reference_bfs(A, source):
+    rows, cols, _ = A.to_values()
+    neighbors = [[] for _ in range(A.nrows)]
+    for i, j in zip(rows.tolist(), cols.tolist()):
+        neighbors[i].append(j)
+    levels = {source: 0}
+    queue = deque([source])
+    while queue:
+        i = queue.popleft()
+        for j in neighbors[i]:
+            if j not in levels:
+                levels[j] = levels[i] + 1
+                queue.append(j)
+    return levels
+
+
+def as_dict(v):
+    indices, values = v.to_values()
+    return dict(zip(indices.tolist(), values.tolist()))
+
+
+def check_parents(A, source, parents):
+    levels = reference_bfs(A, source)
+    assert parents.keys() == levels.keys()
+    rows, cols, _ = A.to_values()
+    expected = {source: source}
+    for i, j in zip(rows.tolist(), cols.tolist()):
+        # The parent with the smallest index on the previous level
+        if j != source and i in levels and levels[i] == levels[j] - 1:
+            expected[j] = min(i, expected.get(j, i))
+    assert parents == expected
+
+
+@pytest.mark.parametrize("direction", ["auto", "push", "pull"])
+def test_bfs_levels(A, G, direction):
+    for M in [A, G]:
+        for source in [0, 1, 5]:
+            levels = algorithms.bfs_levels(M, source, direction=direction)
+            assert type(levels) is Vector
+            assert as_dict(levels) == reference_bfs(M, source)
+        sources = [1, 5, 1, 6]
+        levels = algorithms.bfs_levels(M, sources, direction=direction, name="levels")
+        assert type(levels) is Matrix
+        assert levels.shape == (4, M.nrows)
+        assert levels.name == "levels"
+        for r, source in enumerate(sources):
+            assert as_dict(levels[r, :].new()) == reference_bfs(M, source)
+
+
+@pytest.mark.parametrize("direction", ["auto", "push", "pull"])
+def test_bfs_parents(A, G, direction):
+    for M in [A, G]:
+        for source in [0, 1, 5]:
+            parents = algorithms.bfs_parents(M, source, direction=direction)
+            check_parents(M, source, as_dict(parents))
+        sources = [3, 0]
+        parents = algorithms.bfs_parents(M, sources, direction=direction)
+        for r, source in enumerate(sources):
+            check_parents(M, source, as_dict(parents[r, :].new()))
+
+
+def test_bfs_bad_args(A):
+    with pytest.raises(DimensionMismatch):
+        algorithms.bfs_levels(A[:, :5].new(), 0)
+    with pytest.raises(ValueError, match="direction"):
+        algorithms.bfs_parents(A, 0, direction="sideways")
+
+
+def reference_pagerank(M, damping, p, iters=500):
+    rows, cols, _ = M.to_values()
+    dense = np.zeros(M.shape)
+    dense[rows, cols] = 1
+    degrees = dense.sum(axis=1)
+    has_edges = degrees > 0
+    p = p / p.sum()
+    r = p.copy()
+    for _ in range(iters):
+        r = damping * (r[has_edges] / degrees[has_edges]) @ dense[has_edges]
+        r += (1 - r.sum()) * p
+    return r
+
+
+def test_pagerank(A, G):
+    for M in [A, G]:
+        n = M.nrows
+        r = algorithms.pagerank(M, tol=1e-12, max_iter=500, name="ranks")
+        assert r.name == "ranks"
+        assert r.nvals == n
+        expected = reference_pagerank(M, 0.85, np.ones(n))
+        np.testing.assert_allclose(r.to_values()[1], expected, atol=1e-9)
+        assert abs(r.reduce().new().value - 1) < 1e-9
+        # Personalized
+        weights = np.zeros(n)
+        weights[[1, 4]] = [3, 1]
+        p = Vector.from_values([1, 4], [3, 1], size=n)
+        r = algorithms.pagerank(M, 0.7, tol=1e-12, max_iter=500, personalization=p)
+        expected = reference_pagerank(M, 0.7, weights)
+        indices, values = r.to_values()
+        np.testing.assert_allclose(values, expected[indices], atol=1e-9)
+        np.testing.assert_allclose(np.delete(expected, indices), 0, atol=1e-12)
+        # Batched personalization gives the same results as one at a time
+        P = Matrix.from_values([0, 1, 2, 2], [0, 5, 3, 6], [1, 1, 2, 2], ncols=n)
+        R = algorithms.pagerank(M, tol=1e-12, max_iter=500, personalization=P)
+        assert R.shape == (3, n)
+        for k in range(3):
+            row = P[k, :].new()
+            r = algorithms.pagerank(M, tol=1e-12, max_iter=500, personalization=row)
+            assert R[k, :].new().isclose(r, abs_tol=1e-9)
+
+
+def test_pagerank_bad_args(A):
+    with pytest.raises(DimensionMismatch):
+        algorithms.pagerank(A[:, :5].new())
+    with pytest.raises(ValueError, match="damping"):
+        algorithms.pagerank(A, 1.5)
+    with pytest.raises(DimensionMismatch):
+        algorithms.pagerank(A, personalization=Vector.from_values([0], [1], size=3))
+    with pytest.raises(ValueError, match="positive sum"):
+        algorithms.pagerank(A, personalization=Vector.new(int, 7))
+    with pytest.raises(ValueError, match="positive sum"):
+        algorithms.pagerank(A, personalization=Matrix.from_values([1], [1], [1], nrows=2, ncols=7))
+    with pytest.raises(TypeError, match="personalization"):
+        algorithms.pagerank(A, personalization=[1, 2])
+
+
+def reference_sssp(M, source):
+    # Bellman-Ford on the edge list
+    rows, cols, weights = M.to_values()
+    edges = list(zip(rows.tolist(), cols.tolist(), weights.tolist()))
+    dist = {source: 0}
+    for _ in range(M.nrows):
+        for i, j, w in edges:
+            if i in dist and (j not in dist or dist[i] + w < dist[j]):
+                dist[j] = dist[i] + w
+    return dist
+
+
+def check_sssp_parents(M, source, dist, parents):
+    assert parents.keys() == dist.keys()
+    assert parents[source] == source
+    for j, i in parents.items():
+        if j != source:
+            assert dist[i] + M[i, j].value == dist[j]
+
+
+@pytest.mark.parametrize("method", ["bellman_ford", "delta_stepping"])
+def test_sssp(A, method):
+    rng = np.random.default_rng(2)
+    n = 60
+    rows = rng.integers(0, n, size=4 * n)
+    cols = rng.integers(0, n, size=4 * n)
+    weights = rng.random(4 * n) * 10
+    W = Matrix.from_values(rows, cols, weights, nrows=n, ncols=n, dup_op="min")
+    for M, delta in [(A, 2), (A, None), (W, 0.5), (W, None)]:
+        for source in [0, 1, 5]:
+            dist = algorithms.sssp(M, source, method, delta=delta)
+            assert type(dist) is Vector
+            expected = reference_sssp(M, source)
+            expected = Vector.from_values(list(expected), list(expected.values()), size=M.nrows)
+            assert dist.isclose(expected)
+        sources = [1, 5, 3]
+        dist, parents = algorithms.sssp(M, sources, method, delta=delta, parents=True)
+        assert type(dist) is Matrix and dist.shape == (3, M.nrows)
+        for r, source in enumerate(sources):
+            expected = reference_sssp(M, source)
+            row = as_dict(dist[r, :].new())
+            assert row == pytest.approx(expected)
+            check_sssp_parents(M, source, row, as_dict(parents[r, :].new()))
+        dist, parents = algorithms.sssp(M, 1, method, delta=delta, parents=True)
+        check_sssp_parents(M, 1, as_dict(dist), as_dict(parents))
+
+
+def test_sssp_negative_weights():
+    M = Matrix.from_values([0, 0, 1, 2], [1, 2, 3, 1], [4, 1, 1, -3])
+    dist = algorithms.sssp(M, 0)
+    assert dist.isequal(Vector.from_values([0, 1, 2, 3], [0, -2, 1, -1]))
+    with pytest.raises(ValueError, match="non-negative"):
+        algorithms.sssp(M, 0, "delta_stepping")
+    # Negative cycle 1 -> 3 -> 2 -> 1
+    M = Matrix.from_values([0, 1, 3, 2], [1, 3, 2, 1], [1, 1, -3, 1])
+    with pytest.raises(ValueError, match="negative-weight cycle"):
+        algorithms.sssp(M, 0)
+    with pytest.raises(ValueError, match="method"):
+        algorithms.sssp(M, 0, "dijkstra")
+    with pytest.raises(ValueError, match="delta"):
+        algorithms.sssp(M.apply(unary.abs).new(), 0, "delta_stepping", delta=0)
+
+
+@pytest.fixture
+def U():
+    # Undirected graph with a self-edge and vertices of very different degrees
+    rng = np.random.default_rng(3)
+    n = 40
+    rows = rng.integers(0, n, size=150)
+    cols = rng.integers(0, n // 4, size=150)
+    M = Matrix.from_values(rows, cols, 2, nrows=n, ncols=n)
+    M << M.ewise_add(M.T, monoid.any)
+    M[7, 7] << 2
+    return M
+
+
+def dense_adjacency(M):
+    rows, cols, _ = M.to_values()
+    dense = np.zeros(M.shape, dtype=np.int64)
+    dense[rows, cols] = 1
+    np.fill_diagonal(dense, 0)
+    return dense
+
+
+@pytest.mark.parametrize("method", ["sandia", "burkhardt", "cohen"])
+@pytest.mark.parametrize("sort", [False, True])
+def test_triangles(U, method, sort):
+    dense = dense_adjacency(U)
+    expected = np.trace(dense @ dense @ dense) // 6
+    assert expected > 0
+    assert algorithms.triangles(U, method, sort=sort) == expected
+    assert algorithms.triangles(Matrix.new(bool, 5, 5), method, sort=sort) == 0
+
+
+def test_local_clustering(U):
+    dense = dense_adjacency(U)
+    tri = np.diag(dense @ dense @ dense)
+    degrees = dense.sum(axis=1)
+    pairs = degrees * (degrees - 1)
+    expected = np.divide(tri, pairs, out=np.zeros(U.nrows), where=pairs > 0)
+    result = algorithms.local_clustering(U, name="clustering")
+    assert result.name == "clustering"
+    assert result.nvals == U.nrows
+    np.testing.assert_allclose(result.to_values()[1], expected)
+
+
+def test_triangles_bad_args(A, U):
+    with pytest.raises(DimensionMismatch):
+        algorithms.triangles(A[:, :5].new())
+    with pytest.raises(ValueError, match="method"):
+        algorithms.triangles(U, "naive")
+
+
+def reference_components(M):
+    labels = list(range(M.nrows))
+
+    def find(i):
+        while labels[i] != i:
+            i = labels[i]
+        return i
+
+    rows, cols, _ = M.to_values()
+    for i, j in zip(rows.tolist(), cols.tolist()):
+        i, j = find(i), find(j)
+        labels[max(i, j)] = min(i, j)
+    return [find(i) for i in range(M.nrows)]
+
+
+def test_connected_components(A, U):
+    # Directed: weakly connected components
+    rng = np.random.default_rng(4)
+    n = 200
+    rows = rng.integers(0, n, size=150)
+    cols = rng.integers(0, n, size=150)
+    M = Matrix.from_values(rows, cols, 1, nrows=n, ncols=n)
+    for G in [A, U, M, Matrix.new(bool, 6, 6)]:
+        labels = algorithms.connected_components(G, name="cc")
+        assert labels.name == "cc"
+        assert labels.nvals == G.nrows
+        assert labels.to_values()[1].tolist() == reference_components(G)
+    labels = algorithms.connected_components(U, symmetric=True)
+    assert labels.to_values()[1].tolist() == reference_components(U)
+    with pytest.raises(DimensionMismatch):
+        algorithms.connected_components(A[:, :5].new())
@@ -0,0 +1,81 @@
+import pytest
+
+from grblas import Matrix, Vector, binary, monoid, semiring, unary
+from grblas.exceptions import DimensionMismatch
+
+try:
+    import dask
+except ImportError:  # pragma: no cover
+    dask = None
+
+pytestmark = pytest.mark.skipif("not dask")
+
+
+@pytest.fixture
+def A():
+    return Matrix.from_values(
+        [0, 0, 1, 2, 3, 4, 4, 5], [1, 4, 2, 0, 3, 0, 4, 5], [1, 2, 3, 4, 5, 6, 7, 8]
+    )
+
+
+@pytest.fixture
+def v():
+    return Vector.from_values([0, 2, 4, 5], [1, 2, 3, 4])
+
+
+def test_roundtrip(A, v):
+    import grblas.dask as gd
+
+    dA = gd.Matrix.from_matrix(A, (2, [4, 2]))
+    assert dA.shape == A.shape
+    assert dA.ntiles == (3, 2)
+    assert dA.compute().isequal(A, check_dtype=True)
+    assert dA.rechunk(3).compute().isequal(A, check_dtype=True)
+    assert dA.rechunk(3).chunks == [[3, 3], [3, 3]]
+    dv = gd.Vector.from_vector(v, 4)
+    assert dv.chunks == [4, 2]
+    assert dv.compute().isequal(v, check_dtype=True)
+
+
+def test_blockwise(A, v):
+    import grblas.dask as gd
+
+    B = A.apply(unary.ainv).new()
+    B[1, 1] = 100
+    dA = gd.Matrix.from_matrix(A, 3)
+    dB = gd.Matrix.from_matrix(B, 3)
+    assert dA.ewise_add(dB).compute().isequal(A.ewise_add(B).new())
+    assert dA.ewise_mult(dB, binary.max).compute().isequal(A.ewise_mult(B, binary.max).new())
+    assert dA.apply(unary.ainv).compute().isequal(A.apply(unary.ainv).new())
+    assert dA.apply(binary.plus, right=1).compute().isequal(A.apply(binary.plus, right=1).new())
+    dv = gd.Vector.from_vector(v, 4)
+    w = v.apply(binary.times, left=2).new()
+    assert dv.apply(binary.times, left=2).compute().isequal(w)
+    assert dv.ewise_mult(gd.Vector.from_vector(w, 4)).compute().isequal(v.ewise_mult(w).new())
+    with pytest.raises(DimensionMismatch, match="Chunks must match"):
+        dA.ewise_add(gd.Matrix.from_matrix(B, 2))
+
+
+@pytest.mark.parametrize("scheduler", ["sync", "threads", "processes"])
+def test_matmul_and_reduce(A, v, scheduler):
+    import grblas.dask as gd
+
+    dA = gd.Matrix.from_matrix(A, 2)
+    dv = gd.Vector.from_vector(v, 2)
+    kwargs = {"scheduler": scheduler}
+    assert dA.mxm(dA).compute(**kwargs).isequal(A.mxm(A).new())
+    assert (
+        dA.mxm(dA, semiring.min_plus).compute(**kwargs).isequal(A.mxm(A, semiring.min_plus).new())
+    )
+    assert dA.mxv(dv).compute(**kwargs).isequal(A.mxv(v).new())
+    assert dv.vxm(dA).compute(**kwargs).isequal(v.vxm(A).new())
+    assert dA.reduce_rowwise().compute(**kwargs).isequal(A.reduce_rowwise().new())
+    assert (
+        dA.reduce_columnwise(monoid.max)
+        .compute(**kwargs)
+        .isequal(A.reduce_columnwise(monoid.max).new())
+    )
+    assert dA.reduce_scalar().compute(**kwargs) == A.reduce_scalar().new()
+    assert dv.reduce(monoid.min).compute(**kwargs) == v.reduce(monoid.min).new()
+    with pytest.raises(DimensionMismatch, match="Column chunks"):
+        dA.mxm(gd.Matrix.from_matrix(A, 3))
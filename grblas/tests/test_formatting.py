@@ -389,6 +389,22 @@ def test_matrix_mask_repr_large(C):
         )
 
 
+@pytest.mark.skipif("not pd")
+def test_mask_repr_max_nvals():
+    M = Matrix.from_values([500, 600], [500, 600], [1, 0], nrows=1000, ncols=1000)
+    df = formatting._get_matrix_dataframe(M, 10, 4, 4, mask=M.V)
+    assert df.values.tolist() == [[500, 500, 1]]
+    u = Vector.from_values([500, 600], [1, 0], size=1000)
+    df = formatting._get_vector_dataframe(u, 10, 4, 4, mask=~u.V)
+    assert df.values.tolist() == [[500, 0]]
+    with grblas.config.set(repr_max_nvals=1):
+        # Too expensive to find the nonzero values, so show the corners instead
+        df = formatting._get_matrix_dataframe(M, 10, 4, 4, mask=M.V)
+        assert df.shape == (11, 5)
+        df = formatting._get_vector_dataframe(u, 10, 4, 4, mask=~u.V)
+        assert df.shape == (1, 5)
+
+
 @pytest.mark.skipif("not pd")
 def test_vector_repr_small(v):
     repr_printer(v, "v")
@@ -0,0 +1,61 @@
+import pytest
+
+import grblas as gb
+from grblas import Matrix, hooks
+
+
+def test_call_hook():
+    calls = []
+
+    def hook(cfunc_name, duration, status):
+        calls.append((cfunc_name, duration, status))
+
+    A = Matrix.from_values([0, 1], [1, 1], [1, 2])
+    hooks.add_call_hook(hook)
+    try:
+        assert hooks.get_call_hooks() == [(hook, 1.0)]
+        A.mxm(A).new()
+        A[0, 0].new()  # no value
+    finally:
+        hooks.remove_call_hook(hook)
+    assert hooks.get_call_hooks() == []
+    A.mxm(A).new()  # not hooked
+    assert [name for name, _, _ in calls] == [
+        "GrB_Matrix_new",
+        "GrB_mxm",
+        "GrB_Matrix_extractElement_INT64",
+    ]
+    assert all(duration >= 0 for _, duration, _ in calls)
+    assert [status for _, _, status in calls] == [0, 0, gb.exceptions.GrB_NO_VALUE]
+    with pytest.raises(TypeError, match="callable"):
+        hooks.add_call_hook(1)
+    with pytest.raises(ValueError, match="sample_rate"):
+        hooks.add_call_hook(hook, 0)
+
+
+def test_metrics():
+    A = Matrix.from_values([0, 1], [1, 1], [1, 2])
+    hooks.metrics.reset()
+    hooks.enable_metrics(1)
+    try:
+        assert hooks.metrics.sample_rate == 1
+        A.mxm(A).new()
+        A.mxm(A).new()
+    finally:
+        hooks.disable_metrics()
+    assert hooks.metrics.sample_rate is None
+    snapshot = hooks.metrics.snapshot()
+    assert snapshot["GrB_mxm"]["calls"] == 2
+    assert snapshot["GrB_mxm"]["errors"] == 0
+    assert snapshot["GrB_mxm"]["buckets"][-1] == (float("inf"), 2)
+    text = hooks.metrics.to_prometheus()
+    assert 'grblas_calls_total{cfunc="GrB_mxm"} 2' in text
+    assert 'grblas_call_seconds_bucket{cfunc="GrB_mxm",le="+Inf"} 2' in text
+    hooks.metrics.reset()
+    assert hooks.metrics.snapshot() == {}
+
+    hist = hooks.Histogram([1, 2])
+    for val in [0.5, 1, 1.5, 3]:
+        hist.observe(val)
+    assert hist.cumulative_counts() == [(1, 2), (2, 3), (float("inf"), 4)]
+    assert hist.sum == 6
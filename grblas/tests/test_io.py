@@ -10,6 +10,10 @@ try:
     import networkx as nx
 except ImportError:  # pragma: no cover
     nx = None
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
 try:
     import scipy.sparse as ss
 except ImportError:  # pragma: no cover
@@ -79,6 +83,37 @@ def test_matrix_to_from_numpy():
         gb.io.from_numpy(np.array([[[1.0, 0.0], [2.0, 3.7]]]))
 
 
+def test_from_numpy_missing():
+    a = np.array([[1.0, np.nan], [0.0, 3.5]])
+    M = gb.io.from_numpy(a, missing=np.nan)
+    expected = gb.Matrix.from_values([0, 1, 1], [0, 0, 1], [1.0, 0.0, 3.5])
+    assert M.isequal(expected, check_dtype=True)
+    M = gb.io.from_numpy(a, missing=None)
+    assert M.nvals == 4
+    assert M.ss.format == "fullr"
+    M = gb.io.from_numpy(np.asfortranarray([[1, 2], [3, 0]]))
+    assert M.isequal(gb.Matrix.from_values([0, 0, 1], [0, 1, 0], [1, 2, 3]), check_dtype=True)
+    assert M.ss.orientation == "columnwise"
+    v = gb.io.from_numpy(np.array([1, 2, 3]), missing=2)
+    assert v.isequal(gb.Vector.from_values([0, 2], [1, 3]), check_dtype=True)
+    v = gb.io.from_numpy(np.array([1, 2, 3]), missing=np.nan)
+    assert v.nvals == 3
+    assert v.ss.format == "full"
+
+
+def test_to_numpy_fill_value():
+    M = gb.Matrix.from_values([0, 1, 1], [0, 0, 1], [1.0, 2.0, 3.7])
+    a = gb.io.to_numpy(M, fill_value=np.nan)
+    np.testing.assert_array_equal(a, np.array([[1.0, np.nan], [2.0, 3.7]]))
+    np.testing.assert_array_equal(gb.io.to_numpy(M.T), np.array([[1.0, 2.0], [0.0, 3.7]]))
+    v = gb.Vector.from_values([1, 3], 5, size=4)
+    np.testing.assert_array_equal(gb.io.to_numpy(v, fill_value=-1), [-1, 5, -1, 5])
+    M = gb.Matrix.from_values([0, 0, 1, 1], [0, 1, 0, 1], [1, 2, 3, 4])
+    np.testing.assert_array_equal(gb.io.to_numpy(M), [[1, 2], [3, 4]])
+    # The input is not modified
+    assert M.nvals == 4
+
+
 @pytest.mark.skipif("not nx or not ss")
 def test_matrix_to_from_networkx():
     M = gb.Matrix.from_values([0, 1, 1], [0, 0, 1], [1, 2, 3])
@@ -93,6 +128,82 @@ def test_matrix_to_from_networkx():
     assert M.isequal(M2, check_dtype=True)
 
 
+@pytest.mark.skipif("not nx")
+def test_networkx_labels_and_attributes():
+    M = gb.Matrix.from_values([0, 1, 2], [1, 2, 0], [1.5, 2.5, 3.5], nrows=4, ncols=4)
+    C = gb.Matrix.from_values([0, 1], [1, 2], [10, 20], nrows=4, ncols=4)
+    G = gb.io.to_networkx(M, nodes=["a", "b", "c", "d"], capacity=C)
+    assert G.number_of_nodes() == 4
+    assert G.number_of_edges() == 3
+    assert G["a"]["b"] == {"weight": 1.5, "capacity": 10}
+    assert G["c"]["a"] == {"weight": 3.5}
+    with pytest.raises(ValueError, match="nodes must be"):
+        gb.io.to_networkx(M, nodes=["a", "b"])
+
+    M2 = gb.io.from_networkx(G, nodelist=["a", "b", "c", "d"])
+    assert M2.isequal(M, check_dtype=True)
+    M3 = gb.io.from_networkx(G, int, weight="capacity")
+    assert M3.isequal(
+        gb.Matrix.from_values([0, 1, 2], [1, 2, 0], [10, 20, 1], nrows=4, ncols=4),
+        check_dtype=True,
+    )
+    M4 = gb.io.from_networkx(G, bool, weight=None)
+    assert M4.isequal(M.apply(gb.unary.one).new(bool), check_dtype=True)
+
+    U = gb.io.to_networkx(M, create_using=nx.Graph)
+    M5 = gb.io.from_networkx(U)
+    assert M5.isequal((M | M.T).new())
+
+
+@pytest.mark.skipif("not pd or not ss")
+def test_pandas():
+    df = pd.DataFrame({"source": [0, 1, 1, 2], "target": [1, 2, 0, 2], "w": [1.5, 2.0, 3.0, 4.0]})
+    A = gb.io.from_pandas_edgelist(df, weight="w", name="A")
+    expected = Matrix.from_values([0, 1, 1, 2], [1, 2, 0, 2], [1.5, 2.0, 3.0, 4.0])
+    assert A.isequal(expected, check_dtype=True)
+    assert A.name == "A"
+    B = gb.io.from_pandas_edgelist(df, nrows=4, ncols=5)
+    assert B.shape == (4, 5)
+    assert B.dtype == bool
+    assert B.nvals == 4
+
+    coo = gb.io.to_pandas(A)
+    assert list(coo.columns) == ["row", "col", "value"]
+    assert coo["row"].tolist() == [0, 1, 1, 2]
+    assert coo["col"].tolist() == [1, 0, 2, 2]
+    assert coo["value"].tolist() == [1.5, 3.0, 2.0, 4.0]
+    assert gb.io.from_pandas_edgelist(coo, "row", "col", "value").isequal(A)
+
+    sparse = gb.io.to_pandas(A, "sparse", fill_value=0.0)
+    assert sparse.shape == (3, 3)
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in sparse.dtypes)
+    assert sparse.sparse.density == pytest.approx(4 / 9)
+    np.testing.assert_array_equal(sparse.sparse.to_dense().to_numpy(), gb.io.to_numpy(A))
+    iso = gb.io.to_pandas(B, "sparse")
+    assert iso[2].sparse.sp_values.tolist() == [True, True]
+    np.testing.assert_array_equal(
+        gb.io.to_pandas(A.T, "sparse", fill_value=0.0).sparse.to_dense().to_numpy(),
+        gb.io.to_numpy(A).T,
+    )
+
+    v = gb.Vector.from_values([1, 3], [10, 20], size=5, name="v")
+    s = v.to_pandas()
+    assert s.index.tolist() == [1, 3]
+    assert s.tolist() == [10, 20]
+    assert s.name == "v"
+    s = v.to_pandas("sparse")
+    assert s.size == 5
+    assert s.sparse.fill_value == 0
+    assert s.tolist() == [0, 10, 0, 20, 0]
+    s = (v + v).to_pandas("sparse", fill_value=-1)
+    assert s.tolist() == [-1, 20, -1, 40, -1]
+    with pytest.raises(ValueError, match="Invalid format"):
+        v.to_pandas("dense")
+    big = gb.Vector.from_values([2 ** 31], [1], size=2 ** 31 + 1)
+    with pytest.raises(ValueError, match="32-bit indices"):
+        big.to_pandas("sparse")
+
+
 @pytest.mark.skipif("not ss")
 def test_mmread_mmwrite():
     from scipy.io.tests import test_mmio
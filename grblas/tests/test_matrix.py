@@ -2590,6 +2590,116 @@ def test_flatten(A):
         v.ss.reshape(A.shape + (1,))
 
 
+def test_get_many(A):
+    rows = [0, 0, 6, 6, -1, 2, 3]
+    cols = [1, 0, 4, 6, 2, 5, -7]
+    expected_values = [2, 0, 3, 0, 5, 1, 3]
+    expected_found = [True, False, True, False, True, True, True]
+    for fmt in ["csr", "csc", "hypercsr", "hypercsc", "bitmapr", "bitmapc"]:
+        B = Matrix.ss.import_any(**A.ss.export(format=fmt))
+        values, found = B.ss.get_many(rows, cols)
+        assert values.dtype == np.int64
+        assert_array_equal(values, expected_values)
+        assert_array_equal(found, expected_found)
+        assert B.ss.format == fmt
+        assert B.isequal(A)
+        values, found = B.ss.get_many(np.array(rows), np.array(cols), default=-1)
+        assert_array_equal(values, [2, -1, 3, -1, 5, 1, 3])
+    B = Matrix.ss.import_fullr(values=np.arange(6).reshape(2, 3), is_iso=False)
+    values, found = B.ss.get_many([1, 0], [2, 1])
+    assert_array_equal(values, [5, 1])
+    assert found.all()
+    # iso
+    B = Matrix(int, A.nrows, A.ncols)
+    B.ss.build_scalar(*A.to_values()[:2], 7)
+    assert B.ss.is_iso
+    values, found = B.ss.get_many(rows, cols)
+    assert_array_equal(values, [7, 0, 7, 0, 7, 7, 7])
+    values, found = A.ss.get_many([], [])
+    assert values.size == found.size == 0
+    values, found = Matrix(int, 3, 3).ss.get_many([0, 1], [1, 2])
+    assert not found.any()
+    with pytest.raises(IndexError):
+        A.ss.get_many([7], [0])
+    with pytest.raises(IndexError):
+        A.ss.get_many([0], [-8])
+    with pytest.raises(ValueError, match="same size"):
+        A.ss.get_many([0, 1], [0])
+
+
+def test_scatter(A):
+    B = A.dup()
+    B.ss.scatter([0, 0, 6, 6], [1, 0, 4, 4], [10, 20, 30, 40])
+    expected = A.dup()
+    expected[0, 1] = 10
+    expected[0, 0] = 20
+    expected[6, 4] = 40
+    assert B.isequal(expected)
+    B = A.dup()
+    B.ss.scatter([0, 0, 6, 6], [1, 0, 4, 4], [10, 20, 30, 40], accum=binary.plus)
+    expected = A.dup()
+    expected[0, 1] = 12
+    expected[0, 0] = 20
+    expected[6, 4] = 73
+    assert B.isequal(expected)
+    B = A.dup()
+    B.ss.scatter(np.array([1, 2]), np.array([4, 4]), 0, accum=monoid.times)
+    expected = A.dup()
+    expected[1, 4] = 0
+    expected[2, 4] = 0
+    assert B.isequal(expected)
+    # A scalar is accumulated once for each duplicate
+    B = A.dup()
+    B.ss.scatter([0, 0, 6, 6, 6, 0, 0], [1, 1, 4, 4, 4, 0, 0], 5, accum=binary.plus)
+    expected = A.dup()
+    expected[0, 1] = 12
+    expected[6, 4] = 18
+    expected[0, 0] = 10
+    assert B.isequal(expected)
+    B.ss.scatter([], [], [])
+    assert B.isequal(expected)
+    with pytest.raises(ValueError, match="lengths must match"):
+        B.ss.scatter([0, 1], [0, 1], [1])
+    with pytest.raises(IndexOutOfBound):
+        B.ss.scatter([7], [0], [1])
+
+
+def test_ss_rows_cols(A):
+    for fmt in ["csr", "csc", "hypercsr", "hypercsc", "bitmapr", "bitmapc"]:
+        B = Matrix.ss.import_any(**A.ss.export(format=fmt))
+        for i in [0, 3, 6, -1]:
+            assert B.ss.row(i).isequal(A[i, :].new())
+            assert B.ss.col(i).isequal(A[:, i].new())
+        indices = [6, 0, 0, 2]
+        C = B.ss.rows(indices, name="C")
+        assert C.name == "C"
+        assert C.isequal(A[indices, :].new())
+        assert B.ss.cols(indices).isequal(A[:, indices].new())
+        assert B.ss.rows([]).shape == (0, A.ncols)
+        assert B.ss.format == fmt
+        assert B.isequal(A)
+    B = A.dup()
+    B(mask=~B.S)[:, :] = 10
+    expected = B.dup()
+    for fmt in ["fullr", "fullc"]:
+        B = Matrix.ss.import_any(**expected.ss.export(format=fmt))
+        assert B.ss.row(2).isequal(expected[2, :].new())
+        assert B.ss.col(2).isequal(expected[:, 2].new())
+        assert B.ss.rows([1, 5]).isequal(expected[[1, 5], :].new())
+        assert B.ss.cols([1, 5]).isequal(expected[:, [1, 5]].new())
+    # iso
+    B = Matrix(int, A.nrows, A.ncols)
+    B.ss.build_scalar(*A.to_values()[:2], 7)
+    assert B.ss.row(6).isequal(Vector.from_values([2, 3, 4], 7, size=A.ncols))
+    assert B.ss.rows([6]).ss.is_iso
+    with pytest.raises(IndexError):
+        A.ss.row(7)
+    with pytest.raises(IndexError):
+        A.ss.cols([0, -8])
+    with pytest.raises(TypeError, match="integer"):
+        A.ss.row([1])
+
+
 def test_autocompute_argument_messages(A, v):
     with pytest.raises(TypeError, match="autocompute"):
         A.ewise_mult(A & A)
@@ -0,0 +1,48 @@
+if __name__ == "__main__":
+    import numpy as np
+    import pytest
+
+    import grblas
+    from grblas.memory import MemoryManager
+
+    with pytest.raises(TypeError, match="memory_manager must be"):
+        grblas.init(memory_manager="bad")
+
+    mm = MemoryManager(max_bytes=2 ** 26)
+    grblas.init(memory_manager=mm)
+    with pytest.raises(RuntimeError, match="already been used"):
+        mm._initialize(grblas.ffi, grblas.lib, False)
+
+    from grblas import Matrix, Vector
+    from grblas.exceptions import OutOfMemory
+
+    stats = mm.stats()
+    A = Matrix.from_values([0, 1, 2], [1, 2, 0], [1.0, 2.0, 3.0])
+    B = A.mxm(A).new()
+    assert mm.nbytes > stats["nbytes"]
+    assert mm.nallocs > stats["nallocs"]
+    assert mm.stats()["live_blocks"] > 0
+    del A, B
+    assert mm.peak_nbytes >= mm.nbytes
+
+    # Exported buffers are owned by numpy and no longer counted
+    C = Matrix.from_values(np.arange(1000), np.arange(1000), 1.0)
+    info = C.ss.export()
+    assert info["values"].ctypes.data not in mm._sizes
+    # Buffers from numpy may be freed by GraphBLAS
+    nfrees = mm.nfrees
+    C = Matrix.ss.import_any(**info, take_ownership=True)
+    C[0, 0] = 2.0
+    del C
+    assert mm.nfrees > nfrees
+
+    # Fail fast instead of using too much memory
+    big = Vector.new(float, 2 ** 30)
+    big[0] = 1.0
+    with pytest.raises(OutOfMemory):
+        big[:] = 2.0  # 8 GiB when dense
+    assert mm.nfailed > 0
+    mm.reset_stats()
+    assert mm.nallocs == 0
+    assert mm.peak_nbytes == mm.nbytes
+    assert "MemoryManager(nbytes=" in repr(mm)
@@ -0,0 +1,718 @@
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+sparse = pytest.importorskip("scipy.sparse")
+python_backend = pytest.importorskip("grblas.backends.python")
+
+from grblas.backends.python import (  # noqa: E402
+    base,
+    context,
+    descriptors,
+    lazy,
+    matrix,
+    operators,
+    vector,
+)
+from grblas.backends.python.exceptions import GrB_Info  # noqa: E402
+
+BinaryOp = operators.GrB_BinaryOp
+plus_times = operators.Semiring(
+    operators.Monoid(BinaryOp.GrB_PLUS_INT64, 0), BinaryOp.GrB_TIMES_INT64
+)
+min_minus = operators.Semiring(
+    operators.Monoid(BinaryOp.GrB_MIN_INT64, np.iinfo(np.int64).max), BinaryOp.GrB_MINUS_INT64
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def init():
+    if context.global_context is None:
+        context.GrB_init(context.GrB_Mode.GrB_BLOCKING)
+
+
+def random_dense(shape, density, seed):
+    rng = np.random.default_rng(seed)
+    values = rng.integers(1, 10, size=shape)
+    present = rng.random(shape) < density
+    return values, present
+
+
+def to_matrix(values, present):
+    return matrix.Matrix(sparse.csr_matrix(np.where(present, values, 0)))
+
+
+def to_vector(values, present):
+    return vector.Vector(sparse.csr_matrix(np.where(present, values, 0)[None, :]))
+
+
+def make_desc(**kwargs):
+    desc = descriptors.Descriptor()
+    for key, val in kwargs.items():
+        setattr(desc, key, val)
+    return desc
+
+
+def reference_matmul(a_vals, a_present, b_vals, b_present, semiring):
+    # Dense reference computation of a plus.times b
+    plus = semiring.plus.op
+    times = semiring.times
+    nrows, ncols = a_vals.shape[0], b_vals.shape[1]
+    vals = np.zeros((nrows, ncols), dtype=np.int64)
+    present = np.zeros((nrows, ncols), dtype=bool)
+    for i in range(nrows):
+        for j in range(ncols):
+            for k in range(a_vals.shape[1]):
+                if a_present[i, k] and b_present[k, j]:
+                    val = times(a_vals[i, k], b_vals[k, j])
+                    vals[i, j] = plus(vals[i, j], val) if present[i, j] else val
+                    present[i, j] = True
+    return vals, present
+
+
+def reference_update(c_vals, c_present, t_vals, t_present, allowed, accum, replace):
+    vals = c_vals.copy()
+    present = c_present.copy()
+    both = c_present & t_present
+    if accum is not None:
+        z_vals = np.where(t_present, t_vals, c_vals)
+        z_vals[both] = [accum(x, y) for x, y in zip(c_vals[both], t_vals[both])]
+        z_present = c_present | t_present
+    else:
+        z_vals, z_present = t_vals, t_present
+    vals[allowed] = z_vals[allowed]
+    present[allowed] = z_present[allowed]
+    if replace:
+        present[~allowed] = False
+    return np.where(present, vals, 0), present
+
+
+def assert_matches(result, vals, present):
+    dense = result.toarray()
+    assert result.nnz == present.sum()
+    np.testing.assert_array_equal(dense[present], vals[present])
+    np.testing.assert_array_equal(dense[~present], 0)
+
+
+def test_mxm():
+    a_vals, a_present = random_dense((20, 15), 0.3, 0)
+    b_vals, b_present = random_dense((15, 25), 0.3, 1)
+    c_vals, c_present = random_dense((20, 25), 0.2, 2)
+    m_vals, m_present = random_dense((20, 25), 0.3, 3)
+    m_vals[m_vals < 3] = 0  # Some mask values are False
+    A = to_matrix(a_vals, a_present)
+    B = to_matrix(b_vals, b_present)
+    for semiring in [plus_times, min_minus]:
+        t_vals, t_present = reference_matmul(a_vals, a_present, b_vals, b_present, semiring)
+        for mask_struct, mask_comp, replace, accum in [
+            (False, False, False, None),
+            (True, False, False, BinaryOp.GrB_PLUS_INT64),
+            (False, True, True, None),
+            (True, True, False, BinaryOp.GrB_MINUS_INT64),
+            (False, False, True, BinaryOp.GrB_MAX_INT64),
+        ]:
+            for use_mask in [True, False]:
+                desc = make_desc(mask_struct=mask_struct, mask_comp=mask_comp, clear_output=replace)
+                C = to_matrix(c_vals, c_present)
+                if use_mask:
+                    # Keep explicit zeros, which are False in a value mask
+                    Mask = matrix.Matrix(
+                        sparse.csr_matrix(
+                            (m_vals[m_present], np.nonzero(m_present)[1], _indptr(m_present)),
+                            shape=m_present.shape,
+                        )
+                    )
+                    allowed = m_present if mask_struct else m_present & (m_vals != 0)
+                else:
+                    Mask = None
+                    allowed = np.ones(m_present.shape, dtype=bool)
+                if mask_comp:
+                    allowed = ~allowed
+                info = matrix.mxm(C, Mask, accum, semiring, A, B, desc)
+                assert info is GrB_Info.GrB_SUCCESS
+                vals, present = reference_update(
+                    c_vals, c_present, t_vals, t_present, allowed, accum, replace
+                )
+                assert_matches(C.matrix, vals, present)
+
+
+def _indptr(present):
+    return np.concatenate([[0], np.cumsum(present.sum(axis=1))])
+
+
+def test_mxm_transpose_and_dims():
+    a_vals, a_present = random_dense((15, 20), 0.3, 4)
+    b_vals, b_present = random_dense((25, 15), 0.3, 5)
+    C = matrix.Matrix(sparse.csr_matrix((20, 25), dtype=np.int64))
+    desc = make_desc(trans0=True, trans1=True)
+    A = to_matrix(a_vals, a_present)
+    B = to_matrix(b_vals, b_present)
+    info = matrix.mxm(C, None, None, plus_times, A, B, desc)
+    assert info is GrB_Info.GrB_SUCCESS
+    vals, present = reference_matmul(a_vals.T, a_present.T, b_vals.T, b_present.T, plus_times)
+    assert_matches(C.matrix, vals, present)
+    info = matrix.mxm(C, None, None, plus_times, A, B, None)
+    assert info is GrB_Info.GrB_DIMENSION_MISMATCH
+
+
+def test_mxv_vxm():
+    a_vals, a_present = random_dense((20, 15), 0.3, 6)
+    u_vals, u_present = random_dense((15,), 0.5, 7)
+    x_vals, x_present = random_dense((20,), 0.5, 8)
+    m_vals, m_present = random_dense((20,), 0.5, 9)
+    A = to_matrix(a_vals, a_present)
+    for semiring in [plus_times, min_minus]:
+        # w = A u
+        vals, present = reference_matmul(
+            a_vals, a_present, u_vals[:, None], u_present[:, None], semiring
+        )
+        w = vector.Vector(sparse.csr_matrix((1, 20), dtype=np.int64))
+        assert vector.mxv(w, None, None, semiring, A, to_vector(u_vals, u_present), None) is (
+            GrB_Info.GrB_SUCCESS
+        )
+        assert_matches(w.vector, vals.T, present.T)
+        # w = u A'  (same as A u)
+        w = vector.Vector(sparse.csr_matrix((1, 20), dtype=np.int64))
+        desc = make_desc(trans1=True)
+        vals2, present2 = reference_matmul(
+            u_vals[None, :], u_present[None, :], a_vals.T, a_present.T, semiring
+        )
+        vector.vxm(w, None, None, semiring, to_vector(u_vals, u_present), A, desc)
+        assert_matches(w.vector, vals2, present2)
+        # w<m> += A' x
+        vals, present = reference_matmul(
+            a_vals.T, a_present.T, x_vals[:, None], x_present[:, None], semiring
+        )
+        w = to_vector(u_vals, u_present)
+        mask = to_vector(m_vals[:15], m_present[:15])
+        desc = make_desc(trans0=True)
+        info = vector.mxv(
+            w, mask, BinaryOp.GrB_PLUS_INT64, semiring, A, to_vector(x_vals, x_present), desc
+        )
+        assert info is GrB_Info.GrB_SUCCESS
+        w_vals, w_present = reference_update(
+            u_vals,
+            u_present,
+            vals[:, 0],
+            present[:, 0],
+            m_present[:15],
+            BinaryOp.GrB_PLUS_INT64,
+            False,
+        )
+        assert_matches(w.vector, w_vals[None, :], w_present[None, :])
+        # w<m> = x A
+        vals, present = reference_matmul(
+            x_vals[None, :], x_present[None, :], a_vals, a_present, semiring
+        )
+        w = to_vector(u_vals, u_present)
+        mask = to_vector(m_vals[:15], m_present[:15])
+        vector.vxm(w, mask, None, semiring, to_vector(x_vals, x_present), A, None)
+        w_vals, w_present = reference_update(
+            u_vals, u_present, vals[0], present[0], m_present[:15], None, False
+        )
+        assert_matches(w.vector, w_vals[None, :], w_present[None, :])
+
+
+def test_ewise():
+    a_vals, a_present = random_dense((10, 12), 0.4, 10)
+    b_vals, b_present = random_dense((10, 12), 0.4, 11)
+    A = to_matrix(a_vals, a_present)
+    B = to_matrix(b_vals, b_present)
+    minus = BinaryOp.GrB_MINUS_INT64
+    C = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    assert matrix.Matrix_eWiseAdd_BinaryOp(C, None, None, minus, A, B, None) is (
+        GrB_Info.GrB_SUCCESS
+    )
+    present = a_present | b_present
+    vals = np.where(a_present & b_present, a_vals - b_vals, np.where(a_present, a_vals, b_vals))
+    assert_matches(C.matrix, vals, present)
+    C = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    matrix.Matrix_eWiseMult_BinaryOp(C, None, None, minus, A, B, None)
+    assert_matches(C.matrix, a_vals - b_vals, a_present & b_present)
+    # Comparisons return bool, which is cast to the output type
+    C = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    matrix.Matrix_eWiseMult_BinaryOp(C, None, None, BinaryOp.GrB_GT_INT64, A, B, None)
+    assert_matches(C.matrix, (a_vals > b_vals).astype(np.int64), a_present & b_present)
+    # Transposed input and a mask
+    C = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    BT = to_matrix(b_vals.T, b_present.T)
+    mask = to_matrix(a_vals, a_present)
+    desc = make_desc(trans1=True)
+    matrix.Matrix_eWiseAdd_BinaryOp(C, mask, None, minus, A, BT, desc)
+    vals = np.where(a_present & b_present, a_vals - b_vals, np.where(a_present, a_vals, b_vals))
+    assert_matches(C.matrix, vals, a_present)
+    assert matrix.Matrix_eWiseAdd_BinaryOp(C, None, None, minus, A, BT, None) is (
+        GrB_Info.GrB_DIMENSION_MISMATCH
+    )
+    # Vectors
+    u_vals, u_present = random_dense((12,), 0.5, 12)
+    v_vals, v_present = random_dense((12,), 0.5, 13)
+    w = vector.Vector(sparse.csr_matrix((1, 12), dtype=np.int64))
+    vector.Vector_eWiseAdd_Monoid(
+        w,
+        None,
+        None,
+        operators.Monoid(BinaryOp.GrB_PLUS_INT64, 0),
+        to_vector(u_vals, u_present),
+        to_vector(v_vals, v_present),
+        None,
+    )
+    vals = np.where(u_present, u_vals, 0) + np.where(v_present, v_vals, 0)
+    assert_matches(w.vector, vals[None, :], (u_present | v_present)[None, :])
+
+
+def test_apply_reduce_transpose():
+    a_vals, a_present = random_dense((10, 12), 0.4, 14)
+    A = to_matrix(a_vals, a_present)
+    C = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    matrix.Matrix_apply(C, None, None, operators.GrB_UnaryOp.GrB_AINV_INT64, A, None)
+    assert_matches(C.matrix, -a_vals, a_present)
+    matrix.Matrix_apply_BinaryOp1st(C, None, None, BinaryOp.GrB_MINUS_INT64, 100, A, None)
+    assert_matches(C.matrix, 100 - a_vals, a_present)
+    matrix.Matrix_apply_BinaryOp2nd(C, None, None, BinaryOp.GrB_MINUS_INT64, A, 100, None)
+    assert_matches(C.matrix, a_vals - 100, a_present)
+    # Reduce rows and columns
+    plus_monoid = operators.Monoid(BinaryOp.GrB_PLUS_INT64, 0)
+    w = vector.Vector(sparse.csr_matrix((1, 10), dtype=np.int64))
+    matrix.Matrix_reduce_Monoid(w, None, None, plus_monoid, A, None)
+    vals = np.where(a_present, a_vals, 0)
+    assert_matches(w.vector, vals.sum(axis=1)[None, :], a_present.any(axis=1)[None, :])
+    w = vector.Vector(sparse.csr_matrix((1, 12), dtype=np.int64))
+    matrix.Matrix_reduce_Monoid(w, None, None, plus_monoid, A, make_desc(trans0=True))
+    assert_matches(w.vector, vals.sum(axis=0)[None, :], a_present.any(axis=0)[None, :])
+    # Reduce to scalar
+    s = np.zeros(1, dtype=np.int64)
+    matrix.Matrix_reduce_Scalar(s, None, plus_monoid, A, None)
+    assert s[0] == vals.sum()
+    matrix.Matrix_reduce_Scalar(s, BinaryOp.GrB_PLUS_INT64, plus_monoid, A, None)
+    assert s[0] == 2 * vals.sum()
+    max_monoid = operators.Monoid(BinaryOp.GrB_MAX_INT64, np.iinfo(np.int64).min)
+    empty = vector.Vector(sparse.csr_matrix((1, 5), dtype=np.int64))
+    vector.Vector_reduce_Scalar(s, None, max_monoid, empty, None)
+    assert s[0] == np.iinfo(np.int64).min
+    # Transpose
+    C = matrix.Matrix(sparse.csr_matrix((12, 10), dtype=np.int64))
+    matrix.Matrix_transpose(C, None, None, A, None)
+    assert_matches(C.matrix, a_vals.T, a_present.T)
+    C = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    matrix.Matrix_transpose(C, None, None, A, make_desc(trans0=True))
+    assert_matches(C.matrix, a_vals, a_present)
+
+
+def test_nonblocking(monkeypatch):
+    monkeypatch.setattr(context.global_context, "_mode", context.GrB_Mode.GrB_NONBLOCKING)
+    a_vals, a_present = random_dense((10, 12), 0.4, 15)
+    b_vals, b_present = random_dense((10, 12), 0.4, 16)
+    A = to_matrix(a_vals, a_present)
+    B = to_matrix(b_vals, b_present)
+    # C = -(A + B) * 2 is deferred and computed when C is used
+    C = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    matrix.Matrix_eWiseAdd_BinaryOp(C, None, None, BinaryOp.GrB_PLUS_INT64, A, B, None)
+    matrix.Matrix_apply(C, None, None, operators.GrB_UnaryOp.GrB_AINV_INT64, C, None)
+    matrix.Matrix_apply_BinaryOp2nd(C, None, None, BinaryOp.GrB_TIMES_INT64, C, 2, None)
+    assert C._pending is not None
+    assert len(C._pending.expr.steps) == 2
+    assert C in context.pending_objects
+    sums = np.where(a_present, a_vals, 0) + np.where(b_present, b_vals, 0)
+    assert_matches(C.matrix, -2 * sums, a_present | b_present)
+    assert C._pending is None
+    # Casts between steps are kept: bool output, then back to int64
+    D = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=bool))
+    matrix.Matrix_apply_BinaryOp2nd(D, None, None, BinaryOp.GrB_GT_INT64, A, 4, None)
+    E = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    matrix.Matrix_apply_BinaryOp1st(E, None, None, BinaryOp.GrB_MINUS_INT64, 10, D, None)
+    assert_matches(E.matrix, 10 - (a_vals > 4), a_present)
+    assert_matches(D.matrix, a_vals > 4, a_present)
+    # A pending result read by two other operations is computed once and stored
+    P = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    matrix.Matrix_apply(P, None, None, operators.GrB_UnaryOp.GrB_AINV_INT64, A, None)
+    X = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    matrix.Matrix_apply_BinaryOp2nd(X, None, None, BinaryOp.GrB_TIMES_INT64, P, 2, None)
+    assert P._pending is None
+    Y = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    matrix.Matrix_apply_BinaryOp2nd(Y, None, None, BinaryOp.GrB_PLUS_INT64, P, 1, None)
+    assert X._pending.expr.a is P._data and Y._pending.expr.a is P._data
+    assert X._pending.expr.steps[0][0] == lazy.BIND_SECOND
+    assert len(X._pending.expr.steps) == len(Y._pending.expr.steps) == 1
+    # Overwriting P afterwards doesn't change what X and Y read
+    matrix.Matrix_apply(P, None, None, operators.GrB_UnaryOp.GrB_AINV_INT64, B, None)
+    assert_matches(X.matrix, -2 * a_vals, a_present)
+    assert_matches(Y.matrix, 1 - a_vals, a_present)
+    assert_matches(P.matrix, -b_vals, b_present)
+    # Masked assignment with replace is fused; C is left unchanged outside the mask
+    c_vals, c_present = random_dense((10, 12), 0.5, 17)
+    mask = to_matrix(b_vals, b_present)
+    for replace in [False, True]:
+        C = to_matrix(c_vals, c_present)
+        desc = make_desc(clear_output=replace)
+        matrix.Matrix_apply(C, mask, None, operators.GrB_UnaryOp.GrB_AINV_INT64, A, desc)
+        assert C._pending is not None
+        assert context.GrB_wait() is GrB_Info.GrB_SUCCESS
+        assert C._pending is None and not context.pending_objects
+        vals, present = reference_update(
+            c_vals, c_present, -a_vals, a_present, b_present, None, replace
+        )
+        assert_matches(C._data, vals, present)
+    # Waiting for one object leaves others pending
+    C = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    D = matrix.Matrix(sparse.csr_matrix((10, 12), dtype=np.int64))
+    matrix.Matrix_apply(C, None, None, operators.GrB_UnaryOp.GrB_AINV_INT64, A, None)
+    matrix.Matrix_apply(D, None, None, operators.GrB_UnaryOp.GrB_AINV_INT64, B, None)
+    assert context.GrB_wait(C) is GrB_Info.GrB_SUCCESS
+    assert C._pending is None and C not in context.pending_objects
+    assert D._pending is not None and D in context.pending_objects
+    assert_matches(C._data, -a_vals, a_present)
+    assert context.GrB_wait() is GrB_Info.GrB_SUCCESS
+    assert D._pending is None and not context.pending_objects
+    assert_matches(D._data, -b_vals, b_present)
+    # Inputs may change after an operation is deferred
+    u_vals, u_present = random_dense((12,), 0.5, 18)
+    u = to_vector(u_vals, u_present)
+    w = vector.Vector(sparse.csr_matrix((1, 12), dtype=np.int64))
+    vector.Vector_apply(w, None, None, operators.GrB_UnaryOp.GrB_AINV_INT64, u, None)
+    vector.Vector_resize(u, 5)
+    vector.Vector_apply_BinaryOp2nd(
+        w, None, BinaryOp.GrB_PLUS_INT64, BinaryOp.GrB_PLUS_INT64, w, 1, None
+    )
+    ptr = vector.VectorPtr()
+    ptr.set_vector(w)
+    assert vector.Vector_wait(ptr) is GrB_Info.GrB_SUCCESS
+    assert w._pending is None
+    assert_matches(w.vector, (-2 * u_vals + 1)[None, :], u_present[None, :])
+
+
+INDEX_CASES = [
+    # (index argument, ni, expected indices for an axis of size 10)
+    (base.GrB_ALL, None, list(range(10))),
+    ([3, 1, 3, 7], 4, [3, 1, 3, 7]),
+    ([2, 9], base.GxB_RANGE, list(range(2, 10))),
+    ([1, 9, 3], base.GxB_STRIDE, [1, 4, 7]),
+    ([8, 0, 2], base.GxB_BACKWARDS, [8, 6, 4, 2, 0]),
+    ([5, 4], base.GxB_RANGE, []),
+]
+
+
+def test_extract():
+    a_vals, a_present = random_dense((10, 10), 0.4, 14)
+    a_dense = np.where(a_present, a_vals, 0)
+    A = to_matrix(a_vals, a_present)
+    for row_arg, ni, rows in INDEX_CASES:
+        for col_arg, nj, cols in INDEX_CASES:
+            C = matrix.Matrix(sparse.csr_matrix((len(rows), len(cols)), dtype=np.int64))
+            info = matrix.Matrix_extract(C, None, None, A, row_arg, ni, col_arg, nj, None)
+            assert info is GrB_Info.GrB_SUCCESS
+            expected = a_dense[np.ix_(rows, cols)]
+            assert_matches(C.matrix, expected, expected != 0)
+    # Transposed input
+    row_arg, ni, rows = INDEX_CASES[3]
+    col_arg, nj, cols = INDEX_CASES[1]
+    C = matrix.Matrix(sparse.csr_matrix((len(rows), len(cols)), dtype=np.int64))
+    info = matrix.Matrix_extract(C, None, None, A, row_arg, ni, col_arg, nj, make_desc(trans0=True))
+    assert info is GrB_Info.GrB_SUCCESS
+    expected = a_dense.T[np.ix_(rows, cols)]
+    assert_matches(C.matrix, expected, expected != 0)
+    # Vectors and columns
+    u_vals, u_present = random_dense(10, 0.5, 15)
+    u_dense = np.where(u_present, u_vals, 0)
+    u = to_vector(u_vals, u_present)
+    for row_arg, ni, indices in INDEX_CASES:
+        w = vector.Vector(sparse.csr_matrix((1, len(indices)), dtype=np.int64))
+        assert vector.Vector_extract(w, None, None, u, row_arg, ni, None) is GrB_Info.GrB_SUCCESS
+        expected = u_dense[indices][None, :]
+        assert_matches(w.vector, expected, expected != 0)
+        for trans0, dense in [(False, a_dense), (True, a_dense.T)]:
+            info = vector.Col_extract(w, None, None, A, row_arg, ni, 6, make_desc(trans0=trans0))
+            assert info is GrB_Info.GrB_SUCCESS
+            expected = dense[indices, 6][None, :]
+            assert_matches(w.vector, expected, expected != 0)
+    C = matrix.Matrix(sparse.csr_matrix((2, 2), dtype=np.int64))
+    info = matrix.Matrix_extract(C, None, None, A, [0, 10], 2, [0, 1], 2, None)
+    assert info is GrB_Info.GrB_INDEX_OUT_OF_BOUNDS
+    info = matrix.Matrix_extract(C, None, None, A, [0, 1], 2, [0, 1, 2], 3, None)
+    assert info is GrB_Info.GrB_DIMENSION_MISMATCH
+
+
+def reference_assign(c_vals, c_present, a_vals, a_present, rows, cols, allowed, accum, replace):
+    # `allowed` has the shape of C for assign or of the region for subassign
+    region = np.ix_(rows, cols)
+    z_vals = c_vals.copy()
+    z_present = c_present.copy()
+    if accum is not None:
+        vals, present = reference_update(
+            c_vals[region],
+            c_present[region],
+            a_vals,
+            a_present,
+            np.ones(a_vals.shape, dtype=bool),
+            accum,
+            False,
+        )
+    else:
+        vals, present = a_vals, a_present
+    z_vals[region] = vals
+    z_present[region] = present
+    if allowed.shape == c_vals.shape:
+        return reference_update(c_vals, c_present, z_vals, z_present, allowed, None, replace)
+    vals, present = reference_update(
+        c_vals[region], c_present[region], z_vals[region], z_present[region], allowed, None, replace
+    )
+    z_vals = c_vals.copy()
+    z_present = c_present.copy()
+    z_vals[region] = vals
+    z_present[region] = present
+    return np.where(z_present, z_vals, 0), z_present
+
+
+def test_assign():
+    c_vals, c_present = random_dense((10, 10), 0.4, 16)
+    a_vals, a_present = random_dense((3, 3), 0.6, 17)
+    m_vals, m_present = random_dense((10, 10), 0.5, 18)
+    rows = [3, 1, 7]
+    cols = [0, 4, 8]
+    A = to_matrix(a_vals, a_present)
+    for subassign in [False, True]:
+        for mask_comp, replace, accum in [
+            (False, False, None),
+            (False, True, BinaryOp.GrB_PLUS_INT64),
+            (True, True, None),
+            (True, False, BinaryOp.GrB_MINUS_INT64),
+        ]:
+            if subassign:
+                allowed = m_present[:3, :3]
+                func = matrix.Matrix_subassign
+            else:
+                allowed = m_present
+                func = matrix.Matrix_assign
+            Mask = to_matrix(np.ones(allowed.shape, dtype=np.int64), allowed)
+            desc = make_desc(mask_struct=True, mask_comp=mask_comp, clear_output=replace)
+            C = to_matrix(c_vals, c_present)
+            info = func(C, Mask, accum, A, rows, 3, [0, 8, 4], base.GxB_STRIDE, desc)
+            assert info is GrB_Info.GrB_SUCCESS
+            vals, present = reference_assign(
+                c_vals,
+                c_present,
+                a_vals,
+                a_present,
+                rows,
+                cols,
+                ~allowed if mask_comp else allowed,
+                accum,
+                replace,
+            )
+            assert_matches(C.matrix, vals, present)
+            # Assign a scalar
+            if subassign:
+                func = matrix.Matrix_subassign_Scalar
+            else:
+                func = matrix.Matrix_assign_Scalar
+            C = to_matrix(c_vals, c_present)
+            info = func(C, Mask, accum, 5, rows, 3, [0, 8, 4], base.GxB_STRIDE, desc)
+            assert info is GrB_Info.GrB_SUCCESS
+            vals, present = reference_assign(
+                c_vals,
+                c_present,
+                np.full((3, 3), 5),
+                np.ones((3, 3), dtype=bool),
+                rows,
+                cols,
+                ~allowed if mask_comp else allowed,
+                accum,
+                replace,
+            )
+            assert_matches(C.matrix, vals, present)
+    info = matrix.Matrix_assign(C, None, None, A, rows, 3, [0, 1], 2, None)
+    assert info is GrB_Info.GrB_DIMENSION_MISMATCH
+    info = matrix.Matrix_assign(C, None, None, A, rows, 3, [0, 1, 10], 3, None)
+    assert info is GrB_Info.GrB_INDEX_OUT_OF_BOUNDS
+
+
+def test_assign_vector_row_col():
+    c_vals, c_present = random_dense((10, 10), 0.4, 19)
+    u_vals, u_present = random_dense(4, 0.6, 20)
+    c_dense = np.where(c_present, c_vals, 0)
+    u_dense = np.where(u_present, u_vals, 0)
+    u = to_vector(u_vals, u_present)
+    indices = [8, 6, 4, 2]
+    # Vector assign
+    w = to_vector(c_vals[0], c_present[0])
+    info = vector.Vector_assign(w, None, None, u, [8, 2, 2], base.GxB_BACKWARDS, None)
+    assert info is GrB_Info.GrB_SUCCESS
+    expected = c_dense[0].copy()
+    expected[indices] = u_dense
+    assert_matches(w.vector, expected[None, :], expected[None, :] != 0)
+    w = to_vector(c_vals[0], c_present[0])
+    mask = to_vector(np.ones(10, dtype=np.int64), np.arange(10) < 5)
+    info = vector.Vector_assign_Scalar(w, mask, None, 7, base.GrB_ALL, None, None)
+    assert info is GrB_Info.GrB_SUCCESS
+    expected = c_dense[0].copy()
+    expected[:5] = 7
+    assert_matches(w.vector, expected[None, :], expected[None, :] != 0)
+    # Row and column assign only change one row or column
+    C = to_matrix(c_vals, c_present)
+    info = matrix.Row_assign(C, None, None, u, 5, [8, 2, 2], base.GxB_BACKWARDS, None)
+    assert info is GrB_Info.GrB_SUCCESS
+    expected = c_dense.copy()
+    expected[5, indices] = u_dense
+    assert_matches(C.matrix, expected, expected != 0)
+    C = to_matrix(c_vals, c_present)
+    info = matrix.Col_assign(C, None, None, u, indices, 4, 5, make_desc(clear_output=True))
+    assert info is GrB_Info.GrB_SUCCESS
+    expected = c_dense.copy()
+    expected[indices, 5] = u_dense
+    assert_matches(C.matrix, expected, expected != 0)
+    C = to_matrix(c_vals, c_present)
+    mask = to_vector(np.ones(4, dtype=np.int64), np.array([True, False, True, False]))
+    desc = make_desc(clear_output=True)
+    info = matrix.Row_subassign(C, mask, None, u, 5, indices, 4, desc)
+    assert info is GrB_Info.GrB_SUCCESS
+    expected = c_dense.copy()
+    expected[5, [8, 4]] = u_dense[[0, 2]]
+    expected[5, [6, 2]] = 0
+    assert_matches(C.matrix, expected, expected != 0)
+
+
+def test_function_table():
+    # Use the backend through `lib` and `ffi` the way grblas does with `grblas.init("python")`
+    lib = python_backend.lib
+    ffi = python_backend.ffi
+    assert python_backend.is_initialized()
+    A = ffi.new("GrB_Matrix*")
+    assert lib.GrB_Matrix_new(A, lib.GrB_INT64, 3, 4) is lib.GrB_SUCCESS
+    rows = ffi.from_buffer(np.array([0, 2, 0, 1], dtype=np.uint64))
+    cols = ffi.from_buffer(np.array([1, 3, 1, 0], dtype=np.uint64))
+    values = ffi.from_buffer(np.array([1, 2, 3, 4], dtype=np.int64))
+    info = lib.GrB_Matrix_build_INT64(A[0], rows, cols, values, 4, lib.GrB_PLUS_INT64)
+    assert info is lib.GrB_SUCCESS
+    n = ffi.new("GrB_Index*")
+    assert lib.GrB_Matrix_nvals(n, A[0]) is lib.GrB_SUCCESS
+    assert n[0] == 3
+    assert lib.GrB_Matrix_nrows(n, A[0]) is lib.GrB_SUCCESS
+    assert n[0] == 3
+    x = ffi.new("int64_t*")
+    assert lib.GrB_Matrix_extractElement_INT64(x, A[0], 0, 1) is lib.GrB_SUCCESS
+    assert x[0] == 4  # duplicates were combined with plus
+    assert lib.GrB_Matrix_extractElement_INT64(x, A[0], 1, 1) is lib.GrB_NO_VALUE
+    assert lib.GrB_Matrix_setElement_INT64(A[0], 7, 1, 1) is lib.GrB_SUCCESS
+    assert lib.GrB_Matrix_removeElement(A[0], 2, 3) is lib.GrB_SUCCESS
+    n[0] = 3
+    out_rows = np.empty(3, dtype=np.uint64)
+    out_cols = np.empty(3, dtype=np.uint64)
+    out_values = np.empty(3, dtype=np.int64)
+    info = lib.GrB_Matrix_extractTuples_INT64(out_rows, out_cols, out_values, n, A[0])
+    assert info is lib.GrB_SUCCESS
+    np.testing.assert_array_equal(out_rows, [0, 1, 1])
+    np.testing.assert_array_equal(out_cols, [1, 0, 1])
+    np.testing.assert_array_equal(out_values, [4, 4, 7])
+    # Errors are reported through GrB_Matrix_error
+    assert lib.GrB_Matrix_setElement_INT64(A[0], 7, 3, 0) is lib.GrB_INVALID_INDEX
+    error = ffi.new("char**")
+    assert lib.GrB_Matrix_error(error, A[0]) is lib.GrB_SUCCESS
+    assert b"out of bounds" in ffi.string(error[0])
+    # Vectors, monoids, and predefined descriptors
+    v = ffi.new("GrB_Vector*")
+    assert lib.GrB_Vector_new(v, lib.GrB_INT64, 3) is lib.GrB_SUCCESS
+    monoid = ffi.new("GrB_Monoid*")
+    identity = ffi.cast("int64_t", 0)
+    assert lib.GrB_Monoid_new_INT64(monoid, lib.GrB_PLUS_INT64, identity) is lib.GrB_SUCCESS
+    desc = lib.GrB_DESC_RT0
+    assert desc.clear_output and desc.trans0 and not desc.mask_comp
+    info = lib.GrB_Matrix_reduce_Monoid(v[0], None, None, monoid[0], A[0], lib.GrB_DESC_R)
+    assert info is lib.GrB_SUCCESS
+    expected = np.array([[4, 11, 0]])
+    assert_matches(v[0].vector, expected, expected != 0)
+    w = ffi.new("GrB_Vector*")
+    assert lib.GrB_Vector_new(w, lib.GrB_INT64, 4) is lib.GrB_SUCCESS
+    semiring = lib.GrB_PLUS_TIMES_SEMIRING_INT64
+    assert lib.GrB_vxm(w[0], None, None, semiring, v[0], A[0], None) is lib.GrB_SUCCESS
+    expected = np.array([[44, 93, 0, 0]])
+    assert_matches(w[0].vector, expected, expected != 0)
+    assert lib.GrB_Matrix_free(A) is lib.GrB_SUCCESS
+    assert A[0] is None
+
+
+def test_grblas_init_python():
+    # grblas can only be initialized once per process
+    code = textwrap.dedent(
+        """
+        import numpy as np
+        import grblas as gb
+
+        gb.init("python")
+        A = gb.Matrix.from_values([0, 1, 1], [1, 0, 2], [1, 2, 3], nrows=2, ncols=3)
+        C = A.mxm(A.T).new()
+        rows, cols, values = C.to_values()
+        np.testing.assert_array_equal(rows, [0, 1])
+        np.testing.assert_array_equal(cols, [0, 1])
+        np.testing.assert_array_equal(values, [1, 13])
+        v = A.reduce_rowwise(gb.monoid.max).new()
+        np.testing.assert_array_equal(v.to_values()[1], [1, 3])
+        assert C.reduce_scalar().new().value == 14
+        assert A.reduce_columnwise().new().reduce().new().value == 6
+        assert (A @ A.T).new().isequal(C)
+        D = A.mxm(A.T, gb.semiring.any_pair).new()
+        np.testing.assert_array_equal(D.to_values()[2], [1, 1])
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_grblas_init_python_without_suitesparse():
+    code = textwrap.dedent(
+        """
+        import sys
+
+        sys.modules["suitesparse_graphblas"] = None  # Make importing it fail
+        import grblas as gb
+
+        gb.init("python")
+        A = gb.Matrix.from_values([0, 1, 1], [1, 0, 2], [1, 2, 3], nrows=2, ncols=3)
+        assert A.mxm(A.T).new().nvals == 2
+        assert "suitesparse_graphblas.utils" not in sys.modules
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_grblas_python_backend_api():
+    code = textwrap.dedent(
+        """
+        import pytest
+
+        import grblas as gb
+
+        gb.init("python")
+        A = gb.Matrix.from_values([0, 1, 1], [1, 0, 2], [1, 2, 3], nrows=2, ncols=3)
+        v = gb.Vector.from_values([0, 2], [1, 2])
+        # Extract elements
+        assert A[0, 1].value == 1
+        assert A[1, 1].new().is_empty
+        assert v[2].value == 2
+        # Inner and outer products use a Vector as a Matrix
+        assert v.inner(v).new().value == 5
+        assert (v @ v).new().value == 5
+        assert v.outer(v).new().nvals == 4
+        # repr uses the format, which is always csr or sparse
+        assert "csr" in repr(A)
+        assert "sparse" in repr(v)
+        assert A.ss.format == "csr"
+        assert (A == A).new().reduce_scalar(gb.monoid.land).new().value
+        # Aggregators
+        assert A.reduce_rowwise(gb.agg.count).new().isequal(gb.Vector.from_values([0, 1], [1, 2]))
+        assert v.reduce(gb.agg.count).new().value == 2
+        assert v.reduce(gb.agg.mean).new().value == 1.5
+        with pytest.raises(NotImplementedError, match="python"):
+            v.reduce(gb.agg.count_nonzero).new()
+        # Functions the python backend doesn't have give a clear error
+        with pytest.raises(AttributeError, match="not supported by the python backend"):
+            gb.lib.GxB_Matrix_select
+        assert not hasattr(gb.ffi, "callback")
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
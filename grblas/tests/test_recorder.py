@@ -1,7 +1,14 @@
+import json
+
 import grblas as gb
 from grblas.exceptions import OutOfMemory
 from grblas.formatting import CSS_STYLE
 
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
 
 def test_recorder():
     A = gb.Matrix.from_values([0, 1], [1, 1], [1, 2], name="A")
@@ -152,3 +159,39 @@ def test_record_failed_call():
     except OutOfMemory:
         pass
     assert "ERROR: OutOfMemory" in rec.data[-1]
+
+
+def test_record_instrument(tmp_path):
+    A = gb.Matrix.from_values([0, 1], [1, 1], [1, 2], name="A")
+    B = gb.Matrix.from_values([0, 1], [0, 1], [3, 4], name="B")
+    with gb.Recorder(instrument=True) as rec:
+        C = A.mxm(B).new(name="C")
+    assert len(rec.calls) == len(rec.data) == 2
+    info = rec.calls[1]
+    assert info.cfunc_name == "GrB_mxm"
+    assert info.text == rec.data[1]
+    assert info.duration > 0
+    assert info.error is None
+    assert [x.name for x in info.before] == ["C", "A", "B"]
+    assert [x.nvals for x in info.before] == [0, 2, 2]
+    assert [x.nvals for x in info.after] == [C.nvals, 2, 2]
+    assert info.after[1].format == A.ss.format
+    assert info.nbytes_delta == info.after[0].nbytes - info.before[0].nbytes
+    assert "GrB_mxm" in repr(info)
+
+    trace = rec.to_chrome_trace(tmp_path / "trace.json")
+    assert [event["name"] for event in trace["traceEvents"]] == ["GrB_Matrix_new", "GrB_mxm"]
+    assert trace["traceEvents"][1]["args"]["C (after)"]["nvals"] == C.nvals
+    with open(tmp_path / "trace.json") as f:
+        assert json.load(f) == trace
+    profile = rec.to_speedscope()
+    assert profile["shared"]["frames"] == [{"name": "GrB_Matrix_new"}, {"name": "GrB_mxm"}]
+    assert [event["type"] for event in profile["profiles"][0]["events"]] == ["O", "C", "O", "C"]
+
+    if pd is not None:
+        summary = rec.summary()
+        assert set(summary.index) == {"GrB_Matrix_new", "GrB_mxm"}
+        assert summary["count"].tolist() == [1, 1]
+    rec.clear()
+    assert rec.calls == []
+    assert not gb.Recorder(start=False).instrument
@@ -2,7 +2,8 @@ import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
 
-from grblas import Matrix, Vector
+from grblas import Matrix, Recorder, Vector, ss
+from grblas.exceptions import DimensionMismatch
 
 
 @pytest.mark.parametrize("do_iso", [False, True])
@@ -166,3 +167,124 @@ def test_matrix_head(do_iso):
             assert_array_equal(vals, values4[:2])
             assert rows.dtype == cols.dtype == np.uint64
             assert vals.dtype == expected_dtype
+
+
+def test_tiled_matrix(tmp_path):
+    from grblas import monoid, semiring
+    from grblas.ss import TiledMatrix
+
+    A = Matrix.from_values(
+        [0, 0, 1, 2, 3, 4, 4], [1, 4, 2, 0, 3, 0, 4], [1, 2, 3, 4, 5, 6, 7], nrows=5, ncols=6
+    )
+    T = TiledMatrix.from_matrix(A, tmp_path / "A", (2, [3, None]))
+    assert T.shape == (5, 6)
+    assert T.ntiles == (3, 2)
+    assert T.chunks == [[2, 2, 1], [3, 3]]
+    assert T.nvals == A.nvals
+    assert T.to_matrix().isequal(A, check_dtype=True)
+    # Reopen from disk
+    T = TiledMatrix(tmp_path / "A")
+    assert T.tile(0, 1).isequal(A[0:2, 3:6].new())
+    assert T.to_matrix().isequal(A, check_dtype=True)
+
+    v = Vector.from_values([0, 2, 4, 5], [1, 2, 3, 4])
+    assert T.mxv(v).isequal(A.mxv(v).new())
+    assert T.mxv(v, semiring.min_plus).isequal(A.mxv(v, semiring.min_plus).new())
+    w = Vector.from_values([0, 3, 4], [10, 20, 30])
+    assert T.vxm(w).isequal(w.vxm(A).new())
+    assert T.reduce_rowwise().isequal(A.reduce_rowwise().new())
+    assert T.reduce_columnwise(monoid.max).isequal(A.reduce_columnwise(monoid.max).new())
+    assert T.reduce_scalar().value == A.reduce_scalar().new().value
+    with pytest.raises(DimensionMismatch, match="Size mismatch"):
+        T.mxv(w)
+
+    B = TiledMatrix.create(tmp_path / "B", float, 4, 4, 2)
+    assert B.reduce_scalar().is_empty
+    B.write_tile(1, 0, Matrix.from_values([1], [1], [2.5], nrows=2, ncols=2))
+    with pytest.raises(ValueError, match="must have shape"):
+        B.write_tile(0, 0, A)
+    with pytest.raises(FileExistsError):
+        TiledMatrix.create(tmp_path / "B", float, 4, 4, 2)
+    assert (
+        TiledMatrix(tmp_path / "B")
+        .to_matrix()
+        .isequal(Matrix.from_values([3], [1], [2.5], nrows=4, ncols=4), check_dtype=True)
+    )
+
+
+def test_parse_burble():
+    text = (
+        " [ GrB_mxm C=A*B, saxpy (S = S*S, anz: 2 bnz: 2) sort (hash [S]) 2.1e-05 sec ]\n"
+        "hello\n"
+        " [ GrB_Matrix_nvals ]\n"
+    )
+    records = ss.parse_burble(text, "GrB_mxm(C, NULL, NULL, semiring, A, B, NULL);")
+    assert len(records) == 2
+    rec = records[0]
+    assert rec.function == "GrB_mxm"
+    assert rec.seconds == 2.1e-05
+    assert rec.text == "GrB_mxm C=A*B, saxpy (S = S*S, anz: 2 bnz: 2) sort (hash [S])"
+    assert rec.call.startswith("GrB_mxm(")
+    assert records[1] == (
+        "GrB_mxm(C, NULL, NULL, semiring, A, B, NULL);",
+        "GrB_Matrix_nvals",
+        None,
+        "GrB_Matrix_nvals",
+    )
+
+
+def test_burble(capsys):
+    A = Matrix.from_values([0, 1], [1, 1], [1, 2], name="A")
+    B = Matrix.from_values([0, 1], [0, 1], [3, 4], name="B")
+    with Recorder(instrument=True) as rec:
+        with ss.burble() as b:
+            print("not burble")
+            C = A.mxm(B).new(name="C")
+        assert b.recorder is rec
+        assert rec._burble is None
+    assert "not burble" in capsys.readouterr().out
+    assert any(record.function == "GrB_mxm" for record in b.records)
+    assert all(record.call in rec.data for record in b.records if record.call is not None)
+    mxm_info = [info for info in rec.calls if info.cfunc_name == "GrB_mxm"][0]
+    assert any(record.function == "GrB_mxm" for record in mxm_info.burble)
+    assert "records" in repr(b)
+    # A Recorder is created if none is active
+    with ss.burble() as b:
+        C << A.mxm(B)
+    assert not b.recorder.is_recording
+    assert len(b.recorder.data) > 0
+
+
+def test_memory_report():
+    A = Matrix.from_values([0, 1], [1, 1], [1, 2], name="A")  # not tracked
+    with pytest.raises(RuntimeError, match="not enabled"):
+        ss.memory_report()
+    ss.enable_memory_tracking()
+    try:
+        B = Matrix.from_values([0, 1, 2], [0, 1, 2], [1, 2, 3], name="B")
+        v = Vector.from_values(np.arange(100), 1.5, name="v")
+        C = A.mxm(A).new(name="C")
+        report = ss.memory_report(n=2)
+        assert report.nobjects == 3
+        assert report.nbytes == B.ss.nbytes + v.ss.nbytes + C.ss.nbytes
+        assert report.by_type == {
+            "Matrix": (2, B.ss.nbytes + C.ss.nbytes),
+            "Vector": (1, v.ss.nbytes),
+        }
+        assert len(report.top) == 2
+        assert report.top[0].nbytes >= report.top[1].nbytes
+        assert {x.name for x in report.top} <= {"B", "v", "C"}
+        usage = {x.name: x for x in ss.memory_report().top}
+        assert usage["v"] == ("v", "Vector", (100,), 100, v.ss.nbytes)
+        assert usage["C"].shape == (2, 2)
+        assert "total:" in repr(report)
+        assert report.sampled_peak_nbytes >= report.nbytes
+        peak = report.sampled_peak_nbytes
+        del B, v, C
+        report = ss.memory_report()
+        assert report.nobjects == 0
+        assert report.nbytes == 0
+        assert report.sampled_peak_nbytes == peak
+        assert report.peak_nobjects >= 3
+    finally:
+        ss.disable_memory_tracking()
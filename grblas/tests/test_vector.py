@@ -1154,6 +1154,26 @@ def test_inner(v):
     assert expected.isequal(v.inner(v).new())
     assert expected.isequal((v @ v).new())
 
+    s = Scalar.new(v.dtype)
+    s << v.inner(v)
+    assert s.isequal(expected)
+    s(accum=binary.plus) << v.inner(v)
+    assert s.value == 2 * expected.value
+    s << v.inner(Vector.new(v.dtype, v.size))  # no overlap
+    assert s.is_empty
+    s(accum=binary.plus) << v.inner(v)
+    assert s.isequal(expected)
+    # The output Vector of size 1 is reused
+    s = Scalar.new(v.dtype, name="s_inner")
+    s << v.inner(v)
+    with grblas.Recorder() as rec:
+        s << v.inner(v)
+    assert s.isequal(expected)
+    assert len(rec.data) == 2
+    assert rec.data[0].startswith("GrB_vxm(")
+    assert rec.data[1].startswith("GrB_Vector_extractElement_INT64(&s_inner, ")
+    assert not any("GrB_Vector_new" in line for line in rec.data)
+
 
 def test_outer(v):
     R = Matrix.new(v.dtype, nrows=1, ncols=v.size)  # row vector
@@ -686,6 +686,21 @@ class Vector(BaseType):
         idx = resolved_indexes.indices[0]
         call("GrB_Vector_removeElement", [self, idx.index])
 
+    def to_pandas(self, format="coo", *, fill_value=None):
+        """Convert to a pandas Series without densifying.
+
+        "coo" format (the default) returns a Series of the values indexed by position.
+        "sparse" format returns a Series of size ``self.size`` backed by a
+        ``pd.arrays.SparseArray`` with the given `fill_value`.
+
+        See Also
+        --------
+        grblas.io.to_pandas
+        """
+        from .io import to_pandas
+
+        return to_pandas(self, format, fill_value=fill_value)
+
     def to_pygraphblas(self):  # pragma: no cover
         """Convert to a new `pygraphblas.Vector`
 
@@ -814,6 +829,7 @@ class VectorExpression(BaseExpression):
     outer = wrapdoc(Vector.outer)(property(_automethods.outer))
     reduce = wrapdoc(Vector.reduce)(property(_automethods.reduce))
     ss = wrapdoc(Vector.ss)(property(_automethods.ss))
+    to_pandas = wrapdoc(Vector.to_pandas)(property(_automethods.to_pandas))
     to_pygraphblas = wrapdoc(Vector.to_pygraphblas)(property(_automethods.to_pygraphblas))
     to_values = wrapdoc(Vector.to_values)(property(_automethods.to_values))
     vxm = wrapdoc(Vector.vxm)(property(_automethods.vxm))
@@ -6,6 +6,7 @@ extras_require = {
     "repr": ["pandas"],
     "io": ["networkx", "scipy"],
     "viz": ["matplotlib"],
+    "dask": ["dask"],
 }
 extras_require["complete"] = sorted({v for req in extras_require.values() for v in req})
 
@@ -22,7 +23,7 @@ setup(
     author="Jim Kitchen and Erik Welch",
     author_email="erik.n.welch@gmail.com,jim22k@gmail.com",
     url="https://github.com/metagraph-dev/grblas",
-    packages=find_packages(exclude=["grblas.backends.python"]),
+    packages=find_packages(),
     setup_requires=["pytest-runner"],
     python_requires=">=3.7",
     install_requires=["suitesparse-graphblas >=5.1.3, <5.2", "numba", "donfig", "pyyaml"],